@@ -0,0 +1,76 @@
+import argparse
+import gc
+import sys
+import tracemalloc
+
+from benchmarks.parser_benchmark import count_nodes, source_generators, tokenize
+from lexer.token_buffer_class import TokenBuffer, TokenBufferReader
+from parser.flat_ast_class import FlatAst
+from parser.parser_class import Parser
+from program.program_class import Program
+from utils.error_handler_class import ErrorHandler
+
+
+def measure_program_memory(
+    token_buffer: TokenBuffer, hash_consing: bool = False
+) -> tuple[Program, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        program = Parser(
+            TokenBufferReader(token_buffer, ErrorHandler()), hash_consing
+        ).parse()
+        gc.collect()
+        return program, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def measure_flat_ast_memory(program: Program) -> tuple[FlatAst, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        flat_ast = FlatAst.from_program(program)
+        gc.collect()
+        return flat_ast, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def parse_arguments(arguments: list[str]) -> argparse.Namespace:
+    argument_parser = argparse.ArgumentParser(description="JP AST memory benchmark")
+    argument_parser.add_argument("--size", type=int, default=1_000_000)
+    argument_parser.add_argument(
+        "--profile", choices=source_generators.keys(), default="statements"
+    )
+    return argument_parser.parse_args(arguments)
+
+
+def main(arguments: list[str] | None = None):
+    arguments = parse_arguments(sys.argv[1:] if arguments is None else arguments)
+    source = source_generators[arguments.profile](arguments.size)
+    token_buffer = tokenize(source, ErrorHandler())
+    program, program_bytes = measure_program_memory(token_buffer)
+    node_count = count_nodes(program)
+    line_count = len(token_buffer.line_index)
+    print(f"profile: {arguments.profile}")
+    print(f"lines: {line_count}")
+    print(f"nodes: {node_count}")
+    print(f"program bytes: {program_bytes}")
+    print(f"bytes/node: {program_bytes / node_count:.1f}")
+    print(f"bytes/line: {program_bytes / line_count:.1f}")
+    flat_ast, flat_ast_bytes = measure_flat_ast_memory(program)
+    print(f"flat ast nodes: {len(flat_ast)}")
+    print(f"flat ast bytes: {flat_ast_bytes}")
+    print(f"flat ast bytes/line: {flat_ast_bytes / line_count:.1f}")
+    del program, flat_ast
+    shared_program, shared_program_bytes = measure_program_memory(token_buffer, True)
+    print(f"hash-consed nodes: {count_nodes(shared_program)}")
+    print(f"hash-consed bytes: {shared_program_bytes}")
+    print(f"hash-consed bytes/line: {shared_program_bytes / line_count:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+import argparse
+import io
+import json
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from lexer.lexer_class import Lexer
+from lexer.regex_lexer_class import RegexLexer
+from lexer.token_type_enum import TokenType
+from utils.error_handler_class import ErrorHandler
+
+CODE_EXAMPLES_DIR = Path(__file__).parents[2] / "code_examples"
+BASELINE_PATH = Path(__file__).parent / "lexer_baseline.json"
+DEFAULT_SOURCE_SIZE = 5_000_000
+DEFAULT_SUITE_SOURCE_SIZE = 500_000
+STATEMENTS_PER_FUNCTION = 20
+
+lexer_engines: dict[str, type[Lexer]] = {
+    "stream": Lexer,
+    "regex": RegexLexer,
+}
+
+words = ["alpha", "beta", "gamma", "delta", "counter", "index", "value", "result"]
+
+
+def generate_source(size: int = DEFAULT_SOURCE_SIZE) -> str:
+    unit = "".join(
+        example.read_text() + "\n" for example in sorted(CODE_EXAMPLES_DIR.glob("*.jp"))
+    )
+    return unit * max(1, size // len(unit))
+
+
+def generate_identifier_statement(generator: random.Random) -> str:
+    names = [
+        "_".join(generator.choices(words, k=generator.randint(1, 3))) for _ in range(4)
+    ]
+    return f"{names[0]} = {names[1]}.{names[2]}({names[3]});"
+
+
+def generate_number_statement(generator: random.Random) -> str:
+    numbers = [str(generator.randint(0, 10**9)) for _ in range(3)]
+    fraction = f"{generator.randint(0, 999)}.{generator.randint(0, 10**6)}"
+    return f"x = {numbers[0]} + {fraction} * {numbers[1]} - {numbers[2]};"
+
+
+def generate_string_statement(generator: random.Random) -> str:
+    text = " ".join(generator.choices(words, k=generator.randint(4, 16)))
+    return f'print("{text}\\t", "{generator.choice(words)}\\n");'
+
+
+def generate_comment_statement(generator: random.Random) -> str:
+    return "# " + " ".join(generator.choices(words, k=generator.randint(4, 16)))
+
+
+statement_generators: dict[str, Callable[[random.Random], str]] = {
+    "identifier": generate_identifier_statement,
+    "number": generate_number_statement,
+    "string": generate_string_statement,
+    "comment": generate_comment_statement,
+}
+
+source_profiles: dict[str, dict] = {
+    "mixed_lf": {"weights": {"identifier": 4, "number": 2, "string": 2, "comment": 1}},
+    "mixed_crlf": {
+        "weights": {"identifier": 4, "number": 2, "string": 2, "comment": 1},
+        "end_of_line": "\r\n",
+    },
+    "identifier_heavy": {"weights": {"identifier": 1}},
+    "number_heavy": {"weights": {"number": 1}},
+    "string_heavy": {"weights": {"string": 1}},
+    "comment_heavy": {"weights": {"comment": 1}},
+}
+
+
+def generate_synthetic_source(
+    size: int,
+    weights: dict[str, float],
+    end_of_line: str = "\n",
+    seed: int = 0,
+) -> str:
+    generator = random.Random(seed)
+    kinds = list(weights)
+    lines = []
+    length = 0
+    function_index = 0
+    while length < size:
+        lines.append(f"function_{function_index}() {{")
+        for kind in generator.choices(
+            kinds, weights=list(weights.values()), k=STATEMENTS_PER_FUNCTION
+        ):
+            lines.append("    " + statement_generators[kind](generator))
+            length += len(lines[-1]) + len(end_of_line)
+        lines.append("}")
+        function_index += 1
+    return end_of_line.join(lines) + end_of_line
+
+
+def count_tokens(stream_provider: io.TextIOBase, lexer_class: type[Lexer]) -> int:
+    lexer = lexer_class(stream_provider, ErrorHandler())
+    token_count = 0
+    while lexer.build_next_token().type != TokenType.T_EOF:
+        token_count += 1
+    return token_count
+
+
+def run_benchmark(source: str, lexer_class: type[Lexer]) -> tuple[int, float]:
+    with io.StringIO(source) as stream_provider:
+        start = time.perf_counter()
+        token_count = count_tokens(stream_provider, lexer_class)
+        elapsed = time.perf_counter() - start
+    return token_count, elapsed
+
+
+def measure_peak_memory(source: str, lexer_class: type[Lexer]) -> int:
+    with io.StringIO(source) as stream_provider:
+        tracemalloc.start()
+        try:
+            count_tokens(stream_provider, lexer_class)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+
+def run_case(
+    profile: str, source: str, engine: str, repeat: int
+) -> dict[str, str | int | float]:
+    lexer_class = lexer_engines[engine]
+    timings = []
+    for _ in range(repeat):
+        token_count, elapsed = run_benchmark(source, lexer_class)
+        timings.append(elapsed)
+    elapsed = min(timings)
+    return {
+        "profile": profile,
+        "engine": engine,
+        "chars": len(source),
+        "tokens": token_count,
+        "seconds": round(elapsed, 6),
+        "tokens_per_second": round(token_count / elapsed),
+        "chars_per_second": round(len(source) / elapsed),
+        "peak_memory_bytes": measure_peak_memory(source, lexer_class),
+    }
+
+
+def run_suite(
+    size: int, profiles: list[str], engines: list[str], repeat: int
+) -> list[dict[str, str | int | float]]:
+    results = []
+    for profile in profiles:
+        source = generate_synthetic_source(size, **source_profiles[profile])
+        for engine in engines:
+            results.append(run_case(profile, source, engine, repeat))
+    return results
+
+
+def compare_with_baseline(
+    results: list[dict[str, str | int | float]],
+    baseline: list[dict[str, str | int | float]],
+) -> list[dict[str, str | float]]:
+    baseline_by_case = {
+        (result["profile"], result["engine"]): result for result in baseline
+    }
+    comparison = []
+    for result in results:
+        previous = baseline_by_case.get((result["profile"], result["engine"]))
+        if previous is None or previous["chars"] != result["chars"]:
+            continue
+        comparison.append(
+            {
+                "profile": result["profile"],
+                "engine": result["engine"],
+                "tokens_per_second_ratio": round(
+                    result["tokens_per_second"] / previous["tokens_per_second"], 3
+                ),
+                "peak_memory_ratio": round(
+                    result["peak_memory_bytes"] / previous["peak_memory_bytes"], 3
+                ),
+            }
+        )
+    return comparison
+
+
+def parse_arguments(arguments: list[str]) -> argparse.Namespace:
+    argument_parser = argparse.ArgumentParser(description="JP lexer benchmark")
+    argument_parser.add_argument("--size", type=int, default=DEFAULT_SUITE_SOURCE_SIZE)
+    argument_parser.add_argument(
+        "--profile",
+        action="append",
+        choices=source_profiles.keys(),
+        dest="profiles",
+    )
+    argument_parser.add_argument(
+        "--engine", action="append", choices=lexer_engines.keys(), dest="engines"
+    )
+    argument_parser.add_argument("--repeat", type=int, default=3)
+    argument_parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    argument_parser.add_argument("--save-baseline", action="store_true")
+    return argument_parser.parse_args(arguments)
+
+
+def main(arguments: list[str] | None = None):
+    arguments = parse_arguments(sys.argv[1:] if arguments is None else arguments)
+    results = run_suite(
+        arguments.size,
+        arguments.profiles or list(source_profiles),
+        arguments.engines or list(lexer_engines),
+        arguments.repeat,
+    )
+    report = {"results": results}
+    if arguments.save_baseline:
+        arguments.baseline.write_text(json.dumps(results, indent=2) + "\n")
+    elif arguments.baseline.exists():
+        baseline = json.loads(arguments.baseline.read_text())
+        report["baseline_comparison"] = compare_with_baseline(results, baseline)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+import argparse
+import io
+import random
+import re
+import sys
+import time
+from collections.abc import Callable
+from functools import partial
+
+from benchmarks.lexer_benchmark import (
+    CODE_EXAMPLES_DIR,
+    DEFAULT_SOURCE_SIZE,
+    generate_synthetic_source,
+    source_profiles,
+)
+from lexer.regex_lexer_class import RegexLexer
+from lexer.token_buffer_class import TokenBuffer, TokenBufferReader
+from parser import statement_classes
+from parser.parser_class import Parser
+from parser.rule_profiler_class import RuleProfiler
+from parser.table_parser_class import TableParser
+from program.program_class import Program
+from utils.error_handler_class import ErrorHandler
+
+STATEMENTS_PER_FUNCTION = 20
+
+function_definition_pattern = re.compile(r"^(\w+)\s*\(", re.MULTILINE)
+
+parser_engines: dict[str, Callable[[TokenBufferReader], Parser | TableParser]] = {
+    "descent": Parser,
+    "lazy": partial(Parser, lazy_bodies=True),
+    "table": TableParser,
+}
+
+statement_templates: list[str] = [
+    "if (x < {n}) {{ y = {n}; }} elif (x == {n}) {{ y += 1; }} else {{ y = null; }}",
+    "while (i < {n}) {{ i += 1; continue; }}",
+    "for (item : items) {{ print(item); break; }}",
+    "try {{ risky({n}); }} catch (ArgumentError | TypeError e) {{ print(e); }}",
+    'throw ValueError("bad value", {n});',
+    "return x;",
+    "x = y;",
+    "call(a, @b, {n});",
+    "object.method({n}).field = value;",
+]
+
+
+def generate_example_source(size: int) -> str:
+    examples = [path.read_text() for path in sorted(CODE_EXAMPLES_DIR.glob("*.jp"))]
+    unit_size = sum(len(example) + 1 for example in examples)
+    copies = []
+    for copy_index in range(max(1, size // unit_size)):
+        for example_index, example in enumerate(examples):
+            names = "|".join(function_definition_pattern.findall(example))
+            copies.append(
+                re.sub(
+                    rf"(?<![.\w])({names})(?=\s*\()",
+                    rf"\1_{copy_index}_{example_index}",
+                    example,
+                )
+            )
+    return "\n".join(copies) + "\n"
+
+
+def generate_statement_source(size: int, seed: int = 0) -> str:
+    generator = random.Random(seed)
+    lines = []
+    length = 0
+    function_index = 0
+    while length < size:
+        lines.append(f"function_{function_index}(x, y?, z? = {function_index}) {{")
+        for template in generator.choices(
+            statement_templates, k=STATEMENTS_PER_FUNCTION
+        ):
+            lines.append("    " + template.format(n=generator.randint(0, 1000)))
+            length += len(lines[-1]) + 1
+        lines.append("}")
+        function_index += 1
+    return "\n".join(lines) + "\n"
+
+
+def generate_expression_source(size: int, seed: int = 0) -> str:
+    return generate_synthetic_source(
+        size, source_profiles["mixed_lf"]["weights"], seed=seed
+    )
+
+
+source_generators: dict[str, Callable[[int], str]] = {
+    "examples": generate_example_source,
+    "statements": generate_statement_source,
+    "expressions": generate_expression_source,
+}
+
+
+def tokenize(source: str, error_handler: ErrorHandler) -> TokenBuffer:
+    with io.StringIO(source) as stream_provider:
+        return RegexLexer(stream_provider, error_handler).tokenize_all()
+
+
+def is_ast_node(value: any) -> bool:
+    return type(value).__module__ == statement_classes.__name__
+
+
+def get_node_fields(node: any) -> list[any]:
+    return [
+        getattr(node, field)
+        for cls in type(node).__mro__
+        for field in getattr(cls, "__slots__", ())
+        if hasattr(node, field)
+    ] + list(getattr(node, "__dict__", {}).values())
+
+
+def count_nodes(program: Program) -> int:
+    seen = set()
+    stack = [
+        function for function in program.functions.values() if is_ast_node(function)
+    ]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, list):
+            stack.extend(value)
+        elif is_ast_node(value) and id(value) not in seen:
+            seen.add(id(value))
+            stack.extend(get_node_fields(value))
+    return len(seen)
+
+
+def run_benchmark(
+    token_buffer: TokenBuffer,
+    repeat: int = 5,
+    parser_class: Callable[[TokenBufferReader], Parser | TableParser] = Parser,
+) -> float:
+    timings = []
+    for _ in range(repeat):
+        parser = parser_class(TokenBufferReader(token_buffer, ErrorHandler()))
+        start = time.perf_counter()
+        parser.parse()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def parse_tokens(
+    token_buffer: TokenBuffer,
+    rule_profiler: RuleProfiler | None = None,
+    error_handler: ErrorHandler | None = None,
+) -> Program:
+    return Parser(
+        TokenBufferReader(token_buffer, error_handler or ErrorHandler()),
+        rule_profiler=rule_profiler,
+    ).parse()
+
+
+def print_rule_stats(rule_profiler: RuleProfiler) -> None:
+    print(f"{'rule':<45} {'calls':>10} {'cumulative s':>12}")
+    for rule, calls, elapsed in rule_profiler.get_rule_stats():
+        print(f"{rule:<45} {calls:>10} {elapsed:>12.3f}")
+
+
+def parse_arguments(arguments: list[str]) -> argparse.Namespace:
+    argument_parser = argparse.ArgumentParser(description="JP parser benchmark")
+    argument_parser.add_argument("--size", type=int, default=DEFAULT_SOURCE_SIZE // 5)
+    argument_parser.add_argument(
+        "--profile", choices=source_generators.keys(), default="examples"
+    )
+    argument_parser.add_argument(
+        "--engine", choices=parser_engines.keys(), default="descent"
+    )
+    argument_parser.add_argument("--repeat", type=int, default=5)
+    argument_parser.add_argument("--rules", action="store_true")
+    return argument_parser.parse_args(arguments)
+
+
+def main(arguments: list[str] | None = None):
+    arguments = parse_arguments(sys.argv[1:] if arguments is None else arguments)
+    error_handler = ErrorHandler()
+    token_buffer = tokenize(
+        source_generators[arguments.profile](arguments.size), error_handler
+    )
+    node_count = count_nodes(parse_tokens(token_buffer, error_handler=error_handler))
+    if error_handler.has_errors():
+        sys.exit(
+            f"Benchmark source has {len(error_handler.errors)} errors, first: "
+            f"{error_handler.errors[0]}"
+        )
+    elapsed = run_benchmark(
+        token_buffer, arguments.repeat, parser_engines[arguments.engine]
+    )
+    print(f"profile: {arguments.profile}")
+    print(f"engine: {arguments.engine}")
+    print(f"tokens: {len(token_buffer)}")
+    print(f"nodes: {node_count}")
+    print(f"time: {elapsed:.3f} s")
+    print(f"tokens/sec: {len(token_buffer) / elapsed:,.0f}")
+    print(f"nodes/sec: {node_count / elapsed:,.0f}")
+    if arguments.rules:
+        rule_profiler = RuleProfiler()
+        parse_tokens(token_buffer, rule_profiler)
+        print_rule_stats(rule_profiler)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from interpreter.closure_interpreter_class import (
+    assignment_operations,
+    infix_operations,
+    leaf_classes,
+)
+from interpreter.code_object_class import CodeObject
+from interpreter.opcode_enum import Opcode
+from parser.statement_classes import *
+from program.program_class import Program
+
+binary_operations: list[tuple[Callable, str, str | None]] = list(
+    infix_operations.values()
+)
+binary_operation_indexes: dict[type, int] = {
+    node_class: index for index, node_class in enumerate(infix_operations)
+}
+
+compound_assignments: list[tuple[Callable, str, bool]] = list(
+    assignment_operations.values()
+)
+compound_assignment_indexes: dict[type, int] = {
+    node_class: index for index, node_class in enumerate(assignment_operations)
+}
+
+
+class BytecodeCompiler:
+    def __init__(self, program: Program) -> None:
+        self.program: Program = program
+        self.code: CodeObject | None = None
+        self.is_leftmost_leaf_pending: bool = False
+        self.is_caller_environment: bool = False
+
+        self.compilers: dict[type, Callable[[any], None]] = {
+            BlockStatement: self.__compile_block_statement,
+            IfStatement: self.__compile_if_statement,
+            WhileStatement: self.__compile_while_statement,
+            ForStatement: self.__compile_for_statement,
+            ReturnStatement: self.__compile_return_statement,
+            AssignmentStatement: self.__compile_assignment_statement,
+            TryCatchStatement: self.__compile_try_catch_statement,
+            ThrowStatement: self.__compile_throw_statement,
+            BreakStatement: self.__compile_break_statement,
+            ContinueStatement: self.__compile_continue_statement,
+            BitwiseNegationExpression: self.__compile_bitwise_negation_expression,
+            NumericNegationExpression: self.__compile_numeric_negation_expression,
+            TypeCheckExpression: self.__compile_type_check_expression,
+            IdentifierExpression: self.__compile_identifier_expression,
+            FunctionCallExpression: self.__compile_function_call_expression,
+            PropertyAccessExpression: self.__compile_property_access_expression,
+            OptionalPropertyAccessExpression: (
+                self.__compile_optional_property_access_expression
+            ),
+            Argument: self.__compile_argument,
+        }
+        for node_class in infix_operations:
+            self.compilers[node_class] = self.__compile_infix_expression
+        for node_class in assignment_operations:
+            self.compilers[node_class] = self.__compile_arithmetic_assignment
+        for node_class in [
+            NullLiteral,
+            IntegerLiteral,
+            FloatLiteral,
+            StringLiteral,
+            BooleanLiteral,
+            FalseLiteral,
+            TrueLiteral,
+        ]:
+            self.compilers[node_class] = self.__compile_literal
+
+    ############################## UTILS ##############################
+
+    def __emit(
+        self, opcode: Opcode, operand: int = 0, offset: int | None = None
+    ) -> int:
+        index = len(self.code.instructions)
+        self.code.instructions += [opcode.value, operand]
+        self.code.positions.append(self.program.line_index.get_position(offset))
+        return index
+
+    def __emit_constant(
+        self, opcode: Opcode, value: any, offset: int | None = None
+    ) -> int:
+        return self.__emit(opcode, self.code.add_constant(value), offset)
+
+    def __patch_jump(self, index: int) -> None:
+        self.code.instructions[index + 1] = len(self.code.instructions)
+
+    def __compile(self, node: any) -> None:
+        if self.is_leftmost_leaf_pending and isinstance(node, leaf_classes):
+            self.is_leftmost_leaf_pending = False
+            self.__compile_pending_result_leaf(node)
+            return
+        self.compilers[type(node)](node)
+
+    def __compile_pending_result_leaf(self, node: any) -> None:
+        if isinstance(node, IdentifierExpression):
+            self.__emit(
+                Opcode.LOAD_PENDING_VARIABLE,
+                self.code.add_variable(node.name),
+                node.offset,
+            )
+        elif isinstance(node, FunctionCallExpression):
+            self.__compile_method_call(node)
+        else:
+            self.__emit(Opcode.POP)
+            self.__compile(node)
+
+    ############################## FUNCTIONS ##############################
+
+    def compile_function(self, node: FunctionDef) -> CodeObject:
+        position = self.program.line_index.get_position(node.offset)
+        code = CodeObject(node.name, position)
+        for parameter in node.parameters:
+            default_code = None
+            if parameter.is_optional:
+                default_code = self.__compile_default(node.name, parameter)
+            code.parameters.append(
+                (code.add_variable(parameter.name), parameter.is_optional, default_code)
+            )
+        self.code = code
+        self.__compile_block_statement(node.block)
+        self.__emit(Opcode.RETURN_VALUE)
+        self.code = None
+        return code
+
+    def __compile_default(self, name: str, parameter: Parameter) -> CodeObject:
+        self.code = CodeObject(f"{name}.{parameter.name}")
+        self.is_caller_environment = True
+        self.__compile(parameter.value)
+        self.is_caller_environment = False
+        self.__emit(Opcode.RETURN_EXPRESSION)
+        return self.code
+
+    ############################## STATEMENTS ##############################
+
+    def __compile_block_statement(
+        self, node: BlockStatement, bound_slot: int | None = None
+    ) -> None:
+        self.__emit(Opcode.ENTER_SCOPE)
+        if bound_slot is not None:
+            self.__emit(Opcode.BIND_VARIABLE, bound_slot)
+        exits = []
+        for statement in node.statements:
+            self.__compile(statement)
+            exits.append(self.__emit(Opcode.POP_OR_JUMP_IF_EXITING))
+        self.__emit(Opcode.LOAD_NONE)
+        for index in exits:
+            self.__patch_jump(index)
+        self.__emit(Opcode.EXIT_SCOPE)
+
+    def __compile_if_statement(self, node: IfStatement) -> None:
+        ends = []
+        for conditional in [node, *node.elif_statements]:
+            self.__compile(conditional.condition)
+            next_condition = self.__emit(Opcode.POP_JUMP_IF_FALSE)
+            self.__compile_block_statement(conditional.block)
+            ends.append(self.__emit(Opcode.JUMP))
+            self.__patch_jump(next_condition)
+        if node.else_statement is not None:
+            self.__compile_block_statement(node.else_statement)
+        else:
+            self.__emit(Opcode.LOAD_NONE)
+        for index in ends:
+            self.__patch_jump(index)
+
+    def __compile_while_statement(self, node: WhileStatement) -> None:
+        self.__emit(Opcode.LOOP_ENTER)
+        self.__emit(Opcode.LOAD_NONE)
+        condition = len(self.code.instructions)
+        self.is_leftmost_leaf_pending = True
+        self.__compile(node.condition)
+        exit_condition = self.__emit(Opcode.POP_JUMP_IF_FALSE)
+        self.__compile_block_statement(node.block)
+        exit_loop = self.__emit(Opcode.LOOP_FLAGS)
+        self.__emit(Opcode.JUMP, condition)
+        self.__patch_jump(exit_condition)
+        self.__emit(Opcode.LOAD_NONE)
+        self.__patch_jump(exit_loop)
+        self.__emit(Opcode.LOOP_EXIT)
+
+    def __compile_for_statement(self, node: ForStatement) -> None:
+        name = node.variable.name
+        slot = self.code.add_variable(name)
+        self.__emit(Opcode.LOOP_ENTER)
+        if (
+            type(node.iterable).__name__ == "IdentifierExpression"
+            and node.iterable.name == name
+        ):
+            self.__emit_constant(
+                Opcode.RAISE_ERROR,
+                (
+                    "VariableError",
+                    f"Cannot use {name} as iterator because it's defined as loop",
+                ),
+                node.offset,
+            )
+        self.__emit(Opcode.FOR_CHECK, slot, node.offset)
+        self.__compile(node.iterable)
+        self.__emit(Opcode.GET_ITERATOR, 0, node.offset)
+        self.__emit(Opcode.LOAD_NONE)
+        next_item = self.__emit(Opcode.FOR_ITER)
+        self.__compile_block_statement(node.block, slot)
+        exit_loop = self.__emit(Opcode.LOOP_FLAGS)
+        self.__emit(Opcode.JUMP, next_item)
+        self.__patch_jump(next_item)
+        self.__patch_jump(exit_loop)
+        self.__emit(Opcode.POP_ITERATOR)
+        self.__emit(Opcode.LOOP_EXIT)
+
+    def __compile_return_statement(self, node: ReturnStatement) -> None:
+        if node.expression is not None:
+            self.__compile(node.expression)
+        else:
+            self.__emit(Opcode.LOAD_NONE)
+        self.__emit(Opcode.SET_RETURN)
+
+    def __compile_assignment_statement(self, node: AssignmentStatement) -> None:
+        self.__compile(node.expression)
+        if isinstance(node.variable, IdentifierExpression):
+            self.__emit(
+                Opcode.STORE_VARIABLE, self.code.add_variable(node.variable.name)
+            )
+        else:
+            self.__compile(node.variable)
+            self.__emit(Opcode.STORE_TARGET)
+        self.__emit(Opcode.LOAD_NONE)
+
+    def __compile_arithmetic_assignment(self, node: AssignmentStatement) -> None:
+        self.__compile(node.variable)
+        name = getattr(node.variable, "name", None)
+        self.__emit_constant(Opcode.CHECK_DEFINED, name, node.offset)
+        self.__compile(node.expression)
+        self.__emit(
+            Opcode.COMPOUND_ASSIGNMENT,
+            compound_assignment_indexes[type(node)],
+            node.offset,
+        )
+        self.__emit(Opcode.LOAD_NONE)
+
+    def __compile_try_catch_statement(self, node: TryCatchStatement) -> None:
+        handler = self.__emit(Opcode.SETUP_TRY)
+        self.__compile_block_statement(node.try_statement)
+        self.__emit(Opcode.POP_HANDLER)
+        ends = [self.__emit(Opcode.JUMP)]
+        self.__patch_jump(handler)
+        for catch_block in node.catch_statements:
+            if not catch_block.error_types:
+                self.__emit(Opcode.POP)
+                self.__compile_block_statement(catch_block.catch_statement)
+                ends.append(self.__emit(Opcode.JUMP))
+                break
+            matches = []
+            for error_type in catch_block.error_types:
+                self.__emit(Opcode.DUP_TOP)
+                self.__emit_constant(
+                    Opcode.MATCH_ERROR_TYPE, error_type.name, node.offset
+                )
+                matches.append(self.__emit(Opcode.POP_JUMP_IF_TRUE))
+            next_catch = self.__emit(Opcode.JUMP)
+            for index in matches:
+                self.__patch_jump(index)
+            if catch_block.error_var is None:
+                self.__emit(Opcode.POP)
+                self.__compile_block_statement(catch_block.catch_statement)
+            else:
+                self.__compile_block_statement(
+                    catch_block.catch_statement,
+                    self.code.add_variable(catch_block.error_var.name),
+                )
+            ends.append(self.__emit(Opcode.JUMP))
+            self.__patch_jump(next_catch)
+        else:
+            self.__emit(Opcode.RERAISE)
+        for index in ends:
+            self.__patch_jump(index)
+
+    def __compile_throw_statement(self, node: ThrowStatement) -> None:
+        self.__emit(Opcode.SET_ERROR_POSITION, 0, node.offset)
+        self.__compile(node.expression)
+        self.__emit(Opcode.THROW, 0, node.offset)
+
+    def __compile_break_statement(self, node: BreakStatement) -> None:
+        self.__emit(Opcode.BREAK, 0, node.offset)
+
+    def __compile_continue_statement(self, node: ContinueStatement) -> None:
+        self.__emit(Opcode.CONTINUE, 0, node.offset)
+
+    ############################## EXPRESSIONS ##############################
+
+    def __compile_infix_expression(self, node: InfixExpression) -> None:
+        self.__compile(node.left)
+        self.__compile(node.right)
+        self.__emit(
+            Opcode.BINARY_OPERATION, binary_operation_indexes[type(node)], node.offset
+        )
+
+    def __compile_bitwise_negation_expression(
+        self, node: BitwiseNegationExpression
+    ) -> None:
+        self.__compile(node.expression)
+        self.__emit(Opcode.UNARY_NOT, 0, node.offset)
+
+    def __compile_numeric_negation_expression(
+        self, node: NumericNegationExpression
+    ) -> None:
+        self.__compile(node.expression)
+        self.__emit(Opcode.UNARY_NEGATIVE, 0, node.offset)
+
+    def __compile_type_check_expression(self, node: TypeCheckExpression) -> None:
+        self.__compile(node.expression)
+        self.__emit_constant(Opcode.TYPE_CHECK, node.type_name)
+
+    def __compile_literal(self, node: LiteralExpression) -> None:
+        self.__emit_constant(Opcode.LOAD_CONST, node.value)
+
+    def __compile_identifier_expression(self, node: IdentifierExpression) -> None:
+        if self.is_caller_environment:
+            self.__emit_constant(Opcode.LOAD_CALLER_VARIABLE, node.name)
+        else:
+            self.__emit(Opcode.LOAD_VARIABLE, self.code.add_variable(node.name))
+
+    def __compile_argument(self, node: Argument) -> None:
+        self.__emit(Opcode.ARGUMENT_BEGIN, int(not node.is_reference))
+        self.__compile(node.value)
+        self.__emit(Opcode.ARGUMENT_END)
+
+    def __compile_function_call_expression(self, node: FunctionCallExpression) -> None:
+        if node.name == "main":
+            self.__emit_constant(
+                Opcode.RAISE_ERROR,
+                ("FunctionError", "main function cannot be called"),
+                node.offset,
+            )
+            return
+        for argument in node.arguments:
+            self.__compile(argument)
+        self.__emit_constant(
+            Opcode.CALL_FUNCTION, (node.name, len(node.arguments)), node.offset
+        )
+
+    def __compile_method_call(self, node: FunctionCallExpression) -> None:
+        self.__emit_constant(Opcode.LOAD_METHOD, node.name, node.offset)
+        for argument in node.arguments:
+            self.__compile(argument)
+        self.__emit_constant(
+            Opcode.CALL_METHOD, (node.name, len(node.arguments)), node.offset
+        )
+
+    def __compile_property_access_expression(
+        self, node: PropertyAccessExpression
+    ) -> None:
+        self.__compile(node.left)
+        if isinstance(node.right, IdentifierExpression):
+            if not self.is_caller_environment:
+                self.code.add_variable(node.right.name)
+            self.__emit_constant(
+                Opcode.LOAD_PROPERTY, node.right.name, node.right.offset
+            )
+        elif isinstance(node.right, FunctionCallExpression):
+            self.__compile_method_call(node.right)
+        else:
+            self.__emit(Opcode.POP)
+            self.__compile(node.right)
+
+    def __compile_optional_property_access_expression(
+        self, node: OptionalPropertyAccessExpression
+    ) -> None:
+        handler = self.__emit(Opcode.SETUP_OPTIONAL)
+        self.__compile_property_access_expression(node)
+        self.__emit(Opcode.POP_HANDLER)
+        self.__patch_jump(handler)
@@ -0,0 +1,716 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from itertools import zip_longest
+
+from interpreter.built_in_classes import Array
+from interpreter.built_in_functions import BuiltInFunction, ErrorConstructor
+from interpreter.bytecode_compiler_class import (
+    BytecodeCompiler,
+    binary_operations,
+    compound_assignments,
+)
+from interpreter.closure_interpreter_class import (
+    ARITHMETIC_CHECK,
+    BOOLEAN_CHECK,
+    DIVISION_CHECK,
+    copy_value,
+    error_classes,
+    is_number,
+    number_types,
+)
+from interpreter.code_object_class import CodeObject
+from interpreter.interpreter_error_classes import *
+from interpreter.opcode_enum import Opcode
+from interpreter.runtime import ThrownError, throw
+from interpreter.value_class import Value
+from parser.statement_classes import FunctionDef
+from program.program_class import Program
+from utils.error_handler_class import ErrorHandler
+from utils.position_class import Position
+
+LOAD_CONST = Opcode.LOAD_CONST.value
+LOAD_NONE = Opcode.LOAD_NONE.value
+POP = Opcode.POP.value
+DUP_TOP = Opcode.DUP_TOP.value
+LOAD_VARIABLE = Opcode.LOAD_VARIABLE.value
+LOAD_PENDING_VARIABLE = Opcode.LOAD_PENDING_VARIABLE.value
+LOAD_CALLER_VARIABLE = Opcode.LOAD_CALLER_VARIABLE.value
+STORE_VARIABLE = Opcode.STORE_VARIABLE.value
+STORE_TARGET = Opcode.STORE_TARGET.value
+BIND_VARIABLE = Opcode.BIND_VARIABLE.value
+ENTER_SCOPE = Opcode.ENTER_SCOPE.value
+EXIT_SCOPE = Opcode.EXIT_SCOPE.value
+BINARY_OPERATION = Opcode.BINARY_OPERATION.value
+UNARY_NOT = Opcode.UNARY_NOT.value
+UNARY_NEGATIVE = Opcode.UNARY_NEGATIVE.value
+TYPE_CHECK = Opcode.TYPE_CHECK.value
+CHECK_DEFINED = Opcode.CHECK_DEFINED.value
+COMPOUND_ASSIGNMENT = Opcode.COMPOUND_ASSIGNMENT.value
+LOAD_PROPERTY = Opcode.LOAD_PROPERTY.value
+LOAD_METHOD = Opcode.LOAD_METHOD.value
+CALL_METHOD = Opcode.CALL_METHOD.value
+ARGUMENT_BEGIN = Opcode.ARGUMENT_BEGIN.value
+ARGUMENT_END = Opcode.ARGUMENT_END.value
+CALL_FUNCTION = Opcode.CALL_FUNCTION.value
+RETURN_VALUE = Opcode.RETURN_VALUE.value
+RETURN_EXPRESSION = Opcode.RETURN_EXPRESSION.value
+JUMP = Opcode.JUMP.value
+POP_JUMP_IF_FALSE = Opcode.POP_JUMP_IF_FALSE.value
+POP_JUMP_IF_TRUE = Opcode.POP_JUMP_IF_TRUE.value
+POP_OR_JUMP_IF_EXITING = Opcode.POP_OR_JUMP_IF_EXITING.value
+SET_RETURN = Opcode.SET_RETURN.value
+BREAK = Opcode.BREAK.value
+CONTINUE = Opcode.CONTINUE.value
+LOOP_ENTER = Opcode.LOOP_ENTER.value
+LOOP_EXIT = Opcode.LOOP_EXIT.value
+LOOP_FLAGS = Opcode.LOOP_FLAGS.value
+FOR_CHECK = Opcode.FOR_CHECK.value
+GET_ITERATOR = Opcode.GET_ITERATOR.value
+FOR_ITER = Opcode.FOR_ITER.value
+POP_ITERATOR = Opcode.POP_ITERATOR.value
+SETUP_TRY = Opcode.SETUP_TRY.value
+SETUP_OPTIONAL = Opcode.SETUP_OPTIONAL.value
+POP_HANDLER = Opcode.POP_HANDLER.value
+MATCH_ERROR_TYPE = Opcode.MATCH_ERROR_TYPE.value
+RERAISE = Opcode.RERAISE.value
+RAISE_ERROR = Opcode.RAISE_ERROR.value
+SET_ERROR_POSITION = Opcode.SET_ERROR_POSITION.value
+THROW = Opcode.THROW.value
+
+
+class Frame:
+    __slots__ = (
+        "code",
+        "slots",
+        "stack",
+        "scopes",
+        "handlers",
+        "loop_depth",
+        "pc",
+        "environment",
+    )
+
+    def __init__(self, code: CodeObject, environment: Frame | None = None) -> None:
+        self.code: CodeObject = code
+        self.slots: list[any] = [None] * len(code.variable_names)
+        self.stack: list[any] = []
+        self.scopes: list[list[int]] = [[]]
+        self.handlers: list[tuple[int, int, int, int, bool, bool]] = []
+        self.loop_depth: int = 0
+        self.pc: int = 0
+        self.environment: Frame = environment or self
+
+
+class BytecodeInterpreter:
+    def __init__(self, error_handler: ErrorHandler) -> None:
+        self.error_handler: ErrorHandler = error_handler
+        self.program: Program | None = None
+        self.compiler: BytecodeCompiler | None = None
+        self.functions: dict[str, CodeObject | BuiltInFunction] = {}
+
+        self.call_stack: list[Frame] = []
+
+        self.break_called: bool = False
+        self.continue_called: bool = False
+        self.return_called: bool = False
+
+        self.is_passed_by_value: bool = False
+        self.error_position: Position | None = None
+        self.function_call_position: Position | None = None
+
+        self.max_call_stack_size = 100
+
+    ############################## UTILS ##############################
+
+    def __check_arithmetic_types(
+        self, left: any, right: any, operator: str, position: Position, one_side=False
+    ) -> None:
+        if not is_number(left) or not is_number(right):
+            throw(
+                TypeError(
+                    position,
+                    f"Cannot apply operator {operator} to given values: {left}{f' and {right}' if not one_side else ''}",
+                )
+            )
+
+    def __check_boolean_types(
+        self, left: any, right: any, operator: str, position: Position, one_side=False
+    ) -> None:
+        if not isinstance(left, bool) or not isinstance(right, bool):
+            throw(
+                TypeError(
+                    position,
+                    f"Cannot apply operator {operator} to given values: {left}{f' and {right}' if not one_side else ''}",
+                )
+            )
+
+    def __check_division_by_zero(
+        self, right: any, operator: str, position: Position
+    ) -> None:
+        if right == 0:
+            throw(
+                ValueError(
+                    position,
+                    f"Cannot apply operator {operator} if right side is 0.",
+                )
+            )
+
+    def __check_binary_operation(
+        self, left: any, right: any, operator: str, check: str, position: Position
+    ) -> None:
+        if check == BOOLEAN_CHECK:
+            self.__check_boolean_types(left, right, operator, position)
+            return
+        self.__check_arithmetic_types(left, right, operator, position)
+        if check == DIVISION_CHECK:
+            self.__check_division_by_zero(right, operator, position)
+
+    ############################## VARIABLES ##############################
+
+    def __load_variable(self, frame: Frame, slot: int) -> Value:
+        value = frame.slots[slot]
+        if value is None:
+            value = frame.slots[slot] = Value(None)
+            frame.scopes[-1].append(slot)
+        if self.is_passed_by_value:
+            return copy_value(value)
+        return value
+
+    def __load_variable_by_name(self, frame: Frame, name: str) -> Value:
+        slot = frame.environment.code.variable_slots.get(name)
+        if slot is None:
+            return Value(None)
+        return self.__load_variable(frame.environment, slot)
+
+    def __get_property(self, target: any, name: str, position: Position) -> any:
+        try:
+            return getattr(target._value, name)
+        except AttributeError:
+            throw(
+                PropertyError(
+                    position,
+                    f"Class {type(target).__name__} does not have a property {name} or it's value is None",
+                )
+            )
+
+    ############################## FUNCTIONS ##############################
+
+    def __get_function(self, name: str) -> CodeObject | BuiltInFunction | None:
+        if function := self.functions.get(name):
+            return function
+        function = self.program.functions.get(name)
+        if function is None:
+            return None
+        if isinstance(function, FunctionDef):
+            if name in self.program.block_loaders:
+                self.__load_function_block(function)
+            function = self.compiler.compile_function(function)
+        self.functions[name] = function
+        return function
+
+    def __load_function_block(self, node: FunctionDef) -> None:
+        error_count = len(self.error_handler.errors)
+        self.program.load_function_block(node.name)
+        if len(self.error_handler.errors) > error_count:
+            throw(
+                RuntimeError(
+                    self.program.line_index.get_position(node.offset),
+                    f"Function {node.name} contains syntax errors",
+                )
+            )
+
+    def __call_built_in_function(
+        self, function: BuiltInFunction, arguments: list
+    ) -> Value:
+        if isinstance(function, ErrorConstructor):
+            arguments = [self.error_position, *arguments]
+        if function.argc != None and function.argc < len(arguments):
+            throw(
+                ArgumentError(
+                    self.function_call_position,
+                    f"Function {function.name} takes max of {function.argc} arguments, {len(arguments)} given",
+                )
+            )
+        return Value(function.execute(arguments))
+
+    def __create_frame(
+        self, code: CodeObject, arguments: list | None, caller: Frame | None
+    ) -> Frame:
+        parameters = code.parameters
+        if code.name == "main" and len(parameters) > 0:
+            throw(
+                ArgumentError(code.position, "Main function cannot take any arguments")
+            )
+        frame = Frame(code)
+        if arguments != None:
+            if len(arguments) > len(parameters):
+                throw(
+                    ArgumentError(
+                        code.position,
+                        f"Function {code.name} takes {len(parameters)} arguments, {len(arguments)} given",
+                    )
+                )
+            for parameter, value in zip_longest(parameters, arguments):
+                slot, is_optional, default_code = parameter
+                if not is_optional and value is None:
+                    throw(
+                        ArgumentError(
+                            code.position,
+                            f"Parameter {code.variable_names[slot]} is not optional",
+                        )
+                    )
+                elif is_optional and value is None:
+                    value = self.__execute(Frame(default_code, caller))
+                frame.slots[slot] = value
+        return frame
+
+    def __call(
+        self, frame: Frame, name: str, arguments: list, position: Position
+    ) -> Frame | None:
+        if name == "main":
+            throw(FunctionError(position, "main function cannot be called"))
+        self.function_call_position = position
+        if len(self.call_stack) == self.max_call_stack_size:
+            throw(
+                StackOverflowError(
+                    position,
+                    f"Maximum call stack size of {self.max_call_stack_size} exceeded",
+                )
+            )
+        function = self.functions.get(name) or self.__get_function(name)
+        if function is None:
+            throw(FunctionError(position, f"Function {name} is not defined"))
+        if type(function) is not CodeObject:
+            frame.stack.append(self.__call_built_in_function(function, arguments))
+            return None
+        self.call_stack.append(frame)
+        try:
+            return self.__create_frame(function, arguments, frame)
+        except Exception:
+            self.call_stack.pop()
+            raise
+
+    ############################## ERRORS ##############################
+
+    def __find_handler(
+        self, frame: Frame, exception: Exception
+    ) -> tuple[int, int, int, int, bool, bool] | None:
+        while frame.handlers:
+            handler = frame.handlers.pop()
+            is_optional = handler[5]
+            if isinstance(exception, ThrownError):
+                if not is_optional or isinstance(exception.value._value, PropertyError):
+                    return handler
+            elif is_optional:
+                return handler
+        return None
+
+    def __enter_handler(
+        self,
+        frame: Frame,
+        handler: tuple[int, int, int, int, bool, bool],
+        exception: Exception,
+    ) -> None:
+        (
+            handler_pc,
+            stack_depth,
+            scope_depth,
+            loop_depth,
+            is_passed_by_value,
+            is_optional,
+        ) = handler
+        del frame.stack[stack_depth:]
+        while len(frame.scopes) > scope_depth:
+            for slot in frame.scopes.pop():
+                frame.slots[slot] = None
+        frame.loop_depth = loop_depth
+        self.is_passed_by_value = is_passed_by_value
+        frame.stack.append(Value(None) if is_optional else exception.value)
+        frame.pc = handler_pc
+
+    ############################## EXECUTION ##############################
+
+    def __execute(self, frame: Frame) -> any:
+        entry_depth = len(self.call_stack)
+        code = frame.code
+        instructions = code.instructions
+        constants = code.constants
+        positions = code.positions
+        stack = frame.stack
+        slots = frame.slots
+        pc = frame.pc
+        while True:
+            try:
+                while True:
+                    opcode = instructions[pc]
+                    operand = instructions[pc + 1]
+                    pc += 2
+                    if opcode == LOAD_VARIABLE:
+                        value = slots[operand]
+                        if value is None:
+                            value = slots[operand] = Value(None)
+                            frame.scopes[-1].append(operand)
+                        if self.is_passed_by_value:
+                            value = copy_value(value)
+                        stack.append(value)
+                    elif opcode == LOAD_CONST:
+                        stack.append(Value(constants[operand]))
+                    elif opcode == BINARY_OPERATION:
+                        right = stack.pop()._value
+                        left = stack[-1]._value
+                        function, operator, check = binary_operations[operand]
+                        if check is not None and (
+                            check is not ARITHMETIC_CHECK
+                            or type(left) not in number_types
+                            or type(right) not in number_types
+                        ):
+                            self.__check_binary_operation(
+                                left, right, operator, check, positions[(pc >> 1) - 1]
+                            )
+                        stack[-1] = Value(function(left, right))
+                    elif opcode == POP_OR_JUMP_IF_EXITING:
+                        if (
+                            self.return_called
+                            or (self.break_called or self.continue_called)
+                            and frame.loop_depth > 0
+                        ):
+                            pc = operand
+                        else:
+                            stack.pop()
+                    elif opcode == POP_JUMP_IF_FALSE:
+                        if not stack.pop()._value:
+                            pc = operand
+                    elif opcode == LOAD_NONE:
+                        stack.append(None)
+                    elif opcode == ENTER_SCOPE:
+                        frame.scopes.append([])
+                    elif opcode == EXIT_SCOPE:
+                        for slot in frame.scopes.pop():
+                            slots[slot] = None
+                    elif opcode == JUMP:
+                        pc = operand
+                    elif opcode == ARGUMENT_BEGIN:
+                        self.is_passed_by_value = operand == 1
+                    elif opcode == ARGUMENT_END:
+                        self.is_passed_by_value = False
+                    elif opcode == CALL_FUNCTION:
+                        name, argument_count = constants[operand]
+                        arguments = stack[len(stack) - argument_count :]
+                        del stack[len(stack) - argument_count :]
+                        callee = self.__call(
+                            frame, name, arguments, positions[(pc >> 1) - 1]
+                        )
+                        if callee is not None:
+                            frame.pc = pc
+                            frame = callee
+                            code = frame.code
+                            instructions = code.instructions
+                            constants = code.constants
+                            positions = code.positions
+                            stack = frame.stack
+                            slots = frame.slots
+                            pc = 0
+                    elif opcode == SET_RETURN:
+                        self.return_called = True
+                    elif opcode == RETURN_VALUE:
+                        result = stack.pop()
+                        self.return_called = False
+                        if len(self.call_stack) == entry_depth:
+                            return result
+                        frame = self.call_stack.pop()
+                        code = frame.code
+                        instructions = code.instructions
+                        constants = code.constants
+                        positions = code.positions
+                        stack = frame.stack
+                        slots = frame.slots
+                        pc = frame.pc
+                        stack.append(result)
+                    elif opcode == CHECK_DEFINED:
+                        value = stack[-1]
+                        if (
+                            value._value is None
+                            if type(value) is Value
+                            else value == None
+                        ):
+                            throw(
+                                VariableError(
+                                    positions[(pc >> 1) - 1],
+                                    f"Variable {constants[operand]} is not defined",
+                                )
+                            )
+                    elif opcode == COMPOUND_ASSIGNMENT:
+                        right = stack.pop()._value
+                        left = stack.pop()
+                        function, operator, check_division = compound_assignments[
+                            operand
+                        ]
+                        if (
+                            check_division
+                            or type(left._value) not in number_types
+                            or type(right) not in number_types
+                        ):
+                            position = positions[(pc >> 1) - 1]
+                            self.__check_arithmetic_types(
+                                left._value, right, operator, position
+                            )
+                            if check_division:
+                                self.__check_division_by_zero(right, operator, position)
+                        left._value = function(left._value, right)
+                    elif opcode == LOAD_PENDING_VARIABLE:
+                        target = stack.pop()
+                        if target is not None:
+                            stack.append(
+                                self.__get_property(
+                                    target,
+                                    code.variable_names[operand],
+                                    positions[(pc >> 1) - 1],
+                                )
+                            )
+                            continue
+                        value = slots[operand]
+                        if value is None:
+                            value = slots[operand] = Value(None)
+                            frame.scopes[-1].append(operand)
+                        if self.is_passed_by_value:
+                            value = copy_value(value)
+                        stack.append(value)
+                    elif opcode == LOOP_FLAGS:
+                        if self.break_called:
+                            self.break_called = False
+                            pc = operand
+                        elif self.continue_called:
+                            self.continue_called = False
+                    elif opcode == STORE_VARIABLE:
+                        value = stack.pop()
+                        variable = slots[operand]
+                        if variable is None:
+                            variable = slots[operand] = Value(None)
+                            frame.scopes[-1].append(operand)
+                        variable.set_value(value._value)
+                    elif opcode == POP:
+                        stack.pop()
+                    elif opcode == FOR_ITER:
+                        item = next(stack[-2], None)
+                        if item is None:
+                            pc = operand
+                        else:
+                            stack[-1] = item
+                    elif opcode == BIND_VARIABLE:
+                        value = stack.pop()
+                        if slots[operand] is None:
+                            slots[operand] = value
+                            frame.scopes[-1].append(operand)
+                    elif opcode == LOOP_ENTER:
+                        frame.loop_depth += 1
+                    elif opcode == LOOP_EXIT:
+                        frame.loop_depth -= 1
+                    elif opcode == LOAD_PROPERTY:
+                        target = stack.pop()
+                        if target is None:
+                            stack.append(
+                                self.__load_variable_by_name(frame, constants[operand])
+                            )
+                        else:
+                            stack.append(
+                                self.__get_property(
+                                    target, constants[operand], positions[(pc >> 1) - 1]
+                                )
+                            )
+                    elif opcode == LOAD_METHOD:
+                        target = stack.pop()
+                        method = None
+                        if target is not None:
+                            try:
+                                method = getattr(target._value, constants[operand])
+                            except AttributeError:
+                                throw(
+                                    PropertyError(
+                                        positions[(pc >> 1) - 1],
+                                        f"Class {type(target).__name__} does not have a method {constants[operand]}",
+                                    )
+                                )
+                        stack.append(target)
+                        stack.append(method)
+                    elif opcode == CALL_METHOD:
+                        name, argument_count = constants[operand]
+                        arguments = stack[len(stack) - argument_count :]
+                        del stack[len(stack) - argument_count :]
+                        method = stack.pop()
+                        target = stack.pop()
+                        if method is not None:
+                            try:
+                                stack.append(method(*arguments))
+                            except AttributeError:
+                                throw(
+                                    PropertyError(
+                                        positions[(pc >> 1) - 1],
+                                        f"Class {type(target).__name__} does not have a method {name}",
+                                    )
+                                )
+                            continue
+                        callee = self.__call(
+                            frame, name, arguments, positions[(pc >> 1) - 1]
+                        )
+                        if callee is not None:
+                            frame.pc = pc
+                            frame = callee
+                            code = frame.code
+                            instructions = code.instructions
+                            constants = code.constants
+                            positions = code.positions
+                            stack = frame.stack
+                            slots = frame.slots
+                            pc = 0
+                    elif opcode == STORE_TARGET:
+                        target = stack.pop()
+                        target.set_value(stack.pop()._value)
+                    elif opcode == UNARY_NOT:
+                        value = stack[-1]._value
+                        self.__check_boolean_types(
+                            value, True, "!", positions[(pc >> 1) - 1], True
+                        )
+                        stack[-1] = Value(not value)
+                    elif opcode == UNARY_NEGATIVE:
+                        value = stack[-1]._value
+                        self.__check_arithmetic_types(
+                            value, 0, "-", positions[(pc >> 1) - 1], True
+                        )
+                        stack[-1] = Value(-value)
+                    elif opcode == TYPE_CHECK:
+                        stack[-1] = Value(stack[-1]._type == constants[operand])
+                    elif opcode == DUP_TOP:
+                        stack.append(stack[-1])
+                    elif opcode == POP_JUMP_IF_TRUE:
+                        if stack.pop()._value:
+                            pc = operand
+                    elif opcode == BREAK:
+                        self.break_called = True
+                        if frame.loop_depth == 0:
+                            throw(
+                                ExpressionError(
+                                    positions[(pc >> 1) - 1],
+                                    "break statement can only be used in loop",
+                                )
+                            )
+                        stack.append(None)
+                    elif opcode == CONTINUE:
+                        self.continue_called = True
+                        if frame.loop_depth == 0:
+                            throw(
+                                ExpressionError(
+                                    positions[(pc >> 1) - 1],
+                                    "continue statement can only be used in loop",
+                                )
+                            )
+                        stack.append(None)
+                    elif opcode == FOR_CHECK:
+                        if slots[operand] is not None:
+                            throw(
+                                VariableError(
+                                    positions[(pc >> 1) - 1],
+                                    f"Variable {code.variable_names[operand]} is already defined in this scope",
+                                )
+                            )
+                    elif opcode == GET_ITERATOR:
+                        iterable = deepcopy(stack.pop()._value)
+                        if not isinstance(iterable, Array):
+                            throw(
+                                TypeError(
+                                    positions[(pc >> 1) - 1],
+                                    "For loop can only iterate over array",
+                                )
+                            )
+                        stack.append(iter(iterable._value))
+                    elif opcode == POP_ITERATOR:
+                        result = stack.pop()
+                        stack[-1] = result
+                    elif opcode == SETUP_TRY or opcode == SETUP_OPTIONAL:
+                        frame.handlers.append(
+                            (
+                                operand,
+                                len(stack),
+                                len(frame.scopes),
+                                frame.loop_depth,
+                                self.is_passed_by_value,
+                                opcode == SETUP_OPTIONAL,
+                            )
+                        )
+                    elif opcode == POP_HANDLER:
+                        frame.handlers.pop()
+                    elif opcode == MATCH_ERROR_TYPE:
+                        error = stack.pop()
+                        name = constants[operand]
+                        if name not in self.program.functions:
+                            throw(
+                                TypeError(
+                                    positions[(pc >> 1) - 1],
+                                    f"Unknown error type {name}",
+                                )
+                            )
+                        error_class = error_classes.get(name)
+                        stack.append(
+                            Value(
+                                error_class is not None
+                                and issubclass(error._value.__class__, error_class)
+                            )
+                        )
+                    elif opcode == RERAISE:
+                        raise ThrownError(stack.pop())
+                    elif opcode == SET_ERROR_POSITION:
+                        self.error_position = positions[(pc >> 1) - 1]
+                    elif opcode == THROW:
+                        error = stack.pop()
+                        if not isinstance(error._value, Error):
+                            error = Value(
+                                TypeError(
+                                    positions[(pc >> 1) - 1],
+                                    "Throw statement can only throw error",
+                                )
+                            )
+                        self.error_position = None
+                        raise ThrownError(error)
+                    elif opcode == RAISE_ERROR:
+                        error_name, message = constants[operand]
+                        throw(
+                            error_classes[error_name](positions[(pc >> 1) - 1], message)
+                        )
+                    elif opcode == LOAD_CALLER_VARIABLE:
+                        stack.append(
+                            self.__load_variable_by_name(frame, constants[operand])
+                        )
+                    elif opcode == RETURN_EXPRESSION:
+                        return stack.pop()
+                    else:
+                        raise NotImplementedError(f"Unknown opcode {opcode}")
+            except Exception as exception:
+                frame.pc = pc
+                while (handler := self.__find_handler(frame, exception)) is None:
+                    if len(self.call_stack) == entry_depth:
+                        raise
+                    frame = self.call_stack.pop()
+                self.__enter_handler(frame, handler, exception)
+                code = frame.code
+                instructions = code.instructions
+                constants = code.constants
+                positions = code.positions
+                stack = frame.stack
+                slots = frame.slots
+                pc = frame.pc
+
+    ############################## PROGRAM ##############################
+
+    def visit(self, program: Program) -> None:
+        self.program = program
+        self.compiler = BytecodeCompiler(program)
+        self.functions = {}
+        if "main" not in program.functions:
+            self.error_handler.raise_critical_error(
+                RuntimeError(Position(1, 1), "Program does not contain a main function")
+            )
+            return
+        try:
+            self.__execute(self.__create_frame(self.__get_function("main"), None, None))
+        except ThrownError as thrown_error:
+            self.error_handler.raise_critical_error(thrown_error.value._value)
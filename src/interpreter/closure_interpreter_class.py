@@ -0,0 +1,759 @@
+from __future__ import annotations
+
+import operator
+from collections.abc import Callable
+from copy import deepcopy
+from itertools import zip_longest
+
+from interpreter import interpreter_error_classes
+from interpreter.built_in_classes import Array
+from interpreter.built_in_functions import BuiltInFunction, ErrorConstructor
+from interpreter.function_scope_class import FunctionScope
+from interpreter.interpreter_error_classes import *
+from interpreter.runtime import ThrownError, throw
+from interpreter.value_class import Value
+from parser.statement_classes import *
+from program.program_class import Program
+from utils.error_handler_class import ErrorHandler
+from utils.position_class import Position
+
+ARITHMETIC_CHECK = "arithmetic"
+DIVISION_CHECK = "division"
+BOOLEAN_CHECK = "boolean"
+
+infix_operations: dict[type, tuple[Callable, str, str | None]] = {
+    AddExpression: (operator.add, "+", ARITHMETIC_CHECK),
+    SubtractExpression: (operator.sub, "-", ARITHMETIC_CHECK),
+    MultiplyExpression: (operator.mul, "*", ARITHMETIC_CHECK),
+    DivideExpression: (operator.truediv, "/", DIVISION_CHECK),
+    ModuloExpression: (operator.mod, "%", DIVISION_CHECK),
+    EqualExpression: (operator.eq, "==", None),
+    NotEqualExpression: (operator.ne, "!=", None),
+    GreaterEqualExpression: (operator.ge, ">=", ARITHMETIC_CHECK),
+    GreaterThanExpression: (operator.gt, ">", ARITHMETIC_CHECK),
+    LessEqualExpression: (operator.le, "<=", ARITHMETIC_CHECK),
+    LessThanExpression: (operator.lt, "<", ARITHMETIC_CHECK),
+    AndExpression: (operator.and_, "&", BOOLEAN_CHECK),
+    OrExpression: (operator.or_, "|", BOOLEAN_CHECK),
+}
+
+assignment_operations: dict[type, tuple[Callable, str, bool]] = {
+    AssignmentPlusStatement: (operator.add, "+=", False),
+    AssignmentMinusStatement: (operator.sub, "-=", False),
+    AssignmentMultiplyStatement: (operator.mul, "*=", False),
+    AssignmentDivideStatement: (operator.truediv, "/=", True),
+    AssignmentModuloStatement: (operator.mod, "%=", True),
+}
+
+error_classes: dict[str, type] = {
+    name: value
+    for name, value in vars(interpreter_error_classes).items()
+    if isinstance(value, type) and issubclass(value, Error)
+}
+
+scalar_types: tuple[type, ...] = (int, float, str, bool, type(None))
+number_types: tuple[type, ...] = (int, float)
+
+leaf_classes: tuple[type, ...] = (
+    IdentifierExpression,
+    FunctionCallExpression,
+    LiteralExpression,
+)
+
+
+def is_number(value: any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def copy_value(value: any) -> any:
+    if type(value) is Value and type(value._value) in scalar_types:
+        copied = Value.__new__(Value)
+        copied.__dict__.update(value.__dict__)
+        return copied
+    return deepcopy(value)
+
+
+class ClosureInterpreter:
+    def __init__(self, error_handler: ErrorHandler) -> None:
+        self.error_handler: ErrorHandler = error_handler
+        self.program: Program | None = None
+        self.runners: dict[str, Callable[[list | None], any]] = {}
+
+        self.current_environment: FunctionScope | None = None
+        self.call_stack: list[FunctionScope] = []
+
+        self.break_called: bool = False
+        self.continue_called: bool = False
+        self.return_called: bool = False
+
+        self.is_passed_by_value: bool = False
+        self.error_position: Position | None = None
+        self.function_call_position: Position | None = None
+
+        self.max_call_stack_size = 100
+
+        self.pending_result: any = None
+        self.is_leftmost_leaf_pending: bool = False
+
+        self.compilers: dict[type, Callable[[any], Callable]] = {
+            BlockStatement: self.__compile_block_statement,
+            IfStatement: self.__compile_if_statement,
+            WhileStatement: self.__compile_while_statement,
+            ForStatement: self.__compile_for_statement,
+            ReturnStatement: self.__compile_return_statement,
+            AssignmentStatement: self.__compile_assignment_statement,
+            TryCatchStatement: self.__compile_try_catch_statement,
+            ThrowStatement: self.__compile_throw_statement,
+            BreakStatement: self.__compile_break_statement,
+            ContinueStatement: self.__compile_continue_statement,
+            BitwiseNegationExpression: self.__compile_bitwise_negation_expression,
+            NumericNegationExpression: self.__compile_numeric_negation_expression,
+            TypeCheckExpression: self.__compile_type_check_expression,
+            IdentifierExpression: self.__compile_identifier_expression,
+            FunctionCallExpression: self.__compile_function_call_expression,
+            PropertyAccessExpression: self.__compile_property_access_expression,
+            OptionalPropertyAccessExpression: (
+                self.__compile_optional_property_access_expression
+            ),
+            Argument: self.__compile_argument,
+        }
+        for node_class in infix_operations:
+            self.compilers[node_class] = self.__compile_infix_expression
+        for node_class in assignment_operations:
+            self.compilers[node_class] = self.__compile_arithmetic_assignment
+        for node_class in [
+            NullLiteral,
+            IntegerLiteral,
+            FloatLiteral,
+            StringLiteral,
+            BooleanLiteral,
+            FalseLiteral,
+            TrueLiteral,
+        ]:
+            self.compilers[node_class] = self.__compile_literal
+
+    ############################## UTILS ##############################
+
+    def __get_position(self, offset: int | None) -> Position | None:
+        return self.program.line_index.get_position(offset)
+
+    def __compile(self, node: any) -> Callable:
+        if self.is_leftmost_leaf_pending and isinstance(node, leaf_classes):
+            self.is_leftmost_leaf_pending = False
+            return self.__compile_pending_result_leaf(node)
+        return self.compilers[type(node)](node)
+
+    def __compile_pending_result_leaf(self, node: any) -> Callable:
+        access = self.__compile_member_access(node)
+
+        def evaluate() -> any:
+            target = self.pending_result
+            self.pending_result = None
+            return access(target)
+
+        return evaluate
+
+    def __check_arithmetic_types(
+        self, left: any, right: any, operator: str, position: Position, one_side=False
+    ) -> None:
+        if not is_number(left) or not is_number(right):
+            throw(
+                TypeError(
+                    position,
+                    f"Cannot apply operator {operator} to given values: {left}{f' and {right}' if not one_side else ''}",
+                )
+            )
+
+    def __check_boolean_types(
+        self, left: any, right: any, operator: str, position: Position, one_side=False
+    ) -> None:
+        if not isinstance(left, bool) or not isinstance(right, bool):
+            throw(
+                TypeError(
+                    position,
+                    f"Cannot apply operator {operator} to given values: {left}{f' and {right}' if not one_side else ''}",
+                )
+            )
+
+    def __check_division_by_zero(
+        self, right: any, operator: str, position: Position
+    ) -> None:
+        if right == 0:
+            throw(
+                ValueError(
+                    position,
+                    f"Cannot apply operator {operator} if right side is 0.",
+                )
+            )
+
+    ############################## FUNCTIONS ##############################
+
+    def __get_runner(self, name: str) -> Callable[[list | None], any] | None:
+        if runner := self.runners.get(name):
+            return runner
+        function = self.program.functions.get(name)
+        if function is None:
+            return None
+        if isinstance(function, BuiltInFunction):
+            runner = self.__compile_built_in_function(function)
+        else:
+            if name in self.program.block_loaders:
+                self.__load_function_block(function)
+            runner = self.__compile_function_definition(function)
+        self.runners[name] = runner
+        return runner
+
+    def __load_function_block(self, node: FunctionDef) -> None:
+        error_count = len(self.error_handler.errors)
+        self.program.load_function_block(node.name)
+        if len(self.error_handler.errors) > error_count:
+            throw(
+                RuntimeError(
+                    self.__get_position(node.offset),
+                    f"Function {node.name} contains syntax errors",
+                )
+            )
+
+    def __compile_built_in_function(
+        self, node: BuiltInFunction
+    ) -> Callable[[list | None], any]:
+        is_error_constructor = isinstance(node, ErrorConstructor)
+
+        def run(arguments: list | None) -> any:
+            if is_error_constructor:
+                arguments = [self.error_position, *arguments]
+            if node.argc != None and node.argc < len(arguments):
+                throw(
+                    ArgumentError(
+                        self.function_call_position,
+                        f"Function {node.name} takes max of {node.argc} arguments, {len(arguments)} given",
+                    )
+                )
+            return Value(node.execute(arguments))
+
+        return run
+
+    def __compile_function_definition(
+        self, node: FunctionDef
+    ) -> Callable[[list | None], any]:
+        position = self.__get_position(node.offset)
+        name = node.name
+        parameters = [
+            (
+                parameter.name,
+                parameter.is_optional,
+                self.__compile(parameter.value) if parameter.is_optional else None,
+            )
+            for parameter in node.parameters
+        ]
+        block = self.__compile(node.block)
+
+        def run(arguments: list | None) -> any:
+            if name == "main" and len(parameters) > 0:
+                throw(
+                    ArgumentError(position, "Main function cannot take any arguments")
+                )
+            new_env = FunctionScope()
+            if arguments != None:
+                if len(arguments) > len(parameters):
+                    throw(
+                        ArgumentError(
+                            position,
+                            f"Function {name} takes {len(parameters)} arguments, {len(arguments)} given",
+                        )
+                    )
+                for parameter, value in zip_longest(parameters, arguments):
+                    parameter_name, is_optional, evaluate_default = parameter
+                    if not is_optional and value is None:
+                        throw(
+                            ArgumentError(
+                                position, f"Parameter {parameter_name} is not optional"
+                            )
+                        )
+                    elif is_optional and value is None:
+                        new_env.set_or_init_variable(parameter_name, evaluate_default())
+                    else:
+                        new_env.set_or_init_variable(parameter_name, value)
+            self.current_environment = new_env
+            result = block()
+            self.return_called = False
+            return result
+
+        return run
+
+    ############################## STATEMENTS ##############################
+
+    def __compile_block_statement(self, node: BlockStatement) -> Callable:
+        statements = [self.__compile(statement) for statement in node.statements]
+
+        def execute(variables: dict[str, any] | None = None) -> any:
+            self.current_environment.enter_scope(variables)
+            result = None
+            try:
+                for statement in statements:
+                    result = statement()
+                    if (
+                        (self.break_called or self.continue_called)
+                        and self.current_environment.loop_depth > 0
+                        or self.return_called
+                    ):
+                        break
+                else:
+                    result = None
+            except ThrownError:
+                self.current_environment.exit_scope()
+                raise
+            self.current_environment.exit_scope()
+            return result
+
+        return execute
+
+    def __compile_if_statement(self, node: IfStatement) -> Callable:
+        evaluate_condition = self.__compile(node.condition)
+        block = self.__compile(node.block)
+        elif_blocks = [
+            (self.__compile(elif_block.condition), self.__compile(elif_block.block))
+            for elif_block in node.elif_statements
+        ]
+        else_block = (
+            self.__compile(node.else_statement)
+            if node.else_statement is not None
+            else None
+        )
+
+        def execute() -> any:
+            if evaluate_condition()._value:
+                return block()
+            for evaluate_elif_condition, elif_block in elif_blocks:
+                if evaluate_elif_condition()._value:
+                    return elif_block()
+            if else_block is not None:
+                return else_block()
+            return None
+
+        return execute
+
+    def __compile_while_statement(self, node: WhileStatement) -> Callable:
+        self.is_leftmost_leaf_pending = True
+        evaluate_condition = self.__compile(node.condition)
+        block = self.__compile(node.block)
+
+        def execute() -> any:
+            self.current_environment.loop_depth += 1
+            result = None
+            try:
+                while True:
+                    self.pending_result = result
+                    if not evaluate_condition()._value:
+                        result = None
+                        break
+                    result = block()
+                    if self.break_called:
+                        self.break_called = False
+                        break
+                    if self.continue_called:
+                        self.continue_called = False
+            except ThrownError:
+                self.current_environment.loop_depth -= 1
+                raise
+            self.current_environment.loop_depth -= 1
+            return result
+
+        return execute
+
+    def __compile_for_statement(self, node: ForStatement) -> Callable:
+        position = self.__get_position(node.offset)
+        name = node.variable.name
+        is_iterating_over_itself = (
+            type(node.iterable).__name__ == "IdentifierExpression"
+            and node.iterable.name == name
+        )
+        evaluate_iterable = self.__compile(node.iterable)
+        block = self.__compile(node.block)
+
+        def execute() -> any:
+            self.current_environment.loop_depth += 1
+            if is_iterating_over_itself:
+                throw(
+                    VariableError(
+                        position,
+                        f"Cannot use {name} as iterator because it's defined as loop",
+                    )
+                )
+            for variables in self.current_environment.variables_stack:
+                if name in variables:
+                    throw(
+                        VariableError(
+                            position,
+                            f"Variable {name} is already defined in this scope",
+                        )
+                    )
+            iterable = deepcopy(evaluate_iterable()._value)
+            if not isinstance(iterable, Array):
+                throw(TypeError(position, "For loop can only iterate over array"))
+            result = None
+            try:
+                for item in iterable._value:
+                    result = block({name: item})
+                    if self.break_called:
+                        self.break_called = False
+                        break
+                    if self.continue_called:
+                        self.continue_called = False
+            except ThrownError:
+                self.current_environment.loop_depth -= 1
+                raise
+            self.current_environment.loop_depth -= 1
+            return result
+
+        return execute
+
+    def __compile_return_statement(self, node: ReturnStatement) -> Callable:
+        evaluate = self.__compile(node.expression) if node.expression else None
+
+        def execute() -> any:
+            result = evaluate() if evaluate is not None else None
+            self.return_called = True
+            return result
+
+        return execute
+
+    def __compile_assignment_statement(self, node: AssignmentStatement) -> Callable:
+        evaluate = self.__compile(node.expression)
+        if isinstance(node.variable, IdentifierExpression):
+            name = node.variable.name
+
+            def execute() -> None:
+                result = evaluate()
+                variable = self.current_environment.get_or_init_variable(name)
+                variable.set_value(result._value)
+
+            return execute
+
+        evaluate_variable = self.__compile(node.variable)
+
+        def execute() -> None:
+            result = evaluate()
+            variable = evaluate_variable()
+            variable.set_value(result._value)
+
+        return execute
+
+    def __compile_arithmetic_assignment(self, node: AssignmentStatement) -> Callable:
+        function, operator, check_division = assignment_operations[type(node)]
+        position = self.__get_position(node.offset)
+        name = getattr(node.variable, "name", None)
+        evaluate_variable = self.__compile(node.variable)
+        evaluate = self.__compile(node.expression)
+
+        def execute() -> None:
+            left = evaluate_variable()
+            if left == None:
+                throw(VariableError(position, f"Variable {name} is not defined"))
+            right = evaluate()
+            left_value, right_value = left._value, right._value
+            self.__check_arithmetic_types(left_value, right_value, operator, position)
+            if check_division:
+                self.__check_division_by_zero(right_value, operator, position)
+            left._value = function(left_value, right_value)
+
+        return execute
+
+    def __compile_try_catch_statement(self, node: TryCatchStatement) -> Callable:
+        position = self.__get_position(node.offset)
+        try_block = self.__compile(node.try_statement)
+        catch_blocks = [
+            (
+                [error_type.name for error_type in catch_block.error_types],
+                catch_block.error_var.name if catch_block.error_var else None,
+                self.__compile(catch_block.catch_statement),
+            )
+            for catch_block in node.catch_statements
+        ]
+
+        def execute() -> any:
+            try:
+                return try_block()
+            except ThrownError as thrown_error:
+                error_thrown = thrown_error.value
+            for error_types, error_var, catch_block in catch_blocks:
+                if not error_types:
+                    return catch_block()
+                for error_type in error_types:
+                    if error_type not in self.program.functions:
+                        throw(TypeError(position, f"Unknown error type {error_type}"))
+                    error_class = error_classes.get(error_type)
+                    if error_class is not None and issubclass(
+                        error_thrown._value.__class__, error_class
+                    ):
+                        return catch_block({error_var: error_thrown})
+            raise ThrownError(error_thrown)
+
+        return execute
+
+    def __compile_throw_statement(self, node: ThrowStatement) -> Callable:
+        position = self.__get_position(node.offset)
+        evaluate = self.__compile(node.expression)
+
+        def execute() -> None:
+            self.error_position = position
+            error_thrown = evaluate()
+            if not isinstance(error_thrown._value, Error):
+                error_thrown = Value(
+                    TypeError(position, "Throw statement can only throw error")
+                )
+            self.error_position = None
+            raise ThrownError(error_thrown)
+
+        return execute
+
+    def __compile_break_statement(self, node: BreakStatement) -> Callable:
+        position = self.__get_position(node.offset)
+
+        def execute() -> None:
+            self.break_called = True
+            if self.current_environment.loop_depth == 0:
+                throw(
+                    ExpressionError(
+                        position, "break statement can only be used in loop"
+                    )
+                )
+
+        return execute
+
+    def __compile_continue_statement(self, node: ContinueStatement) -> Callable:
+        position = self.__get_position(node.offset)
+
+        def execute() -> None:
+            self.continue_called = True
+            if self.current_environment.loop_depth == 0:
+                throw(
+                    ExpressionError(
+                        position, "continue statement can only be used in loop"
+                    )
+                )
+
+        return execute
+
+    ############################## EXPRESSIONS ##############################
+
+    def __compile_infix_expression(self, node: InfixExpression) -> Callable:
+        function, operator, check = infix_operations[type(node)]
+        position = self.__get_position(node.offset)
+        evaluate_left = self.__compile(node.left)
+        evaluate_right = self.__compile(node.right)
+        if check is None:
+
+            def evaluate() -> Value:
+                left = evaluate_left()._value
+                return Value(function(left, evaluate_right()._value))
+
+        elif check == BOOLEAN_CHECK:
+
+            def evaluate() -> Value:
+                left = evaluate_left()._value
+                right = evaluate_right()._value
+                self.__check_boolean_types(left, right, operator, position)
+                return Value(function(left, right))
+
+        elif check == ARITHMETIC_CHECK:
+
+            def evaluate() -> Value:
+                left = evaluate_left()._value
+                right = evaluate_right()._value
+                if type(left) not in number_types or type(right) not in number_types:
+                    self.__check_arithmetic_types(left, right, operator, position)
+                return Value(function(left, right))
+
+        else:
+
+            def evaluate() -> Value:
+                left = evaluate_left()._value
+                right = evaluate_right()._value
+                self.__check_arithmetic_types(left, right, operator, position)
+                self.__check_division_by_zero(right, operator, position)
+                return Value(function(left, right))
+
+        return evaluate
+
+    def __compile_bitwise_negation_expression(
+        self, node: BitwiseNegationExpression
+    ) -> Callable:
+        position = self.__get_position(node.offset)
+        evaluate_expression = self.__compile(node.expression)
+
+        def evaluate() -> Value:
+            value = evaluate_expression()._value
+            self.__check_boolean_types(value, True, "!", position, True)
+            return Value(not value)
+
+        return evaluate
+
+    def __compile_numeric_negation_expression(
+        self, node: NumericNegationExpression
+    ) -> Callable:
+        position = self.__get_position(node.offset)
+        evaluate_expression = self.__compile(node.expression)
+
+        def evaluate() -> Value:
+            value = evaluate_expression()._value
+            self.__check_arithmetic_types(value, 0, "-", position, True)
+            return Value(-value)
+
+        return evaluate
+
+    def __compile_type_check_expression(self, node: TypeCheckExpression) -> Callable:
+        type_name = node.type_name
+        evaluate_expression = self.__compile(node.expression)
+
+        def evaluate() -> Value:
+            return Value(evaluate_expression()._type == type_name)
+
+        return evaluate
+
+    def __compile_literal(self, node: LiteralExpression) -> Callable:
+        value = node.value
+
+        def evaluate() -> Value:
+            return Value(value)
+
+        return evaluate
+
+    def __compile_identifier_expression(self, node: IdentifierExpression) -> Callable:
+        name = node.name
+
+        def evaluate() -> any:
+            if self.is_passed_by_value:
+                return copy_value(self.current_environment.get_or_init_variable(name))
+            return self.current_environment.get_or_init_variable(name)
+
+        return evaluate
+
+    def __compile_argument(self, node: Argument) -> Callable:
+        is_passed_by_value = not node.is_reference
+        evaluate_value = self.__compile(node.value)
+
+        def evaluate() -> any:
+            self.is_passed_by_value = is_passed_by_value
+            try:
+                value = evaluate_value()
+            except ThrownError:
+                self.is_passed_by_value = False
+                raise
+            self.is_passed_by_value = False
+            return value
+
+        return evaluate
+
+    def __compile_function_call_expression(
+        self, node: FunctionCallExpression
+    ) -> Callable:
+        position = self.__get_position(node.offset)
+        name = node.name
+        arguments = [self.__compile(argument) for argument in node.arguments]
+
+        def evaluate() -> any:
+            if name == "main":
+                throw(FunctionError(position, "main function cannot be called"))
+            evaluated = [argument() for argument in arguments]
+            self.function_call_position = position
+            if len(self.call_stack) == self.max_call_stack_size:
+                throw(
+                    StackOverflowError(
+                        position,
+                        f"Maximum call stack size of {self.max_call_stack_size} exceeded",
+                    )
+                )
+            self.call_stack.append(self.current_environment)
+            runner = self.__get_runner(name)
+            if runner is None:
+                throw(FunctionError(position, f"Function {name} is not defined"))
+            result = runner(evaluated)
+            self.current_environment = self.call_stack.pop()
+            return result
+
+        return evaluate
+
+    def __compile_member_access(self, node: any) -> Callable[[any], any]:
+        position = self.__get_position(node.offset)
+        evaluate_without_target = self.__compile(node)
+        if isinstance(node, IdentifierExpression):
+            name = node.name
+
+            def access(target: any) -> any:
+                if target is None:
+                    return evaluate_without_target()
+                try:
+                    return getattr(target._value, name)
+                except AttributeError:
+                    throw(
+                        PropertyError(
+                            position,
+                            f"Class {type(target).__name__} does not have a property {name} or it's value is None",
+                        )
+                    )
+
+            return access
+        if isinstance(node, FunctionCallExpression):
+            name = node.name
+            arguments = [self.__compile(argument) for argument in node.arguments]
+
+            def access(target: any) -> any:
+                if target is None:
+                    return evaluate_without_target()
+                try:
+                    method = getattr(target._value, name)
+                    return method(*[argument() for argument in arguments])
+                except AttributeError:
+                    throw(
+                        PropertyError(
+                            position,
+                            f"Class {type(target).__name__} does not have a method {name}",
+                        )
+                    )
+
+            return access
+        return lambda target: evaluate_without_target()
+
+    def __compile_property_access_expression(
+        self, node: PropertyAccessExpression
+    ) -> Callable:
+        evaluate_left = self.__compile(node.left)
+        access = self.__compile_member_access(node.right)
+
+        def evaluate() -> any:
+            return access(evaluate_left())
+
+        return evaluate
+
+    def __compile_optional_property_access_expression(
+        self, node: OptionalPropertyAccessExpression
+    ) -> Callable:
+        evaluate_property_access = self.__compile_property_access_expression(node)
+
+        def evaluate() -> any:
+            try:
+                return evaluate_property_access()
+            except ThrownError as thrown_error:
+                if isinstance(thrown_error.value._value, PropertyError):
+                    return Value(None)
+                raise
+            except:
+                return Value(None)
+
+        return evaluate
+
+    ############################## PROGRAM ##############################
+
+    def visit(self, program: Program) -> None:
+        self.program = program
+        self.runners = {}
+        if "main" not in program.functions:
+            self.error_handler.raise_critical_error(
+                RuntimeError(Position(1, 1), "Program does not contain a main function")
+            )
+            return
+        try:
+            self.__get_runner("main")(None)
+        except ThrownError as thrown_error:
+            self.error_handler.raise_critical_error(thrown_error.value._value)
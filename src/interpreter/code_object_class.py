@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from utils.position_class import Position
+
+
+class CodeObject:
+    def __init__(self, name: str, position: Position | None = None) -> None:
+        self.name: str = name
+        self.position: Position | None = position
+        self.instructions: list[int] = []
+        self.positions: list[Position | None] = []
+        self.constants: list[any] = []
+        self.constant_indexes: dict[tuple[type, any], int] = {}
+        self.variable_names: list[str] = []
+        self.variable_slots: dict[str, int] = {}
+        self.parameters: list[tuple[int, bool, CodeObject | None]] = []
+
+    def add_constant(self, value: any) -> int:
+        key = (type(value), value)
+        if (index := self.constant_indexes.get(key)) is None:
+            index = self.constant_indexes[key] = len(self.constants)
+            self.constants.append(value)
+        return index
+
+    def add_variable(self, name: str) -> int:
+        if (slot := self.variable_slots.get(name)) is None:
+            slot = self.variable_slots[name] = len(self.variable_names)
+            self.variable_names.append(name)
+        return slot
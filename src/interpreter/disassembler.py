@@ -0,0 +1,74 @@
+from interpreter.bytecode_compiler_class import (
+    BytecodeCompiler,
+    binary_operations,
+    compound_assignments,
+)
+from interpreter.code_object_class import CodeObject
+from interpreter.opcode_enum import (
+    Opcode,
+    constant_opcodes,
+    jump_opcodes,
+    variable_opcodes,
+)
+from parser.statement_classes import FunctionDef
+from program.program_class import Program
+
+
+def describe_operand(code: CodeObject, opcode: Opcode, operand: int) -> str:
+    if opcode in jump_opcodes:
+        return f"to {operand}"
+    if opcode in constant_opcodes:
+        return repr(code.constants[operand])
+    if opcode in variable_opcodes:
+        return code.variable_names[operand]
+    if opcode == Opcode.BINARY_OPERATION:
+        return binary_operations[operand][1]
+    if opcode == Opcode.COMPOUND_ASSIGNMENT:
+        return compound_assignments[operand][1]
+    if opcode == Opcode.ARGUMENT_BEGIN:
+        return "by value" if operand else "by reference"
+    return ""
+
+
+def disassemble(code: CodeObject) -> str:
+    parameters = ", ".join(
+        f"{code.variable_names[slot]}{'?' if is_optional else ''}"
+        for slot, is_optional, _ in code.parameters
+    )
+    lines = [
+        f"Disassembly of {code.name}({parameters}):",
+        f"  constants: {code.constants}",
+        f"  variables: {code.variable_names}",
+    ]
+    jump_targets = {
+        code.instructions[index + 1]
+        for index in range(0, len(code.instructions), 2)
+        if code.instructions[index] in jump_opcodes
+    }
+    previous_line = None
+    for index in range(0, len(code.instructions), 2):
+        opcode = Opcode(code.instructions[index])
+        operand = code.instructions[index + 1]
+        position = code.positions[index // 2]
+        line = ""
+        if position is not None and position.line != previous_line:
+            line = previous_line = position.line
+        marker = ">>" if index in jump_targets else ""
+        description = describe_operand(code, opcode, operand)
+        lines.append(
+            f"{line:>6} {marker:>2} {index:>5} {opcode.name:<24} {operand:>4}"
+            + (f" ({description})" if description else "")
+        )
+    for _, _, default_code in code.parameters:
+        if default_code is not None:
+            lines += ["", disassemble(default_code)]
+    return "\n".join(lines)
+
+
+def disassemble_program(program: Program) -> str:
+    compiler = BytecodeCompiler(program)
+    return "\n\n".join(
+        disassemble(compiler.compile_function(function))
+        for function in program.functions.values()
+        if isinstance(function, FunctionDef)
+    )
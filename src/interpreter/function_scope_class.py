@@ -2,7 +2,8 @@ from interpreter.value_class import Value
 
 
 class FunctionScope:
-    def __init__(self):
+    def __init__(self, function_name: str | None = None):
+        self.function_name: str | None = function_name
         self.variables_stack: list[dict[str, any]] = [{}]
         self.loop_depth = 0
 
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import logging
 from copy import deepcopy
 from interpreter.visitor_interface import IVisitor
 from typing import TYPE_CHECKING
@@ -8,15 +9,28 @@ from interpreter.built_in_functions import *
 from interpreter.interpreter_error_classes import *
 from interpreter.function_scope_class import FunctionScope
 from utils.error_handler_class import ErrorHandler
-from parser.statement_classes import IdentifierExpression
+from parser.statement_classes import (
+    FunctionCallExpression,
+    FunctionDef,
+    IdentifierExpression,
+    LiteralExpression,
+)
+from interpreter.runtime import COMPILED_FILE_PREFIX, CompiledRuntime, ThrownError
+from parser.helpers import iterate_children
+from collections.abc import Callable
 
 if TYPE_CHECKING:
+    from interpreter.python_interpreter_class import PythonInterpreter
     from program.program_class import Program
     from parser.statement_classes import *
 
+logger = logging.getLogger(__name__)
+
 
 class Interpreter(IVisitor):
-    def __init__(self, error_handler: ErrorHandler) -> None:
+    def __init__(
+        self, error_handler: ErrorHandler, tier_up_threshold: int | None = None
+    ) -> None:
         super().__init__()
         self.result: any = None
         self.error_handler: ErrorHandler = error_handler
@@ -36,6 +50,15 @@ class Interpreter(IVisitor):
 
         self.max_call_stack_size = 100
 
+        self.tier_up_threshold: int | None = tier_up_threshold
+        self.hotness: dict[str, int] = {}
+        self.compiled_tier: PythonInterpreter | None = None
+        self.compiled_runtime: CompiledRuntime = CompiledRuntime()
+        self.compiled_functions: dict[str, Callable | None] = {}
+
+    def __get_position(self, offset: int | None) -> Position | None:
+        return self.program.line_index.get_position(offset)
+
     def __consume_result(self) -> any:
         value = self.result
         self.result = None
@@ -97,7 +120,7 @@ class Interpreter(IVisitor):
     ):
         left, right = self.__get_infix_sides(node)
         for func in check_funcs:
-            if func(left, right, operator, node.position):
+            if func(left, right, operator, self.__get_position(node.offset)):
                 return
         self.result = Value(function(left, right))
 
@@ -109,7 +132,8 @@ class Interpreter(IVisitor):
         if left == None:
             self.error_thrown = Value(
                 VariableError(
-                    node.position, f"Variable {node.variable.name} is not defined"
+                    self.__get_position(node.offset),
+                    f"Variable {node.variable.name} is not defined",
                 )
             )
             return
@@ -119,11 +143,11 @@ class Interpreter(IVisitor):
         right = self.__consume_result()
         left_val, right_val = left._value, right._value
         if self.__check_arithmetic_types(
-            left_val, right_val, operator, node.position
+            left_val, right_val, operator, self.__get_position(node.offset)
         ) or (
             check_div
             and self.__check_division_by_zero(
-                left_val, right_val, operator, node.position
+                left_val, right_val, operator, self.__get_position(node.offset)
             )
         ):
             return
@@ -146,6 +170,114 @@ class Interpreter(IVisitor):
             return
         node.right.accept(self)
 
+    def __load_function_block(self, node: FunctionDef) -> None:
+        error_count = len(self.error_handler.errors)
+        self.program.load_function_block(node.name)
+        if len(self.error_handler.errors) > error_count:
+            self.error_thrown = Value(
+                RuntimeError(
+                    self.__get_position(node.offset),
+                    f"Function {node.name} contains syntax errors",
+                )
+            )
+
+    def __count_back_edge(self) -> None:
+        if self.tier_up_threshold is not None:
+            name = self.current_environment.function_name
+            self.hotness[name] = self.hotness.get(name, 0) + 1
+
+    def __is_promotable(self, node: FunctionDef) -> bool:
+        names = {node.name}
+        pending = [node]
+        while pending:
+            function = pending.pop()
+            if function.name in self.program.block_loaders or any(
+                parameter.is_optional
+                and not isinstance(parameter.value, LiteralExpression)
+                for parameter in function.parameters
+            ):
+                return False
+            nodes = [function.block]
+            while nodes:
+                child = nodes.pop()
+                nodes.extend(iterate_children(child))
+                if not isinstance(child, FunctionCallExpression):
+                    continue
+                if any(
+                    not isinstance(
+                        argument.value, (LiteralExpression, IdentifierExpression)
+                    )
+                    for argument in child.arguments
+                ):
+                    return False
+                if child.name not in names and isinstance(
+                    callee := self.program.functions.get(child.name), FunctionDef
+                ):
+                    names.add(child.name)
+                    pending.append(callee)
+        return True
+
+    def __get_compiled_function(self, node: FunctionDef) -> Callable | None:
+        if node.name in self.compiled_functions:
+            return self.compiled_functions[node.name]
+        hotness = self.hotness[node.name] = self.hotness.get(node.name, 0) + 1
+        if hotness < self.tier_up_threshold:
+            return None
+        if not self.__is_promotable(node):
+            self.compiled_functions[node.name] = None
+            return None
+        if self.compiled_tier is None:
+            from interpreter.python_interpreter_class import PythonInterpreter
+
+            self.compiled_tier = PythonInterpreter(self.error_handler)
+            self.compiled_tier.max_call_stack_size = self.max_call_stack_size
+            self.compiled_tier.prepare(self.program)
+        function = self.compiled_functions[node.name] = (
+            self.compiled_tier.load_function(node.name)
+        )
+        logger.debug(
+            "Function %s promoted to compiled tier after %d calls and loop iterations",
+            node.name,
+            hotness,
+        )
+        return function
+
+    def __run_compiled(self, node: FunctionDef, function: Callable) -> None:
+        args = self.__consume_result() or []
+        if len(args) > len(node.parameters):
+            self.error_thrown = Value(
+                ArgumentError(
+                    self.__get_position(node.offset),
+                    f"Function {node.name} takes {len(node.parameters)} arguments, {len(args)} given",
+                )
+            )
+            return
+        runtime = self.compiled_runtime
+        runtime.is_passed_by_value = self.is_passed_by_value
+        runtime.error_position = self.error_position
+        try:
+            self.result = function(
+                runtime, len(self.call_stack), self.function_call_position, *args
+            )
+        except ThrownError as thrown_error:
+            self.error_thrown = thrown_error.value
+            self.__extend_call_stack(thrown_error)
+        self.is_passed_by_value = runtime.is_passed_by_value
+        self.error_position = runtime.error_position
+
+    def __extend_call_stack(self, thrown_error: ThrownError) -> None:
+        depth = len(self.call_stack)
+        traceback = thrown_error.__traceback__
+        while traceback is not None:
+            frame = traceback.tb_frame
+            if frame.f_code.co_filename.startswith(COMPILED_FILE_PREFIX):
+                depth = frame.f_locals["depth"]
+            traceback = traceback.tb_next
+        depth = min(depth, self.max_call_stack_size)
+        self.call_stack.extend(
+            [self.current_environment] * (depth - len(self.call_stack))
+        )
+
     def _visit_program(self, node: Program):
         self.program = node
         if function := node.functions.get("main"):
@@ -175,21 +307,30 @@ class Interpreter(IVisitor):
         self.result = Value(node.execute(arguments))
 
     def _visit_function_definition(self, node: FunctionDef):
+        if node.name in self.program.block_loaders:
+            self.__load_function_block(node)
+            if self.error_thrown:
+                return
         if node.name == "main" and len(node.parameters) > 0:
             self.error_thrown = Value(
                 ArgumentError(
-                    node.position,
+                    self.__get_position(node.offset),
                     "Main function cannot take any arguments",
                 )
             )
             return
-        new_env = FunctionScope()
+        if self.tier_up_threshold is not None and (
+            function := self.__get_compiled_function(node)
+        ):
+            self.__run_compiled(node, function)
+            return
+        new_env = FunctionScope(node.name)
         args = self.__consume_result()
         if args != None:
             if len(args) > len(node.parameters):
                 self.error_thrown = Value(
                     ArgumentError(
-                        node.position,
+                        self.__get_position(node.offset),
                         f"Function {node.name} takes {len(node.parameters)} arguments, {len(args)} given",
                     )
                 )
@@ -198,7 +339,7 @@ class Interpreter(IVisitor):
                 if not param.is_optional and value is None:
                     self.error_thrown = Value(
                         ArgumentError(
-                            node.position,
+                            self.__get_position(node.offset),
                             f"Parameter {param.name} is not optional",
                         )
                     )
@@ -311,14 +452,18 @@ class Interpreter(IVisitor):
     def _visit_bitwise_negation_expression(self, node: BitwiseNegationExpression):
         node.expression.accept(self)
         value = self.__consume_result()
-        if self.__check_boolean_types(value._value, True, "!", node.position, True):
+        if self.__check_boolean_types(
+            value._value, True, "!", self.__get_position(node.offset), True
+        ):
             return
         self.result = Value(not value._value)
 
     def _visit_numeric_negation_expression(self, node: NumericNegationExpression):
         node.expression.accept(self)
         value = self.__consume_result()
-        if self.__check_arithmetic_types(value._value, 0, "-", node.position, True):
+        if self.__check_arithmetic_types(
+            value._value, 0, "-", self.__get_position(node.offset), True
+        ):
             return
         self.result = Value(-value._value)
 
@@ -349,7 +494,7 @@ class Interpreter(IVisitor):
             except AttributeError:
                 self.error_thrown = Value(
                     PropertyError(
-                        node.position,
+                        self.__get_position(node.offset),
                         f"Class {type(self.result).__name__} does not have a property {node.name} or it's value is None",
                     )
                 )
@@ -370,7 +515,7 @@ class Interpreter(IVisitor):
             except AttributeError:
                 self.error_thrown = Value(
                     PropertyError(
-                        node.position,
+                        self.__get_position(node.offset),
                         f"Class {type(built_in_class).__name__} does not have a method {node.name}",
                     )
                 )
@@ -378,17 +523,17 @@ class Interpreter(IVisitor):
             if node.name == "main":
                 self.error_thrown = Value(
                     FunctionError(
-                        node.position,
+                        self.__get_position(node.offset),
                         "main function cannot be called",
                     )
                 )
                 return
             self.result = self.__evaluate_arguments(node.arguments)
-            self.function_call_position = node.position
+            self.function_call_position = self.__get_position(node.offset)
             if len(self.call_stack) == self.max_call_stack_size:
                 self.error_thrown = Value(
                     StackOverflowError(
-                        node.position,
+                        self.__get_position(node.offset),
                         f"Maximum call stack size of {self.max_call_stack_size} exceeded",
                     )
                 )
@@ -399,7 +544,7 @@ class Interpreter(IVisitor):
             else:
                 self.error_thrown = Value(
                     FunctionError(
-                        node.position,
+                        self.__get_position(node.offset),
                         f"Function {node.name} is not defined",
                     )
                 )
@@ -450,6 +595,7 @@ class Interpreter(IVisitor):
             if not self.__consume_result()._value:
                 break
             node.block.accept(self)
+            self.__count_back_edge()
             if self.break_called:
                 self.break_called = False
                 break
@@ -468,7 +614,7 @@ class Interpreter(IVisitor):
         ):
             self.error_thrown = Value(
                 VariableError(
-                    node.position,
+                    self.__get_position(node.offset),
                     f"Cannot use {node.variable.name} as iterator because it's defined as loop",
                 )
             )
@@ -478,7 +624,7 @@ class Interpreter(IVisitor):
             if node.variable.name in variables:
                 self.error_thrown = Value(
                     VariableError(
-                        node.position,
+                        self.__get_position(node.offset),
                         f"Variable {node.variable.name} is already defined in this scope",
                     )
                 )
@@ -489,12 +635,16 @@ class Interpreter(IVisitor):
         iterable = deepcopy(self.__consume_result()._value)
         if not isinstance(iterable, Array):
             self.error_thrown = Value(
-                TypeError(node.position, "For loop can only iterate over array")
+                TypeError(
+                    self.__get_position(node.offset),
+                    "For loop can only iterate over array",
+                )
             )
             return
         for item in iterable._value:
             self.result = {node.variable.name: item}
             node.block.accept(self)
+            self.__count_back_edge()
             if self.break_called:
                 self.break_called = False
                 break
@@ -559,7 +709,7 @@ class Interpreter(IVisitor):
                     if error_type.name not in self.program.functions:
                         self.error_thrown = Value(
                             TypeError(
-                                node.position,
+                                self.__get_position(node.offset),
                                 f"Unknown error type {error_type.name}",
                             )
                         )
@@ -575,12 +725,15 @@ class Interpreter(IVisitor):
                         return
 
     def _visit_throw_statement(self, node: ThrowStatement):
-        self.error_position = node.position
+        self.error_position = self.__get_position(node.offset)
         node.expression.accept(self)
         self.error_thrown = self.__consume_result()
         if not isinstance(self.error_thrown._value, Error):
             self.error_thrown = Value(
-                TypeError(node.position, "Throw statement can only throw error")
+                TypeError(
+                    self.__get_position(node.offset),
+                    "Throw statement can only throw error",
+                )
             )
         self.error_position = None
 
@@ -588,7 +741,7 @@ class Interpreter(IVisitor):
         if self.current_environment.loop_depth == 0:
             self.error_thrown = Value(
                 ExpressionError(
-                    node.position,
+                    self.__get_position(node.offset),
                     "break statement can only be used in loop",
                 )
             )
@@ -598,7 +751,7 @@ class Interpreter(IVisitor):
         if self.current_environment.loop_depth == 0:
             self.error_thrown = Value(
                 ExpressionError(
-                    node.position,
+                    self.__get_position(node.offset),
                     "continue statement can only be used in loop",
                 )
             )
@@ -0,0 +1,100 @@
+from enum import IntEnum, auto
+
+
+class Opcode(IntEnum):
+    @staticmethod
+    def _generate_next_value_(name, start, count, last_values):
+        return count
+
+    # --- Stack ---
+    LOAD_CONST = auto()
+    LOAD_NONE = auto()
+    POP = auto()
+    DUP_TOP = auto()
+
+    # --- Variables ---
+    LOAD_VARIABLE = auto()
+    LOAD_PENDING_VARIABLE = auto()
+    LOAD_CALLER_VARIABLE = auto()
+    STORE_VARIABLE = auto()
+    STORE_TARGET = auto()
+    BIND_VARIABLE = auto()
+    ENTER_SCOPE = auto()
+    EXIT_SCOPE = auto()
+
+    # --- Expressions ---
+    BINARY_OPERATION = auto()
+    UNARY_NOT = auto()
+    UNARY_NEGATIVE = auto()
+    TYPE_CHECK = auto()
+    CHECK_DEFINED = auto()
+    COMPOUND_ASSIGNMENT = auto()
+    LOAD_PROPERTY = auto()
+    LOAD_METHOD = auto()
+    CALL_METHOD = auto()
+
+    # --- Functions ---
+    ARGUMENT_BEGIN = auto()
+    ARGUMENT_END = auto()
+    CALL_FUNCTION = auto()
+    RETURN_VALUE = auto()
+    RETURN_EXPRESSION = auto()
+
+    # --- Control flow ---
+    JUMP = auto()
+    POP_JUMP_IF_FALSE = auto()
+    POP_JUMP_IF_TRUE = auto()
+    POP_OR_JUMP_IF_EXITING = auto()
+    SET_RETURN = auto()
+    BREAK = auto()
+    CONTINUE = auto()
+    LOOP_ENTER = auto()
+    LOOP_EXIT = auto()
+    LOOP_FLAGS = auto()
+    FOR_CHECK = auto()
+    GET_ITERATOR = auto()
+    FOR_ITER = auto()
+    POP_ITERATOR = auto()
+
+    # --- Errors ---
+    SETUP_TRY = auto()
+    SETUP_OPTIONAL = auto()
+    POP_HANDLER = auto()
+    MATCH_ERROR_TYPE = auto()
+    RERAISE = auto()
+    RAISE_ERROR = auto()
+    SET_ERROR_POSITION = auto()
+    THROW = auto()
+
+
+jump_opcodes: set[Opcode] = {
+    Opcode.JUMP,
+    Opcode.POP_JUMP_IF_FALSE,
+    Opcode.POP_JUMP_IF_TRUE,
+    Opcode.POP_OR_JUMP_IF_EXITING,
+    Opcode.LOOP_FLAGS,
+    Opcode.FOR_ITER,
+    Opcode.SETUP_TRY,
+    Opcode.SETUP_OPTIONAL,
+}
+
+constant_opcodes: set[Opcode] = {
+    Opcode.LOAD_CONST,
+    Opcode.LOAD_CALLER_VARIABLE,
+    Opcode.TYPE_CHECK,
+    Opcode.CHECK_DEFINED,
+    Opcode.LOAD_PROPERTY,
+    Opcode.LOAD_METHOD,
+    Opcode.CALL_METHOD,
+    Opcode.CALL_FUNCTION,
+    Opcode.MATCH_ERROR_TYPE,
+    Opcode.RAISE_ERROR,
+}
+
+variable_opcodes: set[Opcode] = {
+    Opcode.LOAD_VARIABLE,
+    Opcode.LOAD_PENDING_VARIABLE,
+    Opcode.STORE_VARIABLE,
+    Opcode.BIND_VARIABLE,
+    Opcode.FOR_CHECK,
+}
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import linecache
+from collections.abc import Callable
+from copy import deepcopy
+
+from interpreter.built_in_classes import Array
+from interpreter.closure_interpreter_class import (
+    copy_value,
+    error_classes,
+    is_number,
+    number_types,
+)
+from interpreter.interpreter_error_classes import *
+from interpreter.python_transpiler_class import PythonTranspiler, function_variable
+from interpreter.runtime import (
+    COMPILED_FILE_PREFIX,
+    CompiledRuntime,
+    ThrownError,
+    throw,
+)
+from interpreter.value_class import Value
+from parser.statement_classes import FunctionDef
+from program.program_class import Program
+from utils.error_handler_class import ErrorHandler
+from utils.position_class import Position
+
+
+def arithmetic_error(
+    left: any, right: any, operator: str, position: Position, one_side=False
+) -> None:
+    throw(
+        TypeError(
+            position,
+            f"Cannot apply operator {operator} to given values: {left}{f' and {right}' if not one_side else ''}",
+        )
+    )
+
+
+def boolean_error(
+    left: any, right: any, operator: str, position: Position, one_side=False
+) -> None:
+    arithmetic_error(left, right, operator, position, one_side)
+
+
+def division_error(left: any, right: any, operator: str, position: Position) -> None:
+    if not is_number(left) or not is_number(right):
+        arithmetic_error(left, right, operator, position)
+    throw(ValueError(position, f"Cannot apply operator {operator} if right side is 0."))
+
+
+def get_property(target: any, name: str, position: Position) -> any:
+    try:
+        return getattr(target._value, name)
+    except AttributeError:
+        throw(
+            PropertyError(
+                position,
+                f"Class {type(target).__name__} does not have a property {name} or it's value is None",
+            )
+        )
+
+
+def method_error(target: any, name: str, position: Position) -> None:
+    throw(
+        PropertyError(
+            position, f"Class {type(target).__name__} does not have a method {name}"
+        )
+    )
+
+
+runtime_namespace: dict[str, any] = {
+    **error_classes,
+    "Array": Array,
+    "ThrownError": ThrownError,
+    "Value": Value,
+    "arithmetic_error": arithmetic_error,
+    "boolean_error": boolean_error,
+    "copy_value": copy_value,
+    "deepcopy": deepcopy,
+    "division_error": division_error,
+    "get_property": get_property,
+    "method_error": method_error,
+    "number_types": number_types,
+    "throw": throw,
+}
+
+
+class PythonInterpreter(CompiledRuntime):
+    def __init__(self, error_handler: ErrorHandler) -> None:
+        super().__init__()
+        self.error_handler: ErrorHandler = error_handler
+        self.program: Program | None = None
+        self.transpiler: PythonTranspiler | None = None
+        self.namespace: dict[str, any] = {}
+        self.sources: dict[str, str] = {}
+
+        self.max_call_stack_size = 100
+
+    ############################## FUNCTIONS ##############################
+
+    def __create_stub(self, name: str) -> Callable:
+        def stub(
+            runtime: CompiledRuntime,
+            depth: int,
+            position: Position | None,
+            *arguments: any,
+        ) -> any:
+            if depth > self.max_call_stack_size:
+                throw(
+                    StackOverflowError(
+                        position,
+                        f"Maximum call stack size of {self.max_call_stack_size} exceeded",
+                    )
+                )
+            return self.load_function(name)(runtime, depth, position, *arguments)
+
+        return stub
+
+    def load_function(self, name: str) -> Callable:
+        if name in self.sources:
+            return self.namespace[function_variable(name)]
+        node = self.program.functions[name]
+        if name in self.program.block_loaders:
+            self.__load_function_block(node)
+        source = self.transpiler.transpile_function(node)
+        file_name = f"{COMPILED_FILE_PREFIX}{name}>"
+        linecache.cache[file_name] = (
+            len(source),
+            None,
+            source.splitlines(True),
+            file_name,
+        )
+        self.namespace.update(self.transpiler.constants)
+        exec(compile(source, file_name, "exec"), self.namespace)
+        self.sources[name] = source
+        return self.namespace[function_variable(name)]
+
+    def __load_function_block(self, node: FunctionDef) -> None:
+        error_count = len(self.error_handler.errors)
+        self.program.load_function_block(node.name)
+        if len(self.error_handler.errors) > error_count:
+            throw(
+                RuntimeError(
+                    self.program.line_index.get_position(node.offset),
+                    f"Function {node.name} contains syntax errors",
+                )
+            )
+
+    ############################## PROGRAM ##############################
+
+    def prepare(self, program: Program) -> None:
+        self.program = program
+        self.transpiler = PythonTranspiler(program, self.max_call_stack_size)
+        self.sources = {}
+        self.namespace = {**runtime_namespace, "load_function": self.load_function}
+        for name, function in program.functions.items():
+            if isinstance(function, FunctionDef):
+                self.namespace[function_variable(name)] = self.__create_stub(name)
+
+    def visit(self, program: Program) -> None:
+        self.prepare(program)
+        if "main" not in program.functions:
+            self.error_handler.raise_critical_error(
+                RuntimeError(Position(1, 1), "Program does not contain a main function")
+            )
+            return
+        try:
+            main = self.load_function("main")
+            node = program.functions["main"]
+            if node.parameters:
+                throw(
+                    ArgumentError(
+                        program.line_index.get_position(node.offset),
+                        "Main function cannot take any arguments",
+                    )
+                )
+            main(self, 0, None)
+        except ThrownError as thrown_error:
+            self.error_handler.raise_critical_error(thrown_error.value._value)
@@ -0,0 +1,1156 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+
+from interpreter.built_in_functions import ErrorConstructor
+from interpreter.closure_interpreter_class import (
+    ARITHMETIC_CHECK,
+    BOOLEAN_CHECK,
+    DIVISION_CHECK,
+    assignment_operations,
+    error_classes,
+    infix_operations,
+    leaf_classes,
+)
+from parser.helpers import iterate_children
+from parser.statement_classes import *
+from program.program_class import Program
+
+VALUE = "value"
+RAW = "raw"
+
+number_literal_classes: tuple[type, ...] = (IntegerLiteral, FloatLiteral)
+boolean_literal_classes: tuple[type, ...] = (BooleanLiteral,)
+error_functions: dict[str, str] = {
+    ARITHMETIC_CHECK: "arithmetic_error",
+    DIVISION_CHECK: "division_error",
+    BOOLEAN_CHECK: "boolean_error",
+}
+flag_statement_classes: tuple[type, ...] = (
+    ReturnStatement,
+    BreakStatement,
+    ContinueStatement,
+    TryCatchStatement,
+)
+
+
+def python_name(prefix: str, name: str) -> str:
+    if name.isascii():
+        return f"{prefix}_{name}"
+    return f"{prefix}x_{name.encode().hex()}"
+
+
+def local_variable(name: str) -> str:
+    return python_name("v", name)
+
+
+def function_variable(name: str) -> str:
+    return python_name("f", name)
+
+
+class PythonTranspiler:
+    def __init__(self, program: Program, max_call_stack_size: int = 100) -> None:
+        self.program: Program = program
+        self.max_call_stack_size: int = max_call_stack_size
+        self.constants: dict[str, any] = {}
+        self.constant_names: dict[tuple[type, any], str] = {}
+
+        self.lines: list[str] = []
+        self.indent: int = 0
+        self.temporary_count: int = 0
+        self.pure_expressions: set[str] = set()
+        self.defined: set[str] = set()
+        self.loops: list[tuple[str, list[str]]] = []
+        self.depth: str = "depth"
+        self.pending_result: str | None = None
+        self.inlined_defaults: set[str] = set()
+
+        self.passed_by_value: bool | None = None
+        self.runtime_passed_by_value: bool | None = None
+
+        self.statement_compilers: dict[type, Callable[[any, bool], str | None]] = {
+            IfStatement: self.__compile_if_statement,
+            WhileStatement: self.__compile_while_statement,
+            ForStatement: self.__compile_for_statement,
+            ReturnStatement: self.__compile_return_statement,
+            AssignmentStatement: self.__compile_assignment_statement,
+            TryCatchStatement: self.__compile_try_catch_statement,
+            ThrowStatement: self.__compile_throw_statement,
+            BreakStatement: self.__compile_break_statement,
+            ContinueStatement: self.__compile_continue_statement,
+        }
+        for node_class in assignment_operations:
+            self.statement_compilers[node_class] = self.__compile_arithmetic_assignment
+
+        self.expression_compilers: dict[type, Callable[[any, str], str]] = {
+            BitwiseNegationExpression: self.__compile_bitwise_negation_expression,
+            NumericNegationExpression: self.__compile_numeric_negation_expression,
+            TypeCheckExpression: self.__compile_type_check_expression,
+            IdentifierExpression: self.__compile_identifier_expression,
+            FunctionCallExpression: self.__compile_function_call_expression,
+            PropertyAccessExpression: self.__compile_property_access_expression,
+            OptionalPropertyAccessExpression: (
+                self.__compile_optional_property_access_expression
+            ),
+            Argument: self.__compile_argument,
+        }
+        for node_class in infix_operations:
+            self.expression_compilers[node_class] = self.__compile_infix_expression
+        for node_class in [
+            NullLiteral,
+            IntegerLiteral,
+            FloatLiteral,
+            StringLiteral,
+            BooleanLiteral,
+            FalseLiteral,
+            TrueLiteral,
+        ]:
+            self.expression_compilers[node_class] = self.__compile_literal
+
+    ############################## HELPERS ##############################
+
+    def __emit(self, line: str) -> None:
+        self.lines.append("    " * self.indent + line)
+
+    def __new_temporary(self, prefix: str = "t") -> str:
+        self.temporary_count += 1
+        return f"{prefix}{self.temporary_count}"
+
+    def __constant(self, value: any, key: tuple) -> str:
+        if (name := self.constant_names.get(key)) is None:
+            name = self.constant_names[key] = f"k{len(self.constant_names)}"
+            self.constants[name] = value
+        return name
+
+    def __position(self, offset: int | None) -> str:
+        return self.__constant(
+            self.program.line_index.get_position(offset), ("position", offset)
+        )
+
+    def __pure(self, expression: str) -> str:
+        self.pure_expressions.add(expression)
+        return expression
+
+    def __is_stable(self, expression: str) -> bool:
+        return expression.isidentifier() or expression in self.pure_expressions
+
+    def __spill(self, expression: str) -> str:
+        if self.__is_stable(expression):
+            return expression
+        temporary = self.__new_temporary()
+        self.__emit(f"{temporary} = {expression}")
+        return temporary
+
+    def __compile_operands(self, operands: list[Callable[[], str]]) -> list[str]:
+        expressions: list[str] = []
+        marks: list[int] = []
+        for compile_operand in operands:
+            start = len(self.lines)
+            expression = compile_operand()
+            if len(self.lines) > start:
+                inserted = 0
+                for index, previous in enumerate(expressions):
+                    if self.__is_stable(previous):
+                        continue
+                    temporary = self.__new_temporary()
+                    self.lines.insert(
+                        marks[index] + inserted,
+                        "    " * self.indent + f"{temporary} = {previous}",
+                    )
+                    inserted += 1
+                    expressions[index] = temporary
+            expressions.append(expression)
+            marks.append(len(self.lines))
+        return expressions
+
+    def __throw(self, error_class: str, position: str, message: str) -> None:
+        self.__emit(f"throw({error_class}({position}, {message!r}))")
+
+    def __emit_overflow_check(self, position: str, comparison: str) -> None:
+        self.__emit(f"if {self.depth} {comparison} {self.max_call_stack_size}:")
+        self.indent += 1
+        self.__throw(
+            "StackOverflowError",
+            position,
+            f"Maximum call stack size of {self.max_call_stack_size} exceeded",
+        )
+        self.indent -= 1
+
+    ############################## ANALYSIS ##############################
+
+    def __is_user_function(self, name: str) -> bool:
+        function = self.program.functions.get(name)
+        return name != "main" and isinstance(function, FunctionDef)
+
+    def __computed_defaults(self, name: str) -> list[IExpression]:
+        return [
+            parameter.value
+            for parameter in self.program.functions[name].parameters
+            if parameter.is_optional
+            and not isinstance(parameter.value, LiteralExpression)
+        ]
+
+    def __iterate_nodes(
+        self, node: any, expanded: frozenset[str] = frozenset()
+    ) -> Iterator[any]:
+        yield node
+        if (
+            isinstance(node, FunctionCallExpression)
+            and node.name not in expanded
+            and self.__is_user_function(node.name)
+        ):
+            for default in self.__computed_defaults(node.name):
+                yield from self.__iterate_nodes(default, expanded | {node.name})
+        for child in iterate_children(node):
+            yield from self.__iterate_nodes(child, expanded)
+
+    def __collect_names(self, node: any) -> set[str]:
+        return {
+            child.name
+            for child in self.__iterate_nodes(node)
+            if isinstance(child, IdentifierExpression)
+        }
+
+    def __contains_user_call(self, node: any) -> bool:
+        return any(
+            isinstance(child, FunctionCallExpression)
+            and self.__is_user_function(child.name)
+            for child in self.__iterate_nodes(node)
+        )
+
+    def __contains_argument(self, node: any) -> bool:
+        return any(isinstance(child, Argument) for child in self.__iterate_nodes(node))
+
+    def __may_set_flags(self, node: any) -> bool:
+        return any(
+            isinstance(child, flag_statement_classes)
+            or isinstance(child, FunctionCallExpression)
+            and self.__is_user_function(child.name)
+            for child in self.__iterate_nodes(node)
+        )
+
+    def __may_be_none(self, node: any) -> bool:
+        if isinstance(node, FunctionCallExpression):
+            return self.__is_user_function(node.name)
+        return isinstance(node, PropertyAccessExpression)
+
+    def __read_names(self, node: any) -> set[str]:
+        if isinstance(node, IdentifierExpression):
+            return {node.name}
+        if isinstance(node, OptionalPropertyAccessExpression):
+            return set()
+        if isinstance(node, PropertyAccessExpression):
+            return self.__read_names(node.left)
+        if isinstance(node, InfixExpression):
+            return self.__read_names(node.left) | self.__read_names(node.right)
+        if isinstance(node, (BitwiseNegationExpression, NumericNegationExpression)):
+            return self.__read_names(node.expression)
+        if isinstance(node, TypeCheckExpression):
+            return self.__read_names(node.expression)
+        if isinstance(node, FunctionCallExpression):
+            return set().union(*map(self.__read_names, node.arguments))
+        if isinstance(node, Argument):
+            return self.__read_names(node.value)
+        return set()
+
+    def __defined_names(self, node: IStatement) -> set[str]:
+        if isinstance(node, AssignmentStatement):
+            names = self.__read_names(node.expression)
+            if isinstance(node.variable, IdentifierExpression):
+                names.add(node.variable.name)
+            return names
+        if isinstance(node, (ReturnStatement, ThrowStatement)):
+            return self.__read_names(node.expression) if node.expression else set()
+        if isinstance(node, IfStatement):
+            return self.__read_names(node.condition)
+        if isinstance(node, IExpression):
+            return self.__read_names(node)
+        return set()
+
+    ############################## PASSING MODE ##############################
+
+    def __get_state(self) -> tuple[bool | None, bool | None]:
+        return self.passed_by_value, self.runtime_passed_by_value
+
+    def __set_state(self, state: tuple[bool | None, bool | None]) -> None:
+        self.passed_by_value, self.runtime_passed_by_value = state
+
+    def __merge_states(self, states: list[tuple[bool | None, bool | None]]) -> None:
+        semantic = {state[0] for state in states}
+        runtime = {state[1] for state in states}
+        self.passed_by_value = semantic.pop() if len(semantic) == 1 else None
+        self.runtime_passed_by_value = runtime.pop() if len(runtime) == 1 else None
+
+    def __needs_synchronization(self) -> bool:
+        return (
+            self.passed_by_value is not None
+            and self.runtime_passed_by_value is not self.passed_by_value
+        )
+
+    def __synchronize(self) -> None:
+        if self.__needs_synchronization():
+            self.__emit(f"self.is_passed_by_value = {self.passed_by_value}")
+            self.runtime_passed_by_value = self.passed_by_value
+
+    def __synchronized(self, expression: str) -> str:
+        if self.__needs_synchronization():
+            expression = self.__spill(expression)
+            self.__synchronize()
+        return expression
+
+    def __save_state(self, node: any) -> str | None:
+        if not (self.__contains_argument(node) or self.__contains_user_call(node)):
+            return None
+        if self.passed_by_value is not None:
+            return str(self.passed_by_value)
+        saved = self.__new_temporary("p")
+        self.__emit(f"{saved} = self.is_passed_by_value")
+        return saved
+
+    def __restore_state(
+        self, saved: str | None, state: tuple[bool | None, bool | None]
+    ) -> None:
+        if saved is not None:
+            self.__emit(f"self.is_passed_by_value = {saved}")
+            if state[0] is not None:
+                state = (state[0], state[0])
+        self.__set_state(state)
+
+    ############################## FUNCTIONS ##############################
+
+    def transpile_function(self, node: FunctionDef) -> str:
+        self.lines = []
+        self.indent = 1
+        self.temporary_count = 0
+        self.loops = []
+        self.defined = {parameter.name for parameter in node.parameters}
+        state = (
+            False
+            if node.name == "main"
+            or any(not parameter.is_optional for parameter in node.parameters)
+            else None
+        )
+        self.__set_state((state, state))
+        position = self.__position(node.offset)
+        parameters = "".join(
+            f", {local_variable(parameter.name)}=None" for parameter in node.parameters
+        )
+        self.__emit_overflow_check("position", ">")
+        for parameter in node.parameters:
+            variable = local_variable(parameter.name)
+            if not parameter.is_optional:
+                self.__emit(f"if {variable} is None:")
+                self.indent += 1
+                self.__throw(
+                    "ArgumentError",
+                    position,
+                    f"Parameter {parameter.name} is not optional",
+                )
+                self.indent -= 1
+            elif isinstance(parameter.value, LiteralExpression):
+                self.__emit(f"if {variable} is None:")
+                self.__emit(f"    {variable} = Value({parameter.value.value!r})")
+        if names := sorted(self.__collect_names(node.block) - self.defined):
+            self.__emit(" = ".join(map(local_variable, names)) + " = None")
+        if self.__compile_block(node.block, True, is_scoped=False)[1]:
+            if not node.block.statements:
+                self.__emit("self.return_called = False")
+            self.__emit("return None")
+        function = function_variable(node.name)
+        header = f"def {function}(self, depth, position{parameters}):"
+        return "\n".join([header, *self.lines])
+
+    def __compile_block(
+        self,
+        node: BlockStatement,
+        is_sensitive: bool,
+        loop_result: str | None = None,
+        binding: tuple[str, str] | None = None,
+        fresh: frozenset[str] = frozenset(),
+        is_scoped: bool = True,
+    ) -> tuple[list[str], bool]:
+        defined = self.defined
+        names = self.__collect_names(node) | fresh if is_scoped else set()
+        if binding is not None:
+            names.add(binding[0])
+        resets = []
+        for name in sorted(names - defined):
+            if name in fresh:
+                resets.append(f"{local_variable(name)} = None")
+                continue
+            flag = self.__new_temporary("u")
+            self.__emit(f"{flag} = {local_variable(name)} is None")
+            resets.append(f"if {flag}: {local_variable(name)} = None")
+            if binding is not None and binding[0] == name:
+                self.__emit(f"if {flag}: {local_variable(name)} = {binding[1]}")
+        self.defined = defined | fresh
+        if binding is not None:
+            self.defined.add(binding[0])
+        if loop_result is not None:
+            self.loops.append((loop_result, resets))
+        is_reachable = True
+        for statement in node.statements:
+            is_checked = is_sensitive or self.__may_set_flags(statement)
+            value = self.__compile_statement(statement, is_sensitive, is_checked)
+            if value is None:
+                is_reachable = False
+                break
+            self.__synchronize()
+            if is_checked:
+                self.__emit_exit_check(value)
+                is_sensitive = False
+            self.defined |= self.__defined_names(statement)
+        if loop_result is not None:
+            self.loops.pop()
+        self.defined = defined
+        if is_reachable:
+            for reset in resets:
+                self.__emit(reset)
+        return resets, is_reachable
+
+    ############################## CONTROL FLOW ##############################
+
+    def __emit_exit_check(self, value: str) -> None:
+        if not self.loops:
+            self.__emit("if self.return_called:")
+            self.__emit("    self.return_called = False")
+            self.__emit(f"    return {value}")
+            return
+        self.__emit(
+            "if self.return_called or self.break_called or self.continue_called:"
+        )
+        self.indent += 1
+        self.__emit_loop_exit(value)
+        self.indent -= 1
+
+    def __emit_loop_exit(self, value: str) -> None:
+        result, resets = self.loops[-1]
+        self.__emit(f"{result} = {value}")
+        for reset in resets:
+            self.__emit(reset)
+        self.__emit("if self.break_called:")
+        self.__emit("    self.break_called = False")
+        self.__emit("    break")
+        self.__emit("self.continue_called = False")
+        self.__emit("continue")
+
+    def __emit_jump(self, value: str, jump: str) -> None:
+        result, resets = self.loops[-1]
+        self.__emit(f"{result} = {value}")
+        for reset in resets:
+            self.__emit(reset)
+        self.__emit(jump)
+
+    ############################## STATEMENTS ##############################
+
+    def __compile_nested_block(
+        self, node: BlockStatement, is_sensitive: bool, **options: any
+    ) -> tuple[list[str], bool]:
+        self.indent += 1
+        start = len(self.lines)
+        result = self.__compile_block(node, is_sensitive, **options)
+        if len(self.lines) == start:
+            self.__emit("pass")
+        self.indent -= 1
+        return result
+
+    def __compile_statement(
+        self, node: IStatement, is_sensitive: bool, is_checked: bool
+    ) -> str | None:
+        if compiler := self.statement_compilers.get(type(node)):
+            return compiler(node, is_sensitive)
+        expression = self.__compile_expression(node, VALUE)
+        if is_checked:
+            return self.__spill(expression)
+        if not self.__is_stable(expression):
+            self.__emit(expression)
+        return "None"
+
+    def __compile_if_statement(self, node: IfStatement, is_sensitive: bool) -> str:
+        states = []
+        closing_indent = self.indent
+        for index, branch in enumerate([node, *node.elif_statements]):
+            is_sensitive = is_sensitive or self.__contains_user_call(branch.condition)
+            if index == 0:
+                condition = self.__synchronized(
+                    self.__compile_expression(branch.condition, RAW)
+                )
+                self.__emit(f"if {condition}:")
+            else:
+                self.__emit("else:")
+                self.indent += 1
+                start = len(self.lines)
+                condition = self.__synchronized(
+                    self.__compile_expression(branch.condition, RAW)
+                )
+                if len(self.lines) == start:
+                    self.lines.pop()
+                    self.indent -= 1
+                    self.__emit(f"elif {condition}:")
+                else:
+                    self.__emit(f"if {condition}:")
+            state = self.__get_state()
+            if self.__compile_nested_block(branch.block, is_sensitive)[1]:
+                states.append(self.__get_state())
+            self.__set_state(state)
+        if node.else_statement is not None:
+            self.__emit("else:")
+            if self.__compile_nested_block(node.else_statement, is_sensitive)[1]:
+                states.append(self.__get_state())
+        else:
+            states.append(self.__get_state())
+        self.indent = closing_indent
+        if states:
+            self.__merge_states(states)
+        return "None"
+
+    def __enter_loop(self) -> tuple[bool | None, bool | None]:
+        self.__synchronize()
+        state = (False, False) if self.passed_by_value is False else (None, None)
+        self.__set_state(state)
+        return state
+
+    def __emit_flag_consumption(self) -> None:
+        self.__emit("if self.break_called:")
+        self.__emit("    self.break_called = False")
+        self.__emit("    break")
+        self.__emit("self.continue_called = False")
+
+    def __compile_while_statement(self, node: WhileStatement, _: bool) -> str:
+        result = self.__new_temporary("w")
+        state = self.__enter_loop()
+        self.__emit(f"{result} = None")
+        self.__emit("while True:")
+        self.indent += 1
+        self.pending_result = result
+        condition = self.__synchronized(self.__compile_expression(node.condition, RAW))
+        self.pending_result = None
+        self.__emit(f"if not {condition}:")
+        self.__emit(f"    {result} = None")
+        self.__emit("    break")
+        if not node.block.statements:
+            self.__emit_flag_consumption()
+        elif self.__compile_block(node.block, True, loop_result=result)[1]:
+            self.__emit(f"{result} = None")
+        self.indent -= 1
+        self.__set_state(state)
+        return result
+
+    def __compile_for_statement(self, node: ForStatement, _: bool) -> str:
+        position = self.__position(node.offset)
+        name = node.variable.name
+        if (
+            isinstance(node.iterable, IdentifierExpression)
+            and node.iterable.name == name
+        ):
+            self.__throw(
+                "VariableError",
+                position,
+                f"Cannot use {name} as iterator because it's defined as loop",
+            )
+            return None
+        message = f"Variable {name} is already defined in this scope"
+        if name in self.defined:
+            self.__throw("VariableError", position, message)
+            return None
+        self.__emit(f"if {local_variable(name)} is not None:")
+        self.indent += 1
+        self.__throw("VariableError", position, message)
+        self.indent -= 1
+        iterable = self.__new_temporary()
+        self.__emit(
+            f"{iterable} = deepcopy({self.__compile_expression(node.iterable, RAW)})"
+        )
+        self.__emit(f"if not isinstance({iterable}, Array):")
+        self.indent += 1
+        self.__throw("TypeError", position, "For loop can only iterate over array")
+        self.indent -= 1
+        result = self.__new_temporary("w")
+        state = self.__enter_loop()
+        self.__emit(f"{result} = None")
+        self.__emit(f"for {local_variable(name)} in {iterable}._value:")
+        self.indent += 1
+        if not node.block.statements:
+            self.__emit(f"{local_variable(name)} = None")
+            self.__emit_flag_consumption()
+        elif self.__compile_block(
+            node.block, True, loop_result=result, fresh=frozenset([name])
+        )[1]:
+            self.__emit(f"{result} = None")
+        self.indent -= 1
+        self.__set_state(state)
+        return result
+
+    def __compile_return_statement(
+        self, node: ReturnStatement, is_sensitive: bool
+    ) -> None:
+        value = (
+            self.__compile_expression(node.expression, VALUE)
+            if node.expression
+            else "None"
+        )
+        if not self.loops:
+            value = self.__synchronized(value)
+            if is_sensitive:
+                self.__emit("self.return_called = False")
+            self.__emit(f"return {value}")
+            return None
+        value = self.__spill(value)
+        self.__synchronize()
+        self.__emit("self.return_called = True")
+        if is_sensitive:
+            self.__emit_loop_exit(value)
+        else:
+            self.__emit_jump(value, "continue")
+        return None
+
+    def __compile_assignment_statement(self, node: AssignmentStatement, _: bool) -> str:
+        value = self.__compile_raw_value(node.expression)
+        if not isinstance(node.variable, IdentifierExpression):
+            value = self.__spill(value)
+            variable = self.__compile_expression(node.variable, VALUE)
+            self.__emit(f"{variable}.set_value({value})")
+            return "None"
+        name = node.variable.name
+        if name in self.defined:
+            self.__emit(f"{local_variable(name)}.set_value({value})")
+            return "None"
+        value = self.__spill(value)
+        self.__emit(f"if {local_variable(name)} is None:")
+        self.__emit(f"    {local_variable(name)} = Value({value})")
+        self.__emit("else:")
+        self.__emit(f"    {local_variable(name)}.set_value({value})")
+        return "None"
+
+    def __compile_arithmetic_assignment(
+        self, node: AssignmentStatement, _: bool
+    ) -> str:
+        _, operator, check_division = assignment_operations[type(node)]
+        position = self.__position(node.offset)
+        name = getattr(node.variable, "name", None)
+        variable = self.__spill(self.__compile_expression(node.variable, VALUE))
+        if isinstance(node.variable, IdentifierExpression):
+            self.__emit(f"if {variable}._value is None:")
+        else:
+            self.__emit(f"if {variable} == None:")
+        self.indent += 1
+        self.__throw("VariableError", position, f"Variable {name} is not defined")
+        self.indent -= 1
+        right = self.__spill(self.__compile_raw_value(node.expression))
+        left = self.__new_temporary("x")
+        self.__emit(f"{left} = {variable}._value")
+        condition = self.__arithmetic_condition(
+            left, right, node.expression, check_division
+        )
+        error = "division_error" if check_division else "arithmetic_error"
+        self.__emit(f"if {condition}:")
+        self.__emit(f"    {variable}._value = {left} {operator[:-1]} {right}")
+        self.__emit("else:")
+        self.__emit(f"    {error}({left}, {right}, {operator!r}, {position})")
+        return "None"
+
+    def __compile_try_catch_statement(
+        self, node: TryCatchStatement, is_sensitive: bool
+    ) -> str:
+        position = self.__position(node.offset)
+        saved = self.__save_state(node.try_statement)
+        state = self.__get_state()
+        self.__emit("try:")
+        resets, is_reachable = self.__compile_nested_block(
+            node.try_statement, is_sensitive
+        )
+        states = [self.__get_state()] if is_reachable else []
+        error = self.__new_temporary("e")
+        self.__emit("except ThrownError as thrown_error:")
+        self.indent += 1
+        self.__emit(f"{error} = thrown_error.value")
+        for reset in resets:
+            self.__emit(reset)
+        self.__restore_state(saved, state)
+        catches = []
+        terminal = None
+        for catch in node.catch_statements:
+            if not catch.error_types:
+                terminal = catch
+                break
+            names = []
+            unknown = None
+            for error_type in catch.error_types:
+                if error_type.name not in self.program.functions:
+                    unknown = error_type.name
+                    break
+                if error_type.name in error_classes:
+                    names.append(error_type.name)
+            if names:
+                condition = f"isinstance({error}._value, ({', '.join(names)},))"
+                catches.append((condition, catch))
+            if unknown is not None:
+                terminal = unknown
+                break
+        for index, (condition, catch) in enumerate(catches):
+            self.__emit(f"{'if' if index == 0 else 'elif'} {condition}:")
+            binding = (catch.error_var.name, error) if catch.error_var else None
+            if self.__compile_nested_block(
+                catch.catch_statement, True, binding=binding
+            )[1]:
+                states.append(self.__get_state())
+            self.__set_state(state)
+        if catches:
+            self.__emit("else:")
+            self.indent += 1
+        if isinstance(terminal, CatchStatement):
+            start = len(self.lines)
+            if self.__compile_block(terminal.catch_statement, True)[1]:
+                states.append(self.__get_state())
+            if len(self.lines) == start:
+                self.__emit("pass")
+        elif terminal is not None:
+            self.__throw("TypeError", position, f"Unknown error type {terminal}")
+        else:
+            self.__emit(f"raise ThrownError({error})")
+        self.indent -= 2 if catches else 1
+        if states:
+            self.__merge_states(states)
+        else:
+            self.__set_state(state)
+        return "None"
+
+    def __compile_throw_statement(self, node: ThrowStatement, _: bool) -> None:
+        position = self.__position(node.offset)
+        self.__emit(f"self.error_position = {position}")
+        error = self.__new_temporary("e")
+        self.__emit(f"{error} = {self.__compile_expression(node.expression, VALUE)}")
+        self.__emit(f"if not isinstance({error}._value, Error):")
+        self.__emit(
+            f"    {error} = Value(TypeError({position}, "
+            "'Throw statement can only throw error'))"
+        )
+        self.__emit("self.error_position = None")
+        self.__emit(f"raise ThrownError({error})")
+        return None
+
+    def __compile_break_statement(self, node: BreakStatement, _: bool) -> None:
+        if not self.loops:
+            self.__emit("self.break_called = True")
+            self.__throw(
+                "ExpressionError",
+                self.__position(node.offset),
+                "break statement can only be used in loop",
+            )
+            return None
+        self.__emit_jump("None", "break")
+        return None
+
+    def __compile_continue_statement(
+        self, node: ContinueStatement, is_sensitive: bool
+    ) -> None:
+        if not self.loops:
+            self.__emit("self.continue_called = True")
+            self.__throw(
+                "ExpressionError",
+                self.__position(node.offset),
+                "continue statement can only be used in loop",
+            )
+            return None
+        if is_sensitive:
+            self.__emit("self.continue_called = True")
+            self.__emit_loop_exit("None")
+        else:
+            self.__emit_jump("None", "continue")
+        return None
+
+    ############################## EXPRESSIONS ##############################
+
+    def __compile_expression(self, node: any, mode: str) -> str:
+        if self.pending_result is not None and isinstance(node, leaf_classes):
+            target = self.pending_result
+            self.pending_result = None
+            return self.__compile_member_access(target, node, mode, True)
+        return self.expression_compilers[type(node)](node, mode)
+
+    def __finish(self, value: str, mode: str) -> str:
+        return f"{value}._value" if mode == RAW else value
+
+    def __type_condition(self, value: str, node: any, check: str) -> str | None:
+        if check == BOOLEAN_CHECK:
+            if isinstance(node, boolean_literal_classes):
+                return None
+            return f"type({value}) is bool"
+        if isinstance(node, number_literal_classes):
+            return None
+        return f"type({value}) in number_types"
+
+    def __arithmetic_condition(
+        self, left: str, right: str, right_node: any, check_division: bool
+    ) -> str:
+        conditions = [f"type({left}) in number_types"]
+        if condition := self.__type_condition(right, right_node, ARITHMETIC_CHECK):
+            conditions.append(condition)
+        if check_division and not (
+            isinstance(right_node, number_literal_classes) and right_node.value != 0
+        ):
+            conditions.append(f"{right} != 0")
+        return " and ".join(conditions)
+
+    def __compile_raw_value(self, node: any) -> str:
+        if isinstance(node, IdentifierExpression) and self.passed_by_value is not False:
+            return f"{self.__compile_expression(node, VALUE)}._value"
+        return self.__compile_expression(node, RAW)
+
+    def __compile_infix_expression(self, node: InfixExpression, mode: str) -> str:
+        _, operator, check = infix_operations[type(node)]
+        operand_mode = VALUE if check is None else RAW
+        left, right = self.__compile_operands(
+            [
+                lambda: self.__compile_expression(node.left, operand_mode),
+                lambda: self.__compile_expression(node.right, operand_mode),
+            ]
+        )
+        if check is None:
+            return self.__finish(
+                f"Value({left}._value {operator} {right}._value)", mode
+            )
+        values = []
+        conditions = []
+        for value, operand in [(left, node.left), (right, node.right)]:
+            if not (isinstance(operand, LiteralExpression) or value.isidentifier()):
+                name = self.__new_temporary("x")
+                condition = self.__type_condition(f"{name} := {value}", operand, check)
+                value = name
+            else:
+                condition = self.__type_condition(value, operand, check)
+            values.append(value)
+            if condition is not None:
+                conditions.append(f"({condition})")
+        left, right = values
+        condition = " & ".join(conditions)
+        if check == DIVISION_CHECK and not (
+            isinstance(node.right, number_literal_classes) and node.right.value != 0
+        ):
+            zero_condition = f"{right} != 0"
+            condition = (
+                f"{condition} and {zero_condition}" if condition else zero_condition
+            )
+        result = f"{left} {operator} {right}"
+        if condition:
+            error = error_functions[check]
+            position = self.__position(node.offset)
+            arguments = f"{left}, {right}, {operator!r}, {position}"
+            result = f"{result} if {condition} else {error}({arguments})"
+        return f"Value({result})" if mode == VALUE else f"({result})"
+
+    def __compile_bitwise_negation_expression(
+        self, node: BitwiseNegationExpression, mode: str
+    ) -> str:
+        return self.__compile_negation(node, mode, BOOLEAN_CHECK, "not", "!")
+
+    def __compile_numeric_negation_expression(
+        self, node: NumericNegationExpression, mode: str
+    ) -> str:
+        return self.__compile_negation(node, mode, ARITHMETIC_CHECK, "-", "-")
+
+    def __compile_negation(
+        self, node: any, mode: str, check: str, operation: str, operator: str
+    ) -> str:
+        value = self.__compile_expression(node.expression, RAW)
+        condition = self.__type_condition(value, node.expression, check)
+        if condition is not None and not value.isidentifier():
+            name = self.__new_temporary("x")
+            condition = self.__type_condition(
+                f"{name} := {value}", node.expression, check
+            )
+            value = name
+        result = f"{operation} {value}"
+        if condition is not None:
+            other = "True" if check == BOOLEAN_CHECK else "0"
+            position = self.__position(node.offset)
+            arguments = f"{value}, {other}, {operator!r}, {position}, True"
+            error = error_functions[check]
+            result = f"{result} if {condition} else {error}({arguments})"
+        return f"Value({result})" if mode == VALUE else f"({result})"
+
+    def __compile_type_check_expression(
+        self, node: TypeCheckExpression, mode: str
+    ) -> str:
+        if isinstance(node.expression, IdentifierExpression) and (
+            self.pending_result is None
+        ):
+            value = self.__variable(node.expression.name)
+        else:
+            value = self.__compile_expression(node.expression, VALUE)
+        return self.__finish(f"Value({value}._type == {node.type_name!r})", mode)
+
+    def __compile_literal(self, node: LiteralExpression, mode: str) -> str:
+        if mode == RAW:
+            return self.__pure(repr(node.value))
+        return self.__pure(f"Value({node.value!r})")
+
+    def __variable(self, name: str) -> str:
+        variable = local_variable(name)
+        if name in self.defined:
+            return variable
+        return (
+            f"({variable} if {variable} is not None else ({variable} := Value(None)))"
+        )
+
+    def __compile_identifier_expression(
+        self, node: IdentifierExpression, mode: str
+    ) -> str:
+        variable = self.__variable(node.name)
+        if mode == RAW:
+            return f"{variable}._value"
+        if self.passed_by_value is False:
+            return variable
+        if self.passed_by_value:
+            return f"copy_value({variable})"
+        return f"(copy_value({variable}) if self.is_passed_by_value else {variable})"
+
+    def __compile_argument(self, node: Argument, _: str) -> str:
+        self.passed_by_value = not node.is_reference
+        value = self.__compile_expression(node.value, VALUE)
+        self.passed_by_value = False
+        return value
+
+    def __compile_arguments(self, arguments: list[Argument]) -> list[str]:
+        return self.__compile_operands(
+            [
+                lambda argument=argument: self.__compile_expression(argument, VALUE)
+                for argument in arguments
+            ]
+        )
+
+    def __compile_function_call_expression(
+        self, node: FunctionCallExpression, mode: str
+    ) -> str:
+        position = self.__position(node.offset)
+        name = node.name
+        if name == "main":
+            self.__throw("FunctionError", position, "main function cannot be called")
+            return "None"
+        function = self.program.functions.get(name)
+        if isinstance(function, FunctionDef):
+            return self.__finish(self.__compile_user_call(node, function), mode)
+        arguments = [
+            self.__spill(argument)
+            for argument in self.__compile_arguments(node.arguments)
+        ]
+        self.__emit_overflow_check(position, "==")
+        if function is None:
+            self.__throw("FunctionError", position, f"Function {name} is not defined")
+            return "None"
+        if isinstance(function, ErrorConstructor):
+            arguments = ["self.error_position", *arguments]
+        if function.argc is not None and function.argc < len(arguments):
+            self.__throw(
+                "ArgumentError",
+                position,
+                f"Function {name} takes max of {function.argc} arguments, "
+                f"{len(arguments)} given",
+            )
+            return "None"
+        callee = self.__constant(function, ("function", name))
+        return self.__finish(f"Value({callee}.execute([{', '.join(arguments)}]))", mode)
+
+    def __compile_user_call(
+        self, node: FunctionCallExpression, function: FunctionDef
+    ) -> str:
+        position = self.__position(node.offset)
+        parameters = function.parameters
+        count = len(node.arguments)
+        if count <= len(parameters) and not self.__computed_defaults(function.name):
+            if (
+                count
+                and self.runtime_passed_by_value is not False
+                and not self.__contains_user_call(node)
+            ):
+                self.__emit("self.is_passed_by_value = False")
+                self.runtime_passed_by_value = False
+            arguments = self.__compile_arguments(node.arguments)
+            if self.__needs_synchronization():
+                arguments = [self.__spill(argument) for argument in arguments]
+        else:
+            arguments = self.__compile_slow_call(node, function, position)
+            if arguments is None:
+                return "None"
+        self.__synchronize()
+        state = False if self.passed_by_value is False else None
+        self.__set_state((state, state))
+        arguments = "".join(f", {argument}" for argument in arguments)
+        function = function_variable(function.name)
+        return f"{function}(self, {self.depth} + 1, {position}{arguments})"
+
+    def __compile_slow_call(
+        self, node: FunctionCallExpression, function: FunctionDef, position: str
+    ) -> list[str] | None:
+        name = function.name
+        definition_position = self.__position(function.offset)
+        arguments = [
+            self.__spill(argument)
+            for argument in self.__compile_arguments(node.arguments)
+        ]
+        self.__emit_overflow_check(position, "==")
+        self.__emit(f"load_function({name!r})")
+        if len(arguments) > len(function.parameters):
+            self.__throw(
+                "ArgumentError",
+                definition_position,
+                f"Function {name} takes {len(function.parameters)} arguments, "
+                f"{len(arguments)} given",
+            )
+            return None
+        values = []
+        for index, parameter in enumerate(function.parameters):
+            value = arguments[index] if index < len(arguments) else None
+            if not parameter.is_optional:
+                if value is None:
+                    self.__throw(
+                        "ArgumentError",
+                        definition_position,
+                        f"Parameter {parameter.name} is not optional",
+                    )
+                    return None
+            elif not isinstance(parameter.value, LiteralExpression):
+                if name in self.inlined_defaults:
+                    self.__throw(
+                        "StackOverflowError",
+                        position,
+                        f"Maximum call stack size of {self.max_call_stack_size} "
+                        "exceeded",
+                    )
+                    return None
+                value = self.__compile_default(parameter.value, name, value)
+            values.append(value or "None")
+        return values
+
+    def __compile_default(self, node: IExpression, name: str, value: str | None) -> str:
+        if value is not None and (
+            value in self.pure_expressions or value.startswith(("v_", "vx_"))
+        ):
+            return value
+        self.__synchronize()
+        state = self.__get_state()
+        is_conditional = value is not None
+        if is_conditional:
+            self.__emit(f"if {value} is None:")
+            self.indent += 1
+        else:
+            value = self.__new_temporary()
+        depth = self.depth
+        self.depth = f"{depth} + 1"
+        self.inlined_defaults.add(name)
+        self.__emit(f"{value} = {self.__compile_expression(node, VALUE)}")
+        self.inlined_defaults.remove(name)
+        self.depth = depth
+        self.__synchronize()
+        if is_conditional:
+            self.indent -= 1
+            self.__merge_states([state, self.__get_state()])
+        return value
+
+    def __compile_member_access(
+        self, target: str, node: any, mode: str, may_be_none: bool
+    ) -> str:
+        if isinstance(node, FunctionCallExpression):
+            return self.__finish(
+                self.__compile_method_call(target, node, may_be_none), mode
+            )
+        if not isinstance(node, IdentifierExpression):
+            if not self.__is_stable(target):
+                self.__emit(target)
+            return self.__compile_expression(node, mode)
+        position = self.__position(node.offset)
+        if not may_be_none:
+            return self.__finish(
+                f"get_property({target}, {node.name!r}, {position})", mode
+            )
+        condition = f"{target} is not None"
+        if not target.isidentifier():
+            name = self.__new_temporary()
+            condition = f"({name} := {target}) is not None"
+            target = name
+        fallback = self.__compile_identifier_expression(node, VALUE)
+        value = f"get_property({target}, {node.name!r}, {position})"
+        return self.__finish(f"({value} if {condition} else {fallback})", mode)
+
+    def __compile_method_call(
+        self, target: str, node: FunctionCallExpression, may_be_none: bool
+    ) -> str:
+        position = self.__position(node.offset)
+        target = self.__spill(target)
+        result = self.__new_temporary()
+        state = self.__get_state()
+        states = []
+        if may_be_none:
+            self.__emit(f"if {target} is None:")
+            self.indent += 1
+            self.__emit(
+                f"{result} = {self.__compile_function_call_expression(node, VALUE)}"
+            )
+            self.__synchronize()
+            states.append(self.__get_state())
+            self.indent -= 1
+            self.__emit("else:")
+            self.indent += 1
+            self.__set_state(state)
+        method = self.__new_temporary()
+        self.__emit("try:")
+        self.indent += 1
+        self.__emit(f"{method} = getattr({target}._value, {node.name!r})")
+        arguments = ", ".join(self.__compile_arguments(node.arguments))
+        self.__emit(f"{result} = {method}({arguments})")
+        self.indent -= 1
+        self.__emit("except AttributeError:")
+        self.__emit(f"    method_error({target}, {node.name!r}, {position})")
+        if may_be_none:
+            self.__synchronize()
+            states.append(self.__get_state())
+            self.indent -= 1
+            self.__merge_states(states)
+        return result
+
+    def __compile_property_access_expression(
+        self, node: PropertyAccessExpression, mode: str
+    ) -> str:
+        target = self.__compile_expression(node.left, VALUE)
+        return self.__compile_member_access(
+            target, node.right, mode, self.__may_be_none(node.left)
+        )
+
+    def __compile_optional_property_access_expression(
+        self, node: OptionalPropertyAccessExpression, mode: str
+    ) -> str:
+        saved = self.__save_state(node)
+        state = self.__get_state()
+        result = self.__new_temporary()
+        self.__emit("try:")
+        self.indent += 1
+        self.__emit(
+            f"{result} = {self.__compile_property_access_expression(node, VALUE)}"
+        )
+        self.__synchronize()
+        states = [self.__get_state()]
+        self.indent -= 1
+        self.__emit("except ThrownError as thrown_error:")
+        self.indent += 1
+        self.__emit("if not isinstance(thrown_error.value._value, PropertyError):")
+        self.__emit("    raise")
+        self.__restore_state(saved, state)
+        self.__emit(f"{result} = Value(None)")
+        self.indent -= 1
+        self.__emit("except:")
+        self.indent += 1
+        self.__restore_state(saved, state)
+        self.__emit(f"{result} = Value(None)")
+        self.indent -= 1
+        states.append(self.__get_state())
+        self.__merge_states(states)
+        return self.__finish(result, mode)
+
+
+def transpile_program(program: Program) -> str:
+    transpiler = PythonTranspiler(program)
+    return "\n\n".join(
+        transpiler.transpile_function(function)
+        for function in program.functions.values()
+        if isinstance(function, FunctionDef)
+    )
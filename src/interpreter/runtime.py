@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from interpreter.interpreter_error_classes import Error
+from interpreter.value_class import Value
+from utils.position_class import Position
+
+COMPILED_FILE_PREFIX: str = "<jp function "
+
+
+class ThrownError(Exception):
+    def __init__(self, value: Value) -> None:
+        super().__init__(value)
+        self.value: Value = value
+
+
+def throw(error: Error) -> None:
+    raise ThrownError(Value(error))
+
+
+class CompiledRuntime:
+    __slots__ = (
+        "break_called",
+        "continue_called",
+        "return_called",
+        "is_passed_by_value",
+        "error_position",
+    )
+
+    def __init__(self) -> None:
+        self.break_called: bool = False
+        self.continue_called: bool = False
+        self.return_called: bool = False
+
+        self.is_passed_by_value: bool = False
+        self.error_position: Position | None = None
@@ -0,0 +1,127 @@
+import asyncio
+import codecs
+import io
+import threading
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import CancelledError
+
+from lexer.config import LEXER_CONFIG
+from lexer.lexer_class import Lexer
+from lexer.token_class import Token
+from lexer.token_type_enum import TokenType
+from utils.error_handler_class import ErrorHandler
+
+
+class StreamReaderBridge:
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        loop: asyncio.AbstractEventLoop,
+        encoding: str = "utf-8",
+        before_read: Callable[[], None] | None = None,
+        stop_event: threading.Event | None = None,
+    ):
+        self.reader: asyncio.StreamReader = reader
+        self.loop: asyncio.AbstractEventLoop = loop
+        self.before_read: Callable[[], None] | None = before_read
+        self.stop_event: threading.Event | None = stop_event
+        self.read_task: asyncio.Task | None = None
+        self.decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(), translate=True
+        )
+        self.at_eof: bool = False
+
+    async def __read_chunk(self, size: int) -> bytes:
+        if self.stop_event is not None and self.stop_event.is_set():
+            raise asyncio.CancelledError
+        self.read_task = asyncio.current_task()
+        return await self.reader.read(size)
+
+    def cancel_read(self) -> None:
+        if self.read_task is not None:
+            self.read_task.cancel()
+
+    def read(self, size: int = -1) -> str:
+        text = ""
+        while not text and not self.at_eof:
+            if self.before_read is not None:
+                self.before_read()
+            chunk = asyncio.run_coroutine_threadsafe(
+                self.__read_chunk(size), self.loop
+            ).result()
+            self.at_eof = not chunk
+            text = self.decoder.decode(chunk, final=self.at_eof)
+        return text
+
+
+class AsyncLexer:
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        error_handler: ErrorHandler,
+        lexer_class: type[Lexer] = Lexer,
+        encoding: str = "utf-8",
+        chunk_size: int = LEXER_CONFIG.READ_CHUNK_SIZE.value,
+    ):
+        self.reader: asyncio.StreamReader = reader
+        self.error_handler: ErrorHandler = error_handler
+        self.lexer_class: type[Lexer] = lexer_class
+        self.encoding: str = encoding
+        self.chunk_size: int = chunk_size
+
+    def create_lexer(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        before_read: Callable[[], None] | None = None,
+        stream_provider: StreamReaderBridge | None = None,
+    ) -> Lexer:
+        if stream_provider is None:
+            stream_provider = StreamReaderBridge(
+                self.reader, loop, self.encoding, before_read
+            )
+        return self.lexer_class(
+            stream_provider, self.error_handler, chunk_size=self.chunk_size
+        )
+
+    async def __aiter__(self) -> AsyncIterator[Token]:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[list[Token] | None] = asyncio.Queue()
+        batch: list[Token] = []
+        batch_size = LEXER_CONFIG.ASYNC_TOKEN_BATCH_SIZE.value
+
+        def flush_batch() -> None:
+            if batch:
+                loop.call_soon_threadsafe(queue.put_nowait, batch.copy())
+                batch.clear()
+
+        stop_event = threading.Event()
+        stream_provider = StreamReaderBridge(
+            self.reader, loop, self.encoding, flush_batch, stop_event
+        )
+
+        def lex() -> None:
+            try:
+                lexer = self.create_lexer(loop, stream_provider=stream_provider)
+                while not stop_event.is_set():
+                    token = lexer.build_next_token()
+                    batch.append(token)
+                    if token.type == TokenType.T_EOF:
+                        break
+                    if len(batch) >= batch_size:
+                        flush_batch()
+                flush_batch()
+            except CancelledError:
+                if not stop_event.is_set():
+                    raise
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, None)
+
+        worker = asyncio.ensure_future(asyncio.to_thread(lex))
+        try:
+            while (tokens := await queue.get()) is not None:
+                for token in tokens:
+                    yield token
+        finally:
+            stop_event.set()
+            stream_provider.cancel_read()
+            await worker
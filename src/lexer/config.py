@@ -4,3 +4,6 @@ from enum import Enum
 class LEXER_CONFIG(Enum):
     MAX_NUM_LENGTH = 15
     MAX_IDENTIFIER_LENGTH = 50
+    READ_CHUNK_SIZE = 65536
+    MAX_INTERNED_STRING_LENGTH = 64
+    ASYNC_TOKEN_BATCH_SIZE = 256
@@ -0,0 +1,160 @@
+import io
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+
+from lexer.lexer_class import Lexer
+from lexer.lexer_error_class import LexerError
+from lexer.regex_lexer_class import end_of_line_pattern
+from lexer.token_class import Token
+from lexer.token_type_enum import TokenType
+from utils.error_handler_class import ErrorHandler
+from utils.intern_table_class import InternTable
+from utils.line_index_class import LineIndex
+
+
+def get_end_of_line_sequence(
+    first_end_of_line: re.Match | None, offset: int
+) -> str | None:
+    if first_end_of_line and first_end_of_line.end() <= offset:
+        return first_end_of_line.group()
+    return None
+
+
+class IncrementalLexer:
+    def __init__(
+        self,
+        source: str,
+        error_handler: ErrorHandler,
+        lexer_class: type[Lexer] = Lexer,
+    ):
+        self.source: str = ""
+        self.error_handler: ErrorHandler = error_handler
+        self.lexer_class: type[Lexer] = lexer_class
+        self.intern_table: InternTable = InternTable()
+        self.line_index: LineIndex = LineIndex()
+        self.tokens: list[Token] = []
+        self.errors: list[tuple[int, LexerError]] = []
+        self.apply_edit(0, 0, source)
+
+    def __create_lexer(
+        self,
+        restart_offset: int,
+        first_end_of_line: re.Match | None,
+        error_handler: ErrorHandler,
+    ) -> Lexer:
+        lexer = self.lexer_class(
+            io.StringIO(self.source[restart_offset:]),
+            error_handler,
+            intern_table=self.intern_table,
+        )
+        lexer.buffer_offset = restart_offset
+        lexer.line_index = self.line_index
+        lexer.end_of_line_sequence = get_end_of_line_sequence(
+            first_end_of_line, restart_offset
+        )
+        return lexer
+
+    def __get_restart_index(self, edit_offset: int) -> int:
+        return max(bisect_left(self.tokens, edit_offset, key=lambda t: t.offset) - 1, 0)
+
+    def __shift_rest_of_tokens(
+        self,
+        tokens: list[Token],
+        old_tokens: list[Token],
+        old_line_starts: array,
+        sync_index: int,
+        shift: int,
+    ) -> None:
+        line_starts = self.line_index.line_starts
+        old_offset = old_tokens[sync_index].offset
+        del line_starts[bisect_right(line_starts, old_offset + shift) :]
+        old_tail = bisect_right(old_line_starts, old_offset)
+        line_starts.extend(
+            line_start + shift for line_start in old_line_starts[old_tail:]
+        )
+        tokens.extend(
+            Token(token.type, token.value, token.offset + shift, self.line_index)
+            for token in old_tokens[sync_index:]
+        )
+
+    def __get_error_offset(self, error: LexerError) -> int:
+        line_start = self.line_index.line_starts[error.position.line - 1]
+        return line_start + error.position.column - 1
+
+    def __shift_error(self, error_offset: int, error: LexerError) -> LexerError:
+        return LexerError(
+            error.type, error.invalid_value, self.line_index.get_position(error_offset)
+        )
+
+    def __replace_errors(self, errors: list[tuple[int, LexerError]]) -> None:
+        stale_errors = {id(error) for _, error in self.errors}
+        self.error_handler.errors[:] = [
+            error
+            for error in self.error_handler.errors
+            if id(error) not in stale_errors
+        ] + [error for _, error in errors]
+        self.errors = errors
+
+    def apply_edit(
+        self, offset: int, removed_length: int, inserted_text: str
+    ) -> list[Token]:
+        old_source, old_tokens = self.source, self.tokens
+        old_line_starts = self.line_index.line_starts
+        self.source = (
+            old_source[:offset] + inserted_text + old_source[offset + removed_length :]
+        )
+        shift = len(inserted_text) - removed_length
+        restart_index = self.__get_restart_index(offset)
+        restart_offset = old_tokens[restart_index].offset if restart_index else 0
+        self.line_index = LineIndex(
+            old_line_starts[: bisect_right(old_line_starts, restart_offset)]
+        )
+        old_first_end_of_line = end_of_line_pattern.search(old_source)
+        first_end_of_line = end_of_line_pattern.search(self.source)
+        error_handler = ErrorHandler()
+        lexer = self.__create_lexer(restart_offset, first_end_of_line, error_handler)
+        tokens = old_tokens[:restart_index]
+        errors = [
+            (error_offset, error)
+            for error_offset, error in self.errors
+            if error_offset < restart_offset
+        ]
+        sync_index = restart_index
+        is_synchronized = False
+        while True:
+            token = lexer.build_next_token()
+            if token.offset >= offset + len(inserted_text):
+                old_offset = token.offset - shift
+                while (
+                    sync_index < len(old_tokens)
+                    and old_tokens[sync_index].offset < old_offset
+                ):
+                    sync_index += 1
+                if (
+                    sync_index < len(old_tokens)
+                    and old_tokens[sync_index].offset == old_offset
+                    and get_end_of_line_sequence(old_first_end_of_line, old_offset)
+                    == get_end_of_line_sequence(first_end_of_line, token.offset)
+                ):
+                    self.__shift_rest_of_tokens(
+                        tokens, old_tokens, old_line_starts, sync_index, shift
+                    )
+                    is_synchronized = True
+                    break
+            tokens.append(token)
+            if token.type == TokenType.T_EOF:
+                break
+        for error in error_handler.errors:
+            error_offset = self.__get_error_offset(error)
+            if not is_synchronized or error_offset < token.offset:
+                errors.append((error_offset, error))
+        if is_synchronized:
+            errors.extend(
+                (error_offset + shift, self.__shift_error(error_offset + shift, error))
+                for error_offset, error in self.errors
+                if error_offset >= token.offset - shift
+            )
+        self.tokens = tokens
+        self.__replace_errors(errors)
+        return tokens
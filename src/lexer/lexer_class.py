@@ -1,3 +1,4 @@
+import re
 from io import TextIOWrapper
 from utils.error_handler_class import ErrorHandler
 from lexer.config import LEXER_CONFIG
@@ -8,8 +9,11 @@ from lexer.helpers import (
     single_char_tokens,
 )
 from lexer.lexer_error_class import LEXER_ERROR_TYPES, LexerError
+from lexer.token_buffer_class import TokenBuffer
 from lexer.token_class import Token
 from lexer.token_type_enum import TokenType
+from utils.intern_table_class import InternTable
+from utils.line_index_class import LineIndex
 from utils.position_class import Position
 
 
@@ -28,16 +32,51 @@ def is_digit(char: str) -> bool:
 end_of_file_chars = [None, ""]
 end_of_line_chars = ["\n", "\r"]
 
+inline_whitespace_pattern = re.compile(r"[^\S\r\n]+")
+ascii_identifier_pattern = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+string_body_end_pattern = re.compile(r'["\\\r\n]')
+comment_body_end_pattern = re.compile(r"[\r\n]")
+
 
 class Lexer:
-    def __init__(self, stream_provider: TextIOWrapper, error_handler: ErrorHandler):
+    def __init__(
+        self,
+        stream_provider: TextIOWrapper,
+        error_handler: ErrorHandler,
+        chunk_size: int = LEXER_CONFIG.READ_CHUNK_SIZE.value,
+        intern_table: InternTable | None = None,
+    ):
         self.stream_provider: TextIOWrapper = stream_provider
-        self.current_position: Position = Position(1, 1)
-        self.current_token_position: Position = self.current_position
-        self.current_char: str = self.stream_provider.read(1)
+        self.chunk_size: int = chunk_size
+        self.buffer: str = ""
+        self.buffer_index: int = 0
+        self.buffer_offset: int = 0
+        self.current_token_offset: int = 0
+        self.line_index: LineIndex = LineIndex()
+        self.intern_table: InternTable = (
+            intern_table if intern_table is not None else InternTable()
+        )
+        self.__fill_buffer()
+        self.current_char: str = self.buffer[:1]
         self.end_of_line_sequence: str | None = None
         self.error_handler: ErrorHandler = error_handler
 
+    @property
+    def current_offset(self) -> int:
+        return self.buffer_offset + self.buffer_index
+
+    @property
+    def current_position(self) -> Position:
+        return self.line_index.get_position(self.current_offset)
+
+    def __create_token(self, token_type: TokenType, value: str | int | float) -> Token:
+        return Token(token_type, value, self.current_token_offset, self.line_index)
+
+    def __intern_string(self, value: str) -> str:
+        if len(value) > LEXER_CONFIG.MAX_INTERNED_STRING_LENGTH.value:
+            return value
+        return self.intern_table.intern(value)
+
     def __add_error(self, error_type: LEXER_ERROR_TYPES, token_value: str) -> None:
         self.error_handler.add_error(
             LexerError(error_type, token_value, self.current_position)
@@ -48,27 +87,27 @@ class Lexer:
         if not self.current_char.isspace():
             return False
         while self.current_char.isspace():
-            self.__advance()
+            if match := inline_whitespace_pattern.match(self.buffer, self.buffer_index):
+                self.__go_forward(match.end() - self.buffer_index)
+            else:
+                self.__advance()
         return True
 
     def __skip_comment(self) -> bool:
         if not self.current_char == "#":
             return False
-        current_line = self.current_position.line
+        line_count = len(self.line_index)
         while (
             self.current_char not in end_of_file_chars
-            and self.current_position.line == current_line
+            and len(self.line_index) == line_count
         ):
-            self.__advance()
+            if not self.__read_buffer_until(comment_body_end_pattern):
+                self.__advance()
         return True
 
     def __try_build_single_char_operator_token(self) -> Token | None:
         if token_type := single_char_tokens.get(self.current_char):
-            token = Token(
-                token_type,
-                self.current_char,
-                self.current_token_position,
-            )
+            token = self.__create_token(token_type, self.current_char)
             self.__advance()
             return token
         return None
@@ -82,13 +121,9 @@ class Lexer:
     ) -> Token:
         if self.current_char == expected_char:
             self.__advance()
-            return Token(
-                two_char_token,
-                prefix + expected_char,
-                self.current_token_position,
-            )
+            return self.__create_token(two_char_token, prefix + expected_char)
         else:
-            return Token(one_char_token, prefix, self.current_token_position)
+            return self.__create_token(one_char_token, prefix)
 
     def __try_build_two_char_operator_token(self) -> Token | None:
         if params := maybe_two_char_token.get(self.current_char):
@@ -97,9 +132,31 @@ class Lexer:
             return self.__check_if_two_char_token(*params, prefix=prefix)
         return None
 
+    def __try_build_identifier_from_buffer(self) -> str | None:
+        match = ascii_identifier_pattern.match(self.buffer, self.buffer_index)
+        if not match:
+            return None
+        end = match.end()
+        if end == len(self.buffer) or not self.buffer[end].isascii():
+            return None
+        if end - self.buffer_index > LEXER_CONFIG.MAX_IDENTIFIER_LENGTH.value:
+            return None
+        self.__go_forward(end - self.buffer_index)
+        return match.group()
+
+    def __read_buffer_until(self, pattern: re.Pattern) -> str:
+        match = pattern.search(self.buffer, self.buffer_index)
+        end = match.start() if match else len(self.buffer)
+        chunk = self.buffer[self.buffer_index : end]
+        if chunk:
+            self.__go_forward(len(chunk))
+        return chunk
+
     def __try_build_indetifier_or_keyword_token(self) -> Token | None:
         if not is_identifier_first_char(self.current_char):
             return None
+        if identifier_or_keyword := self.__try_build_identifier_from_buffer():
+            return self.__build_identifier_or_keyword_token(identifier_or_keyword)
         identifier_or_keyword = [self.current_char]
         self.__advance()
         while is_identifier_char(self.current_char):
@@ -110,19 +167,16 @@ class Lexer:
                 break
             identifier_or_keyword.append(self.current_char)
             self.__advance()
-        identifier_or_keyword = "".join(identifier_or_keyword)
+        return self.__build_identifier_or_keyword_token("".join(identifier_or_keyword))
+
+    def __build_identifier_or_keyword_token(self, identifier_or_keyword: str) -> Token:
+        identifier_or_keyword = self.intern_table.intern(identifier_or_keyword)
         if identifier_or_keyword in keywords:
-            return Token(
-                keywords[identifier_or_keyword],
-                identifier_or_keyword,
-                self.current_token_position,
+            return self.__create_token(
+                keywords[identifier_or_keyword], identifier_or_keyword
             )
         else:
-            return Token(
-                TokenType.T_IDENTIFIER,
-                identifier_or_keyword,
-                self.current_token_position,
-            )
+            return self.__create_token(TokenType.T_IDENTIFIER, identifier_or_keyword)
 
     def __try_build_number_token(self) -> Token | None:
         if not is_digit(self.current_char):
@@ -142,15 +196,13 @@ class Lexer:
                 self.__advance()
 
         if not self.current_char == ".":
-            return Token(
-                TokenType.T_INT_LITERAL, temp_value, self.current_token_position
-            )
+            return self.__create_token(TokenType.T_INT_LITERAL, temp_value)
 
         decimal = 0
         self.__advance()
         if not is_digit(self.current_char):
             self.__add_error(LEXER_ERROR_TYPES.INVALID_FLOAT, f"{temp_value}.")
-            return True
+            return self.__create_token(TokenType.T_UNDEFINED, f"{temp_value}.")
         while is_digit(self.current_char):
             if number_of_digits == LEXER_CONFIG.MAX_NUM_LENGTH.value:
                 self.__add_error(
@@ -163,7 +215,7 @@ class Lexer:
             number_of_digits += 1
             self.__advance()
         temp_value /= 10**decimal
-        return Token(TokenType.T_FLOAT_LITERAL, temp_value, self.current_token_position)
+        return self.__create_token(TokenType.T_FLOAT_LITERAL, temp_value)
 
     def __check_escape_char_in_string(self) -> str:
         self.__advance()
@@ -185,6 +237,9 @@ class Lexer:
                     LEXER_ERROR_TYPES.UNTERMINATED_STRING, "".join(temp_string)
                 )
                 break
+            if chunk := self.__read_buffer_until(string_body_end_pattern):
+                temp_string.append(chunk)
+                continue
             if self.current_char == "\\":
                 temp_char = self.__check_escape_char_in_string()
             else:
@@ -192,31 +247,47 @@ class Lexer:
             temp_string.append(temp_char)
             self.__advance()
         self.__advance()
-        return Token(
-            TokenType.T_STRING_LITERAL,
-            "".join(temp_string),
-            self.current_token_position,
+        return self.__create_token(
+            TokenType.T_STRING_LITERAL, self.__intern_string("".join(temp_string))
         )
 
     def __try_build_comment_token(self) -> Token | None:
         if self.current_char != "#":
             return None
-        current_line = self.current_position.line
+        line_count = len(self.line_index)
         temp_comment = []
         self.__advance()
         while (
             self.current_char not in end_of_file_chars
-            and self.current_position.line == current_line
+            and len(self.line_index) == line_count
         ):
+            if chunk := self.__read_buffer_until(comment_body_end_pattern):
+                temp_comment.append(chunk)
+                continue
             temp_comment.append(self.current_char)
             self.__advance()
-        return Token(
-            TokenType.T_COMMENT, "".join(temp_comment), self.current_token_position
-        )
+        return self.__create_token(TokenType.T_COMMENT, "".join(temp_comment))
+
+    def __fill_buffer(self) -> None:
+        self.buffer_offset += self.buffer_index
+        self.buffer = self.stream_provider.read(self.chunk_size)
+        self.buffer_index = 0
+
+    def __go_forward(self, char_count: int) -> None:
+        self.buffer_index += char_count
+        try:
+            self.current_char = self.buffer[self.buffer_index]
+        except IndexError:
+            self.__fill_buffer()
+            self.current_char = self.buffer[:1]
 
     def __go_one_char_forward(self) -> None:
-        self.current_position.column += 1
-        self.current_char = self.stream_provider.read(1)
+        self.buffer_index += 1
+        try:
+            self.current_char = self.buffer[self.buffer_index]
+        except IndexError:
+            self.__fill_buffer()
+            self.current_char = self.buffer[:1]
 
     def __check_end_of_line(self) -> None:
         escape_char = self.current_char
@@ -230,8 +301,7 @@ class Lexer:
         elif self.end_of_line_sequence != escape_char:
             self.__add_error(LEXER_ERROR_TYPES.INVALID_EOL, escape_char)
             return
-        self.current_position.line += 1
-        self.current_position.column = 1
+        self.line_index.add_line_start(self.current_offset)
 
     def __advance(self) -> None:
         if self.current_char in end_of_line_chars:
@@ -250,18 +320,14 @@ class Lexer:
         )
 
     def __check_if_token_is_valid(self) -> Token:
-        self.current_token_position = Position(
-            self.current_position.line, self.current_position.column
-        )
+        self.current_token_offset = self.current_offset
         if self.current_char in end_of_file_chars:
-            return Token(TokenType.T_EOF, "", self.current_token_position)
+            return self.__create_token(TokenType.T_EOF, "")
 
         if token := self.__try_build_token():
             return token
         self.__add_error(LEXER_ERROR_TYPES.UNKNOWN_TOKEN, self.current_char)
-        return Token(
-            TokenType.T_UNDEFINED, self.current_char, self.current_token_position
-        )
+        return self.__create_token(TokenType.T_UNDEFINED, self.current_char)
 
     def build_next_token(self) -> Token:
         while self.__skip_whitespace():
@@ -272,3 +338,12 @@ class Lexer:
         while self.__skip_whitespace() or self.__skip_comment():
             pass
         return self.__check_if_token_is_valid()
+
+    def tokenize_all(self) -> TokenBuffer:
+        token_buffer = TokenBuffer(self.line_index)
+        while True:
+            token = self.build_next_token()
+            token_buffer.append(token)
+            if token.type == TokenType.T_EOF:
+                break
+        return token_buffer
@@ -0,0 +1,40 @@
+import codecs
+import io
+import mmap
+import os
+
+
+class MmapStream:
+    def __init__(self, path: str, encoding: str = "utf-8"):
+        self.file = open(path, "rb")
+        self.mapped_file: mmap.mmap | None = None
+        if os.fstat(self.file.fileno()).st_size > 0:
+            self.mapped_file = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(), translate=True
+        )
+        self.offset: int = 0
+
+    def __len__(self) -> int:
+        return len(self.mapped_file) if self.mapped_file is not None else 0
+
+    def read(self, size: int = -1) -> str:
+        if size < 0:
+            size = len(self) - self.offset
+        text = ""
+        while not text and self.offset < len(self):
+            chunk = self.mapped_file[self.offset : self.offset + size]
+            self.offset += len(chunk)
+            text = self.decoder.decode(chunk, final=self.offset >= len(self))
+        return text
+
+    def close(self) -> None:
+        if self.mapped_file is not None:
+            self.mapped_file.close()
+        self.file.close()
+
+    def __enter__(self) -> "MmapStream":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
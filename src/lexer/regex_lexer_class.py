@@ -0,0 +1,169 @@
+import re
+
+from lexer.config import LEXER_CONFIG
+from lexer.helpers import (
+    escaped_chars,
+    keywords,
+    maybe_two_char_token,
+    single_char_tokens,
+)
+from lexer.lexer_class import Lexer
+from lexer.token_class import Token
+from lexer.token_type_enum import TokenType
+
+operator_tokens: dict[str, TokenType] = {**single_char_tokens}
+for prefix, (
+    expected_char,
+    one_char_token,
+    two_char_token,
+) in maybe_two_char_token.items():
+    operator_tokens[prefix] = one_char_token
+    operator_tokens[prefix + expected_char] = two_char_token
+
+escape_sequence_pattern = re.compile(r"\\(.)")
+
+max_identifier_length: int = LEXER_CONFIG.MAX_IDENTIFIER_LENGTH.value
+max_num_length: int = LEXER_CONFIG.MAX_NUM_LENGTH.value
+max_interned_string_length: int = LEXER_CONFIG.MAX_INTERNED_STRING_LENGTH.value
+
+master_pattern = re.compile(
+    r"(?P<whitespace>[ \t\f\v]*)(?:"
+    + "|".join(
+        [
+            r"(?P<end_of_line>\r\n|\n\r|\r|\n)",
+            r"(?P<identifier>[A-Za-z_][A-Za-z0-9_]*)",
+            r"(?P<number>(?:0|[1-9][0-9]*)(?:\.(?P<fraction>[0-9]+))?)",
+            r'(?P<string>"(?:[^"\\\r\n]|\\[^\r\n])*")',
+            r"(?P<comment>#[^\r\n]*)",
+            "(?P<operator>"
+            + "|".join(
+                re.escape(operator)
+                for operator in sorted(operator_tokens, key=len, reverse=True)
+            )
+            + ")",
+        ]
+    )
+    + ")"
+)
+
+end_of_line_pattern = re.compile(r"\r\n|\n\r|\r|\n")
+
+
+def unescape_string(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return escape_sequence_pattern.sub(
+        lambda match: escaped_chars.get(match.group(1), match.group(1)), value
+    )
+
+
+class RegexLexer(Lexer):
+    def __consume_end_of_line(self, end_of_line: str, end: int) -> bool:
+        if self.end_of_line_sequence is None:
+            self.end_of_line_sequence = end_of_line
+        elif self.end_of_line_sequence != end_of_line:
+            return False
+        self.line_index.add_line_start(self.buffer_offset + end)
+        return True
+
+    def __create_token(self, token_type: TokenType, value: str | int | float) -> Token:
+        return Token(token_type, value, self.current_token_offset, self.line_index)
+
+    def __build_number_token(self, text: str, fraction: str | None) -> Token | None:
+        if len(text) - (fraction is not None) > max_num_length:
+            return None
+        if fraction is None:
+            return self.__create_token(TokenType.T_INT_LITERAL, int(text))
+        return self.__create_token(
+            TokenType.T_FLOAT_LITERAL,
+            int(text.replace(".", "")) / 10 ** len(fraction),
+        )
+
+    def __build_comment_token(self, text: str, end: int) -> Token | None:
+        end_of_line = end_of_line_pattern.match(self.buffer, end)
+        if not end_of_line or end_of_line.end() >= len(self.buffer):
+            return None
+        if not self.__consume_end_of_line(end_of_line.group(), end_of_line.end()):
+            return None
+        self.buffer_index = end_of_line.end()
+        return self.__create_token(
+            TokenType.T_COMMENT, text[1:] + end_of_line.group()[0]
+        )
+
+    def __build_literal_or_comment_token(
+        self, match: re.Match, kind: str, text: str, end: int
+    ) -> Token | None:
+        if kind == "number":
+            fraction = match.group("fraction")
+            next_char = self.buffer[end]
+            if next_char.isdecimal() or (fraction is None and next_char == "."):
+                return None
+            return self.__build_number_token(text, fraction)
+        if kind == "string":
+            value = unescape_string(text[1:-1])
+            if len(value) <= max_interned_string_length:
+                value = self.intern_table.intern(value)
+            return self.__create_token(TokenType.T_STRING_LITERAL, value)
+        return self.__build_comment_token(text, end)
+
+    def __try_build_token(self, skip_comments: bool) -> Token | None:
+        buffer = self.buffer
+        buffer_length = len(buffer)
+        while match := master_pattern.match(buffer, self.buffer_index):
+            end = match.end()
+            if end >= buffer_length:
+                return None
+            kind = match.lastgroup
+            start = match.end(1)
+            self.buffer_index = start
+            if kind == "end_of_line":
+                if not self.__consume_end_of_line(match.group(kind), end):
+                    return None
+                self.buffer_index = end
+                continue
+            self.current_token_offset = self.buffer_offset + start
+            text = match.group(kind)
+            if kind == "identifier":
+                if end - start > max_identifier_length or not buffer[end].isascii():
+                    return None
+                text = self.intern_table.intern(text)
+                token = Token(
+                    keywords.get(text, TokenType.T_IDENTIFIER),
+                    text,
+                    self.current_token_offset,
+                    self.line_index,
+                )
+            elif kind == "operator":
+                token = Token(
+                    operator_tokens[text],
+                    text,
+                    self.current_token_offset,
+                    self.line_index,
+                )
+            else:
+                token = self.__build_literal_or_comment_token(match, kind, text, end)
+                if token is None:
+                    return None
+                if kind == "comment":
+                    if skip_comments:
+                        continue
+                    return token
+            self.buffer_index = end
+            return token
+        return None
+
+    def build_next_token(self) -> Token:
+        token = self.__try_build_token(skip_comments=False)
+        if token:
+            self.current_char = self.buffer[self.buffer_index]
+            return token
+        self.current_char = self.buffer[self.buffer_index : self.buffer_index + 1]
+        return super().build_next_token()
+
+    def build_next_token_without_comments(self) -> Token:
+        token = self.__try_build_token(skip_comments=True)
+        if token:
+            self.current_char = self.buffer[self.buffer_index]
+            return token
+        self.current_char = self.buffer[self.buffer_index : self.buffer_index + 1]
+        return super().build_next_token_without_comments()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+import json
+from array import array
+
+from lexer.token_class import Token
+from lexer.token_type_enum import TokenType, token_kinds
+from utils.binary_blocks import read_block, write_block
+from utils.error_handler_class import ErrorHandler
+from utils.line_index_class import LineIndex
+
+token_value_types: tuple[type, ...] = (str, int, float)
+
+
+class TokenBuffer:
+    def __init__(self, line_index: LineIndex | None = None) -> None:
+        self.kinds: array = array("H")
+        self.offsets: array = array("I")
+        self.values: list[str | int | float] = []
+        self.line_index: LineIndex = (
+            line_index if line_index is not None else LineIndex()
+        )
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def append(self, token: Token) -> None:
+        self.kinds.append(token.type)
+        self.offsets.append(token.offset)
+        self.values.append(token.value)
+
+    def get_token(self, index: int) -> Token:
+        return Token(
+            token_kinds[self.kinds[index]],
+            self.values[index],
+            self.offsets[index],
+            self.line_index,
+        )
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as file:
+            write_block(file, self.kinds.tobytes())
+            write_block(file, self.offsets.tobytes())
+            write_block(file, array("I", self.line_index.line_starts).tobytes())
+            write_block(file, json.dumps(self.values).encode())
+
+    @classmethod
+    def load(cls, path: str) -> TokenBuffer:
+        with open(path, "rb") as file:
+            kinds = array("H", read_block(file))
+            offsets = array("I", read_block(file))
+            line_starts = array("I", read_block(file))
+            values = json.loads(read_block(file).decode())
+            if file.read(1):
+                raise ValueError("Token buffer data is corrupt")
+        token_buffer = cls(LineIndex(line_starts))
+        token_buffer.kinds = kinds
+        token_buffer.offsets = offsets
+        token_buffer.values = values
+        token_buffer.__validate()
+        return token_buffer
+
+    def __validate(self) -> None:
+        if (
+            not isinstance(self.values, list)
+            or not self.kinds
+            or not len(self.kinds) == len(self.offsets) == len(self.values)
+            or max(self.kinds) >= len(token_kinds)
+            or self.kinds[-1] != TokenType.T_EOF
+            or any(type(value) not in token_value_types for value in self.values)
+            or not self.line_index.line_starts
+            or self.line_index.line_starts[0] != 0
+        ):
+            raise ValueError("Token buffer data is corrupt")
+
+
+class TokenBufferReader:
+    def __init__(self, token_buffer: TokenBuffer, error_handler: ErrorHandler):
+        self.token_buffer: TokenBuffer = token_buffer
+        self.error_handler: ErrorHandler = error_handler
+        self.line_index: LineIndex = token_buffer.line_index
+        self.index: int = 0
+
+    def build_next_token(self) -> Token:
+        index = self.index
+        kind = self.token_buffer.kinds[index]
+        if kind != TokenType.T_EOF:
+            self.index = index + 1
+        return Token(
+            token_kinds[kind],
+            self.token_buffer.values[index],
+            self.token_buffer.offsets[index],
+            self.line_index,
+        )
+
+    def build_next_token_without_comments(self) -> Token:
+        kinds = self.token_buffer.kinds
+        while kinds[self.index] == TokenType.T_COMMENT:
+            self.index += 1
+        return self.build_next_token()
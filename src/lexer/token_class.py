@@ -1,14 +1,23 @@
 from lexer.token_type_enum import TokenType
+from utils.line_index_class import LineIndex
 from utils.position_class import Position
 
 
 class Token:
+    __slots__ = ("type", "value", "offset", "line_index")
+
     def __init__(
         self,
         token_type: TokenType,
         value: str | int | float,
-        position: Position,
+        offset: int,
+        line_index: LineIndex,
     ):
         self.type = token_type
         self.value = value
-        self.position = position
+        self.offset = offset
+        self.line_index = line_index
+
+    @property
+    def position(self) -> Position:
+        return self.line_index.get_position(self.offset)
@@ -1,84 +1,91 @@
-from enum import Enum
+from enum import IntEnum, auto
 
 
-class TokenType(Enum):
+class TokenType(IntEnum):
+    @staticmethod
+    def _generate_next_value_(name, start, count, last_values):
+        return count
+
     # --- Literals ---
-    T_INT_LITERAL = "int"
-    T_FLOAT_LITERAL = "float"
-    T_STRING_LITERAL = "string"
+    T_INT_LITERAL = auto()
+    T_FLOAT_LITERAL = auto()
+    T_STRING_LITERAL = auto()
 
     # --- Keywords ---
 
     # ------ Functions ------
-    T_RETURN = "return"
-    T_BREAK = "break"
-    T_CONTINUE = "continue"
-    T_TRY = "try"
-    T_CATCH = "catch"
-    T_THROW = "throw"
+    T_RETURN = auto()
+    T_BREAK = auto()
+    T_CONTINUE = auto()
+    T_TRY = auto()
+    T_CATCH = auto()
+    T_THROW = auto()
 
     # ------ Statements ------
-    T_IF = "if"
-    T_ELIF = "elif"
-    T_ELSE = "else"
-    T_WHILE = "while"
-    T_FOR = "for"
+    T_IF = auto()
+    T_ELIF = auto()
+    T_ELSE = auto()
+    T_WHILE = auto()
+    T_FOR = auto()
 
     # ------ Literals ------
-    T_TRUE = "true"
-    T_FALSE = "false"
-    T_NULL = "null"
+    T_TRUE = auto()
+    T_FALSE = auto()
+    T_NULL = auto()
 
     # --- Operators ---
 
     # ------ Arithmetic ------
-    T_PLUS = "+"
-    T_MINUS = "-"
-    T_MULTIPLY = "*"
-    T_DIVIDE = "/"
-    T_MODULO = "%"
+    T_PLUS = auto()
+    T_MINUS = auto()
+    T_MULTIPLY = auto()
+    T_DIVIDE = auto()
+    T_MODULO = auto()
 
     # ------ Assignment ------
-    T_ASSIGN = "="
-    T_ASSIGN_PLUS = "+="
-    T_ASSIGN_MINUS = "-="
-    T_ASSIGN_MULTIPLY = "*="
-    T_ASSIGN_DIVIDE = "/="
-    T_ASSIGN_MODULO = "%="
+    T_ASSIGN = auto()
+    T_ASSIGN_PLUS = auto()
+    T_ASSIGN_MINUS = auto()
+    T_ASSIGN_MULTIPLY = auto()
+    T_ASSIGN_DIVIDE = auto()
+    T_ASSIGN_MODULO = auto()
 
     # ------ Comparison ------
-    T_GREATER = ">"
-    T_LESS = "<"
-    T_GREATER_EQUAL = ">="
-    T_LESS_EQUAL = "<="
-    T_EQUAL = "=="
-    T_NOT_EQUAL = "!="
+    T_GREATER = auto()
+    T_LESS = auto()
+    T_GREATER_EQUAL = auto()
+    T_LESS_EQUAL = auto()
+    T_EQUAL = auto()
+    T_NOT_EQUAL = auto()
 
     # ------ Logic ------
-    T_AND = "&"
-    T_OR = "|"
+    T_AND = auto()
+    T_OR = auto()
 
     # ------ Access ------
-    T_ACCESS = "."
-    T_NULLABLE_ACCESS = "?."
+    T_ACCESS = auto()
+    T_NULLABLE_ACCESS = auto()
 
     # ------ Other ------
-    T_NOT = "!"
-    T_REF = "@"
-    T_TYPE_CHECK = "is"
+    T_NOT = auto()
+    T_REF = auto()
+    T_TYPE_CHECK = auto()
 
     # --- Brackets ---
-    T_LEFT_BRACKET = "("
-    T_RIGHT_BRACKET = ")"
-    T_LEFT_CURLY_BRACKET = "{"
-    T_RIGHT_CURLY_BRACKET = "}"
+    T_LEFT_BRACKET = auto()
+    T_RIGHT_BRACKET = auto()
+    T_LEFT_CURLY_BRACKET = auto()
+    T_RIGHT_CURLY_BRACKET = auto()
 
     # --- Other ---
-    T_IDENTIFIER = "id"
-    T_SEMICOLON = ";"
-    T_COMMA = ","
-    T_COLON = ":"
-    T_COMMENT = "#"
-    T_OPTIONAL = "?"
-    T_UNDEFINED = "undefined"
-    T_EOF = "eof"
+    T_IDENTIFIER = auto()
+    T_SEMICOLON = auto()
+    T_COMMA = auto()
+    T_COLON = auto()
+    T_COMMENT = auto()
+    T_OPTIONAL = auto()
+    T_UNDEFINED = auto()
+    T_EOF = auto()
+
+
+token_kinds: list[TokenType] = list(TokenType)
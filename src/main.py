@@ -1,29 +1,125 @@
-import sys
+import argparse
 import io
+import logging
 from parser.parser_class import Parser
+from interpreter.bytecode_interpreter_class import BytecodeInterpreter
+from interpreter.closure_interpreter_class import ClosureInterpreter
+from interpreter.disassembler import disassemble_program
 from interpreter.interpreter_class import Interpreter
+from interpreter.python_interpreter_class import PythonInterpreter
+from interpreter.python_transpiler_class import transpile_program
 from utils.error_handler_class import ErrorHandler
 
 from lexer.lexer_class import Lexer
+from lexer.mmap_stream_class import MmapStream
+from lexer.regex_lexer_class import RegexLexer
+from lexer.token_buffer_class import TokenBufferReader
+from program.program_cache_class import ProgramCache
+
+lexer_engines: dict[str, type[Lexer]] = {
+    "stream": Lexer,
+    "regex": RegexLexer,
+}
+
+interpreter_engines: dict[
+    str,
+    type[Interpreter | ClosureInterpreter | BytecodeInterpreter | PythonInterpreter],
+] = {
+    "tree": Interpreter,
+    "closure": ClosureInterpreter,
+    "bytecode": BytecodeInterpreter,
+    "python": PythonInterpreter,
+}
+
+
+def parse_arguments() -> argparse.Namespace:
+    argument_parser = argparse.ArgumentParser(description="JP language interpreter")
+    argument_parser.add_argument("file", nargs="?")
+    argument_parser.add_argument(
+        "--lexer", choices=lexer_engines.keys(), default="stream"
+    )
+    argument_parser.add_argument("--mmap", action="store_true")
+    argument_parser.add_argument("--hash-consing", action="store_true")
+    argument_parser.add_argument(
+        "--lazy-bodies",
+        action="store_true",
+        help="parse function bodies on first call; with the cache enabled a cache "
+        "miss parses eagerly to fill the cache and only cache hits load lazily",
+    )
+    argument_parser.add_argument("--check", action="store_true")
+    argument_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="do not read or write the parsed program cache in __jpcache__",
+    )
+    argument_parser.add_argument(
+        "--engine", choices=interpreter_engines.keys(), default="tree"
+    )
+    argument_parser.add_argument("--disassemble", action="store_true")
+    argument_parser.add_argument("--emit-python", action="store_true")
+    argument_parser.add_argument(
+        "--tier-up-threshold",
+        type=int,
+        help="compile tree-walked functions after this many calls and loop "
+        "iterations (off by default)",
+    )
+    argument_parser.add_argument("--debug", action="store_true")
+    return argument_parser.parse_args()
 
 
 def main():
+    arguments = parse_arguments()
+    if arguments.debug:
+        logging.basicConfig(level=logging.DEBUG)
     error_handler = ErrorHandler()
-    if len(sys.argv) == 1:
+    lexer_class = lexer_engines[arguments.lexer]
+    if arguments.file is None:
         with io.StringIO("main() {x=1;}") as stream_provider:
-            lexer = Lexer(stream_provider, error_handler)
-            parser = Parser(lexer)
-            program = parser.parse()
-    if len(sys.argv) == 2:
-        with open(sys.argv[1], "r") as stream_provider:
-            lexer = Lexer(stream_provider, error_handler)
-            parser = Parser(lexer)
+            lexer = lexer_class(stream_provider, error_handler)
+            parser = Parser(lexer, arguments.hash_consing)
             program = parser.parse()
+    else:
+        program_cache = (
+            None
+            if arguments.no_cache or arguments.hash_consing
+            else ProgramCache(arguments.file)
+        )
+        program = program_cache.load(arguments.lazy_bodies) if program_cache else None
+        if program is None:
+            with (
+                MmapStream(arguments.file)
+                if arguments.mmap
+                else open(arguments.file, "r", encoding="utf-8")
+            ) as stream_provider:
+                lexer = lexer_class(stream_provider, error_handler)
+                lazy_bodies = arguments.lazy_bodies and program_cache is None
+                if lazy_bodies:
+                    lexer = TokenBufferReader(lexer.tokenize_all(), error_handler)
+                parser = Parser(lexer, arguments.hash_consing, lazy_bodies=lazy_bodies)
+                program = parser.parse()
+            if arguments.check or arguments.disassemble or arguments.emit_python:
+                program.load_function_blocks()
             if error_handler.has_errors():
                 error_handler.raise_errors()
                 exit(1)
-            interpreter = Interpreter(error_handler)
-            interpreter.visit(program)
+            if program_cache:
+                program_cache.save(program)
+        if arguments.check:
+            return
+        if arguments.disassemble:
+            program.load_function_blocks()
+            print(disassemble_program(program))
+            return
+        if arguments.emit_python:
+            program.load_function_blocks()
+            print(transpile_program(program))
+            return
+        interpreter = (
+            Interpreter(error_handler, arguments.tier_up_threshold)
+            if arguments.engine == "tree"
+            else interpreter_engines[arguments.engine](error_handler)
+        )
+        interpreter.visit(program)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import json
+from array import array
+from collections.abc import Callable, Iterator
+from functools import partial
+from typing import BinaryIO
+
+from interpreter.built_in_functions import get_built_in_functions
+from parser.statement_classes import *
+from program.program_class import Program
+from utils.binary_blocks import read_block, write_block
+from utils.line_index_class import LineIndex
+
+ast_node_classes: list[type] = [
+    OrExpression,
+    AndExpression,
+    EqualExpression,
+    NotEqualExpression,
+    GreaterThanExpression,
+    GreaterEqualExpression,
+    LessThanExpression,
+    LessEqualExpression,
+    AddExpression,
+    SubtractExpression,
+    MultiplyExpression,
+    DivideExpression,
+    ModuloExpression,
+    BitwiseNegationExpression,
+    NumericNegationExpression,
+    TypeCheckExpression,
+    LiteralExpression,
+    NullLiteral,
+    IntegerLiteral,
+    FloatLiteral,
+    StringLiteral,
+    BooleanLiteral,
+    FalseLiteral,
+    TrueLiteral,
+    IdentifierExpression,
+    FunctionCallExpression,
+    PropertyAccessExpression,
+    OptionalPropertyAccessExpression,
+    BlockStatement,
+    ConditionalStatement,
+    IfStatement,
+    WhileStatement,
+    ForStatement,
+    ReturnStatement,
+    AssignmentStatement,
+    AssignmentPlusStatement,
+    AssignmentMinusStatement,
+    AssignmentMultiplyStatement,
+    AssignmentDivideStatement,
+    AssignmentModuloStatement,
+    CatchStatement,
+    TryCatchStatement,
+    ThrowStatement,
+    BreakStatement,
+    ContinueStatement,
+    Argument,
+    Parameter,
+    FunctionDef,
+]
+
+LIST_KIND: int = len(ast_node_classes)
+NONE_KIND: int = LIST_KIND + 1
+NO_INDEX: int = -1
+
+constant_types: tuple[type, ...] = (str, int, float, bool, type(None))
+
+class_to_kind: dict[type, int] = {
+    node_class: kind for kind, node_class in enumerate(ast_node_classes)
+}
+
+constant_fields: dict[type, tuple[str, ...]] = {
+    TypeCheckExpression: ("type_name",),
+    LiteralExpression: ("value",),
+    IdentifierExpression: ("name",),
+    FunctionCallExpression: ("name",),
+    Argument: ("is_reference",),
+    Parameter: ("name", "is_optional"),
+    FunctionDef: ("name",),
+}
+
+
+def get_node_layout(node_class: type) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    fields = [
+        (field, cls)
+        for cls in reversed(node_class.__mro__)
+        for field in getattr(cls, "__slots__", ())
+        if field != "offset"
+    ]
+    child_fields = tuple(
+        field for field, cls in fields if field not in constant_fields.get(cls, ())
+    )
+    node_constant_fields = tuple(
+        field for field, cls in fields if field in constant_fields.get(cls, ())
+    )
+    return child_fields, node_constant_fields
+
+
+node_layouts: list[tuple[tuple[str, ...], tuple[str, ...]]] = [
+    get_node_layout(node_class) for node_class in ast_node_classes
+]
+
+
+class FlatAst:
+    def __init__(self, line_index: LineIndex | None = None) -> None:
+        self.line_index: LineIndex = (
+            line_index if line_index is not None else LineIndex()
+        )
+        self.kinds: array = array("B")
+        self.first_children: array = array("q")
+        self.next_siblings: array = array("q")
+        self.offsets: array = array("q")
+        self.constant_indexes: array = array("q")
+        self.constants: list[tuple] = []
+        self.constant_to_index: dict[tuple, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __add_constants(self, values: tuple) -> int:
+        key = tuple((type(value), value) for value in values)
+        if (index := self.constant_to_index.get(key)) is None:
+            index = self.constant_to_index[key] = len(self.constants)
+            self.constants.append(values)
+        return index
+
+    def __add_node(self, value: any) -> int:
+        index = len(self.kinds)
+        constant_index = NO_INDEX
+        offset = None
+        if value is None:
+            kind = NONE_KIND
+        elif isinstance(value, list):
+            kind = LIST_KIND
+        else:
+            kind = class_to_kind[type(value)]
+            offset = value.offset
+            if node_constant_fields := node_layouts[kind][1]:
+                constant_index = self.__add_constants(
+                    tuple(getattr(value, field) for field in node_constant_fields)
+                )
+        self.kinds.append(kind)
+        self.first_children.append(NO_INDEX)
+        self.next_siblings.append(NO_INDEX)
+        self.offsets.append(NO_INDEX if offset is None else offset)
+        self.constant_indexes.append(constant_index)
+        return index
+
+    def add_tree(self, root: any) -> int:
+        root_index = len(self.kinds)
+        last_children: dict[int, int] = {}
+        stack = [(root, NO_INDEX)]
+        while stack:
+            value, parent = stack.pop()
+            index = self.__add_node(value)
+            if parent != NO_INDEX:
+                if (previous := last_children.get(parent)) is None:
+                    self.first_children[parent] = index
+                else:
+                    self.next_siblings[previous] = index
+                last_children[parent] = index
+            if value is None:
+                continue
+            if isinstance(value, list):
+                children = value
+            else:
+                children = [
+                    getattr(value, field)
+                    for field in node_layouts[self.kinds[index]][0]
+                ]
+            stack.extend((child, index) for child in reversed(children))
+        return root_index
+
+    def get_kind(self, index: int) -> int:
+        return self.kinds[index]
+
+    def get_node_class(self, index: int) -> type | None:
+        kind = self.kinds[index]
+        return ast_node_classes[kind] if kind < LIST_KIND else None
+
+    def get_offset(self, index: int) -> int | None:
+        offset = self.offsets[index]
+        return None if offset == NO_INDEX else offset
+
+    def get_constants(self, index: int) -> tuple:
+        constant_index = self.constant_indexes[index]
+        return () if constant_index == NO_INDEX else self.constants[constant_index]
+
+    def get_children(self, index: int) -> Iterator[int]:
+        child = self.first_children[index]
+        while child != NO_INDEX:
+            yield child
+            child = self.next_siblings[child]
+
+    def get_subtree_end(self, index: int) -> int:
+        while (child := self.first_children[index]) != NO_INDEX:
+            while (sibling := self.next_siblings[child]) != NO_INDEX:
+                child = sibling
+            index = child
+        return index + 1
+
+    def __create_node(self, index: int) -> any:
+        kind = self.kinds[index]
+        node = object.__new__(ast_node_classes[kind])
+        offset = self.offsets[index]
+        node.offset = None if offset == NO_INDEX else offset
+        if (constant_index := self.constant_indexes[index]) != NO_INDEX:
+            for field, value in zip(
+                node_layouts[kind][1], self.constants[constant_index]
+            ):
+                setattr(node, field, value)
+        return node
+
+    def build_tree(self, root_index: int = 0) -> any:
+        end = self.get_subtree_end(root_index)
+        kinds = self.kinds
+        first_children = self.first_children
+        next_siblings = self.next_siblings
+        values = [None] * (end - root_index)
+        for index in range(end - 1, root_index - 1, -1):
+            kind = kinds[index]
+            if kind == NONE_KIND:
+                continue
+            children = []
+            child = first_children[index]
+            while child != NO_INDEX:
+                children.append(values[child - root_index])
+                child = next_siblings[child]
+            if kind == LIST_KIND:
+                values[index - root_index] = children
+                continue
+            node = self.__create_node(index)
+            for field, child in zip(node_layouts[kind][0], children):
+                setattr(node, field, child)
+            values[index - root_index] = node
+        return values[0]
+
+    @classmethod
+    def from_program(cls, program: Program) -> FlatAst:
+        flat_ast = cls(program.line_index)
+        flat_ast.add_tree(
+            [
+                function
+                for function in program.functions.values()
+                if isinstance(function, FunctionDef)
+            ]
+        )
+        return flat_ast
+
+    def dump(self, file: BinaryIO) -> None:
+        for values in (
+            self.kinds,
+            self.first_children,
+            self.next_siblings,
+            self.offsets,
+            self.constant_indexes,
+            self.line_index.line_starts,
+        ):
+            write_block(file, values.tobytes())
+        write_block(file, json.dumps(self.constants).encode())
+
+    @classmethod
+    def load(cls, file: BinaryIO) -> FlatAst:
+        (
+            kinds,
+            first_children,
+            next_siblings,
+            offsets,
+            constant_indexes,
+            line_starts,
+        ) = [array(typecode, read_block(file)) for typecode in "BqqqqI"]
+        constants = json.loads(read_block(file).decode())
+        flat_ast = cls(LineIndex(line_starts))
+        flat_ast.kinds = kinds
+        flat_ast.first_children = first_children
+        flat_ast.next_siblings = next_siblings
+        flat_ast.offsets = offsets
+        flat_ast.constant_indexes = constant_indexes
+        flat_ast.constants = [tuple(values) for values in constants]
+        flat_ast.__validate()
+        return flat_ast
+
+    def __validate(self) -> None:
+        size = len(self.kinds)
+        if (
+            not size
+            or self.kinds[0] != LIST_KIND
+            or not self.line_index.line_starts
+            or self.line_index.line_starts[0] != 0
+            or any(
+                len(values) != size
+                for values in (
+                    self.first_children,
+                    self.next_siblings,
+                    self.offsets,
+                    self.constant_indexes,
+                )
+            )
+            or any(kind > NONE_KIND for kind in self.kinds)
+            or any(
+                index != NO_INDEX and not node_index < index < size
+                for indexes in (self.first_children, self.next_siblings)
+                for node_index, index in enumerate(indexes)
+            )
+        ):
+            raise ValueError("Flat AST data is corrupt")
+        for index, kind in enumerate(self.kinds):
+            if kind >= LIST_KIND:
+                continue
+            child_fields, node_constant_fields = node_layouts[kind]
+            constant_index = self.constant_indexes[index]
+            if constant_index == NO_INDEX:
+                constants = ()
+            elif 0 <= constant_index < len(self.constants):
+                constants = self.constants[constant_index]
+            else:
+                raise ValueError("Flat AST data is corrupt")
+            if (
+                len(constants) != len(node_constant_fields)
+                or not all(isinstance(value, constant_types) for value in constants)
+                or sum(1 for _ in self.get_children(index)) != len(child_fields)
+            ):
+                raise ValueError("Flat AST data is corrupt")
+
+    def to_program(self, lazy_bodies: bool = False) -> Program:
+        function_kind = class_to_kind[FunctionDef]
+        if any(self.kinds[index] != function_kind for index in self.get_children(0)):
+            raise ValueError("Flat AST data does not describe a program")
+        functions = get_built_in_functions()
+        if not lazy_bodies:
+            for function in self.build_tree(0):
+                functions[function.name] = function
+            return Program(functions, self.line_index)
+        block_loaders: dict[str, Callable[[], BlockStatement]] = {}
+        for index in self.get_children(0):
+            parameters_index, block_index = self.get_children(index)
+            function = self.__create_node(index)
+            function.parameters = self.build_tree(parameters_index)
+            function.block = None
+            functions[function.name] = function
+            block_loaders[function.name] = partial(self.build_tree, block_index)
+        return Program(functions, self.line_index, block_loaders=block_loaders)
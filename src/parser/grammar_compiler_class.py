@@ -0,0 +1,325 @@
+import argparse
+import re
+import sys
+from pathlib import Path
+
+from lexer.helpers import keywords, maybe_two_char_token, single_char_tokens
+from lexer.token_type_enum import TokenType
+
+GRAMMAR_PATH = Path(__file__).parents[2] / "grammar" / "grammar.ebnf"
+TABLES_PATH = Path(__file__).parent / "grammar_tables.py"
+START_RULE = "program"
+MAX_LINE_LENGTH = 88
+INDENT = "    "
+
+ebnf_token_pattern = re.compile(
+    r"""\s+|\(\*.*?\*\)|@\w+|'[^']*'|"[^"]*"|\?[^?]*\?|\w+|[=,|;()\[\]{}]""",
+    re.DOTALL,
+)
+
+terminal_to_token_type: dict[str, TokenType] = {**single_char_tokens, **keywords}
+for first_char, (second_char, single, double) in maybe_two_char_token.items():
+    terminal_to_token_type[first_char] = single
+    terminal_to_token_type[first_char + second_char] = double
+
+token_rules: dict[str, tuple[TokenType, ...]] = {
+    "identifier": (TokenType.T_IDENTIFIER,),
+    "number": (TokenType.T_INT_LITERAL, TokenType.T_FLOAT_LITERAL),
+    "string": (TokenType.T_STRING_LITERAL,),
+}
+
+closing_brackets: dict[str, str] = {"(": ")", "[": "]", "{": "}"}
+bracket_kinds: dict[str, str] = {"(": "group", "[": "option", "{": "repeat"}
+
+
+class GrammarError(Exception):
+    pass
+
+
+class GrammarCompiler:
+    def __init__(self, text: str) -> None:
+        self.tokens: list[str] = self.__tokenize(text)
+        self.position: int = 0
+        self.rules: dict[str, tuple] = {}
+        self.productions: list[tuple[str, str, tuple[str, ...]]] = []
+        self.nonterminals: list[str] = []
+        self.helper_counts: dict[str, int] = {}
+        self.parse_table: dict[str, dict[str, int]] = {}
+        self.empty_productions: dict[str, int] = {}
+
+    ############################## EBNF ##############################
+
+    @staticmethod
+    def __tokenize(text: str) -> list[str]:
+        tokens = []
+        position = 0
+        while position < len(text):
+            if not (match := ebnf_token_pattern.match(text, position)):
+                raise GrammarError(f"Unexpected character {text[position]!r}")
+            token = match.group()
+            if not token.isspace() and not token.startswith(("(*", "@")):
+                tokens.append(token)
+            position = match.end()
+        return tokens
+
+    def __peek(self) -> str | None:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def __expect(self, token: str) -> None:
+        if self.__peek() != token:
+            raise GrammarError(f"Expected {token!r}, got {self.__peek()!r}")
+        self.position += 1
+
+    def __parse_term(self) -> tuple:
+        token = self.__peek()
+        if token is None:
+            raise GrammarError("Unexpected end of grammar")
+        self.position += 1
+        if token in closing_brackets:
+            term = self.__parse_choice()
+            self.__expect(closing_brackets[token])
+            return term if token == "(" else (bracket_kinds[token], term)
+        if token[0] in "'\"":
+            return ("terminal", token[1:-1])
+        if token[0] == "?":
+            return ("special", token)
+        if token[0].isalnum() or token[0] == "_":
+            return ("rule", token)
+        raise GrammarError(f"Unexpected {token!r}")
+
+    def __parse_sequence(self) -> tuple:
+        terms = [self.__parse_term()]
+        while self.__peek() == ",":
+            self.position += 1
+            terms.append(self.__parse_term())
+        return terms[0] if len(terms) == 1 else ("sequence", terms)
+
+    def __parse_choice(self) -> tuple:
+        alternatives = [self.__parse_sequence()]
+        while self.__peek() == "|":
+            self.position += 1
+            alternatives.append(self.__parse_sequence())
+        return alternatives[0] if len(alternatives) == 1 else ("choice", alternatives)
+
+    def __parse_rules(self) -> None:
+        while (name := self.__peek()) is not None:
+            self.position += 1
+            if name in self.rules:
+                raise GrammarError(f"Rule {name} is defined twice")
+            self.__expect("=")
+            self.rules[name] = self.__parse_choice()
+            self.__expect(";")
+
+    ############################## LOWERING ##############################
+
+    def __add_production(self, lhs: str, action: str, rhs: list[str]) -> None:
+        self.productions.append((lhs, action, tuple(rhs)))
+
+    def __add_helper(self, rule: str, kind: str) -> str:
+        self.helper_counts[rule] = self.helper_counts.get(rule, 0) + 1
+        helper = f"{rule}__{kind}_{self.helper_counts[rule]}"
+        self.nonterminals.append(helper)
+        return helper
+
+    def __add_alternatives(
+        self, rule: str, lhs: str, action: str, term: tuple, pending: list[str]
+    ) -> None:
+        alternatives = term[1] if term[0] == "choice" else [term]
+        for alternative in alternatives:
+            rhs = self.__lower_sequence(rule, alternative, pending)
+            is_alias = len(rhs) == 1 and rhs[0] in self.rules
+            self.__add_production(lhs, "" if is_alias else action, rhs)
+
+    def __lower_sequence(self, rule: str, term: tuple, pending: list[str]) -> list:
+        terms = term[1] if term[0] == "sequence" else [term]
+        return [self.__lower_term(rule, term, pending) for term in terms]
+
+    def __lower_term(self, rule: str, term: tuple, pending: list[str]) -> str:
+        kind = term[0]
+        if kind == "terminal":
+            if (token_type := terminal_to_token_type.get(term[1])) is None:
+                raise GrammarError(f"Unknown terminal {term[1]!r} in {rule}")
+            return token_type.name
+        if kind == "rule":
+            if term[1] not in self.rules:
+                raise GrammarError(f"Undefined rule {term[1]} in {rule}")
+            if term[1] not in self.nonterminals:
+                self.nonterminals.append(term[1])
+                pending.append(term[1])
+            return term[1]
+        if kind == "special":
+            raise GrammarError(f"Special sequence {term[1]} in {rule}")
+        if kind in ("sequence", "choice"):
+            helper = self.__add_helper(rule, "group")
+            self.__add_alternatives(rule, helper, "", term, pending)
+        elif kind == "option":
+            helper = self.__add_helper(rule, "option")
+            self.__add_alternatives(rule, helper, "", term[1], pending)
+            self.__add_production(helper, "", [])
+        else:
+            helper = self.__add_helper(rule, "list")
+            items = self.__add_helper(rule, "repeat")
+            self.__add_production(helper, "repeat_list", [items])
+            self.__add_production(
+                items,
+                "repeat",
+                self.__lower_sequence(rule, term[1], pending) + [items],
+            )
+            self.__add_production(items, "repeat_end", [])
+        return helper
+
+    def __lower_rules(self) -> None:
+        if START_RULE not in self.rules:
+            raise GrammarError(f"Missing start rule {START_RULE}")
+        self.nonterminals.append(START_RULE)
+        pending = [START_RULE]
+        while pending:
+            rule = pending.pop(0)
+            if rule in token_rules:
+                for token_type in token_rules[rule]:
+                    self.__add_production(rule, rule, [token_type.name])
+            else:
+                self.__add_alternatives(rule, rule, rule, self.rules[rule], pending)
+        order = {rule: index for index, rule in enumerate(self.nonterminals)}
+        self.productions.sort(key=lambda production: order[production[0]])
+
+    ############################## LL(1) TABLE ##############################
+
+    def __get_sequence_first(
+        self, symbols: tuple[str, ...], first: dict[str, set[str]]
+    ) -> tuple[set[str], bool]:
+        sequence_first = set()
+        for symbol in symbols:
+            if symbol not in first:
+                sequence_first.add(symbol)
+                return sequence_first, False
+            sequence_first |= first[symbol] - {""}
+            if "" not in first[symbol]:
+                return sequence_first, False
+        return sequence_first, True
+
+    def __compute_first(self) -> dict[str, set[str]]:
+        first = {nonterminal: set() for nonterminal in self.nonterminals}
+        changed = True
+        while changed:
+            changed = False
+            for lhs, _, rhs in self.productions:
+                sequence_first, nullable = self.__get_sequence_first(rhs, first)
+                if nullable:
+                    sequence_first.add("")
+                if not sequence_first <= first[lhs]:
+                    first[lhs] |= sequence_first
+                    changed = True
+        return first
+
+    def __compute_follow(self, first: dict[str, set[str]]) -> dict[str, set[str]]:
+        follow = {nonterminal: set() for nonterminal in self.nonterminals}
+        follow[START_RULE].add(TokenType.T_EOF.name)
+        changed = True
+        while changed:
+            changed = False
+            for lhs, _, rhs in self.productions:
+                for index, symbol in enumerate(rhs):
+                    if symbol not in follow:
+                        continue
+                    rest_first, nullable = self.__get_sequence_first(
+                        rhs[index + 1 :], first
+                    )
+                    if nullable:
+                        rest_first |= follow[lhs]
+                    if not rest_first <= follow[symbol]:
+                        follow[symbol] |= rest_first
+                        changed = True
+        return follow
+
+    def __build_parse_table(self) -> None:
+        first = self.__compute_first()
+        follow = self.__compute_follow(first)
+        self.parse_table = {nonterminal: {} for nonterminal in self.nonterminals}
+        for production, (lhs, _, rhs) in enumerate(self.productions):
+            sequence_first, nullable = self.__get_sequence_first(rhs, first)
+            row = self.parse_table[lhs]
+            for terminal in sequence_first:
+                if terminal in row:
+                    raise GrammarError(f"LL(1) conflict in {lhs} on {terminal}")
+                row[terminal] = production
+            if nullable:
+                if lhs in self.empty_productions:
+                    raise GrammarError(f"LL(1) conflict in {lhs} on empty input")
+                self.empty_productions[lhs] = production
+        for lhs, production in self.empty_productions.items():
+            row = self.parse_table[lhs]
+            for terminal in follow[lhs]:
+                row.setdefault(terminal, production)
+        for nonterminal, row in self.parse_table.items():
+            self.parse_table[nonterminal] = dict(
+                sorted(row.items(), key=lambda item: TokenType[item[0]])
+            )
+
+    def compile(self) -> None:
+        self.__parse_rules()
+        self.__lower_rules()
+        self.__build_parse_table()
+
+    ############################## CODE GENERATION ##############################
+
+    @classmethod
+    def __format_value(cls, value: any, indent: str = "", prefix: str = "") -> str:
+        if isinstance(value, str):
+            return f'"{value}"'
+        if isinstance(value, int):
+            return str(value)
+        if isinstance(value, dict):
+            brackets = "{}"
+            items = [
+                (f"{cls.__format_value(key)}: ", item) for key, item in value.items()
+            ]
+        else:
+            brackets = "[]" if isinstance(value, list) else "()"
+            items = [("", item) for item in value]
+        one_line = ", ".join(
+            item_prefix + cls.__format_value(item) for item_prefix, item in items
+        )
+        if isinstance(value, tuple) and len(items) == 1:
+            one_line += ","
+        if len(indent) + len(prefix) + len(one_line) + 3 <= MAX_LINE_LENGTH:
+            return brackets[0] + one_line + brackets[1]
+        inner_indent = indent + INDENT
+        lines = "".join(
+            f"{inner_indent}{item_prefix}"
+            f"{cls.__format_value(item, inner_indent, item_prefix)},\n"
+            for item_prefix, item in items
+        )
+        return f"{brackets[0]}\n{lines}{indent}{brackets[1]}"
+
+    def generate_tables_source(self) -> str:
+        return (
+            "# Generated from grammar/grammar.ebnf by"
+            " `python -m parser.grammar_compiler_class`.\n"
+            "# Do not edit by hand.\n\n"
+            f'START_SYMBOL = "{START_RULE}"\n\n'
+            "productions: list[tuple[str, str, tuple[str, ...]]] = "
+            f"{self.__format_value(self.productions)}\n\n"
+            "parse_table: dict[str, dict[str, int]] = "
+            f"{self.__format_value(self.parse_table)}\n\n"
+            "empty_productions: dict[str, int] = "
+            f"{self.__format_value(self.empty_productions)}\n"
+        )
+
+
+def parse_arguments(arguments: list[str]) -> argparse.Namespace:
+    argument_parser = argparse.ArgumentParser(description="JP grammar compiler")
+    argument_parser.add_argument("--grammar", type=Path, default=GRAMMAR_PATH)
+    argument_parser.add_argument("--output", type=Path, default=TABLES_PATH)
+    return argument_parser.parse_args(arguments)
+
+
+def main(arguments: list[str] | None = None):
+    arguments = parse_arguments(sys.argv[1:] if arguments is None else arguments)
+    grammar_compiler = GrammarCompiler(arguments.grammar.read_text())
+    grammar_compiler.compile()
+    arguments.output.write_text(grammar_compiler.generate_tables_source())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1007 @@
+# Generated from grammar/grammar.ebnf by `python -m parser.grammar_compiler_class`.
+# Do not edit by hand.
+
+START_SYMBOL = "program"
+
+productions: list[tuple[str, str, tuple[str, ...]]] = [
+    ("program", "program", ("program__list_1",)),
+    ("program__list_1", "repeat_list", ("program__repeat_2",)),
+    ("program__repeat_2", "repeat", ("function_definition", "program__repeat_2")),
+    ("program__repeat_2", "repeat_end", ()),
+    (
+        "function_definition",
+        "function_definition",
+        (
+            "identifier",
+            "T_LEFT_BRACKET",
+            "function_definition__option_1",
+            "T_RIGHT_BRACKET",
+            "instruction_block",
+        ),
+    ),
+    ("identifier", "identifier", ("T_IDENTIFIER",)),
+    ("function_definition__option_1", "", ("params",)),
+    ("function_definition__option_1", "", ()),
+    ("params", "params", ("param", "params__list_1")),
+    (
+        "instruction_block",
+        "instruction_block",
+        ("T_LEFT_CURLY_BRACKET", "instruction_block__list_1", "T_RIGHT_CURLY_BRACKET"),
+    ),
+    ("param", "param", ("identifier", "param__option_1")),
+    ("params__list_1", "repeat_list", ("params__repeat_2",)),
+    ("params__repeat_2", "repeat", ("T_COMMA", "param", "params__repeat_2")),
+    ("params__repeat_2", "repeat_end", ()),
+    ("instruction_block__list_1", "repeat_list", ("instruction_block__repeat_2",)),
+    (
+        "instruction_block__repeat_2",
+        "repeat",
+        ("statement", "instruction_block__repeat_2"),
+    ),
+    ("instruction_block__repeat_2", "repeat_end", ()),
+    ("statement", "", ("variable_value_change_statement",)),
+    ("statement", "", ("return_statement",)),
+    ("statement", "", ("if_statement",)),
+    ("statement", "", ("while_statement",)),
+    ("statement", "", ("iterator_for_statement",)),
+    ("statement", "", ("exception_throw_statement",)),
+    ("statement", "", ("try_catch_statement",)),
+    ("statement", "statement", ("T_BREAK", "T_SEMICOLON")),
+    ("statement", "statement", ("T_CONTINUE", "T_SEMICOLON")),
+    ("param__option_1", "", ("T_OPTIONAL", "param__option_2")),
+    ("param__option_1", "", ()),
+    ("param__option_2", "", ("T_ASSIGN", "factor")),
+    ("param__option_2", "", ()),
+    ("factor", "", ("property_access",)),
+    ("factor", "", ("number",)),
+    ("factor", "", ("string",)),
+    ("factor", "", ("boolean",)),
+    ("factor", "", ("null",)),
+    (
+        "variable_value_change_statement",
+        "variable_value_change_statement",
+        ("property_access", "variable_value_change_statement__option_1", "T_SEMICOLON"),
+    ),
+    (
+        "return_statement",
+        "return_statement",
+        ("T_RETURN", "return_statement__option_1", "T_SEMICOLON"),
+    ),
+    (
+        "if_statement",
+        "if_statement",
+        ("if_block", "if_statement__list_1", "if_statement__option_3"),
+    ),
+    (
+        "while_statement",
+        "while_statement",
+        (
+            "T_WHILE",
+            "T_LEFT_BRACKET",
+            "expression",
+            "T_RIGHT_BRACKET",
+            "instruction_block",
+        ),
+    ),
+    (
+        "iterator_for_statement",
+        "iterator_for_statement",
+        (
+            "T_FOR",
+            "T_LEFT_BRACKET",
+            "identifier",
+            "T_COLON",
+            "property_access",
+            "T_RIGHT_BRACKET",
+            "instruction_block",
+        ),
+    ),
+    (
+        "exception_throw_statement",
+        "exception_throw_statement",
+        ("T_THROW", "identifier_or_function_call", "T_SEMICOLON"),
+    ),
+    (
+        "try_catch_statement",
+        "try_catch_statement",
+        ("try_block", "catch_block", "try_catch_statement__list_1"),
+    ),
+    (
+        "property_access",
+        "property_access",
+        ("identifier_or_function_call", "property_access__list_1"),
+    ),
+    ("number", "number", ("T_INT_LITERAL",)),
+    ("number", "number", ("T_FLOAT_LITERAL",)),
+    ("string", "string", ("T_STRING_LITERAL",)),
+    ("boolean", "boolean", ("T_TRUE",)),
+    ("boolean", "boolean", ("T_FALSE",)),
+    ("null", "null", ("T_NULL",)),
+    (
+        "variable_value_change_statement__option_1",
+        "",
+        ("assignment_operator", "expression"),
+    ),
+    ("variable_value_change_statement__option_1", "", ()),
+    ("assignment_operator", "assignment_operator", ("T_ASSIGN",)),
+    ("assignment_operator", "assignment_operator", ("T_ASSIGN_PLUS",)),
+    ("assignment_operator", "assignment_operator", ("T_ASSIGN_MINUS",)),
+    ("assignment_operator", "assignment_operator", ("T_ASSIGN_MULTIPLY",)),
+    ("assignment_operator", "assignment_operator", ("T_ASSIGN_DIVIDE",)),
+    ("assignment_operator", "assignment_operator", ("T_ASSIGN_MODULO",)),
+    ("expression", "", ("or_expression",)),
+    ("return_statement__option_1", "", ("expression",)),
+    ("return_statement__option_1", "", ()),
+    (
+        "if_block",
+        "if_block",
+        (
+            "T_IF",
+            "T_LEFT_BRACKET",
+            "expression",
+            "T_RIGHT_BRACKET",
+            "instruction_block",
+        ),
+    ),
+    ("if_statement__list_1", "repeat_list", ("if_statement__repeat_2",)),
+    ("if_statement__repeat_2", "repeat", ("else_if_block", "if_statement__repeat_2")),
+    ("if_statement__repeat_2", "repeat_end", ()),
+    (
+        "else_if_block",
+        "else_if_block",
+        (
+            "T_ELIF",
+            "T_LEFT_BRACKET",
+            "expression",
+            "T_RIGHT_BRACKET",
+            "instruction_block",
+        ),
+    ),
+    ("if_statement__option_3", "", ("else_block",)),
+    ("if_statement__option_3", "", ()),
+    ("else_block", "else_block", ("T_ELSE", "instruction_block")),
+    (
+        "identifier_or_function_call",
+        "identifier_or_function_call",
+        ("identifier", "identifier_or_function_call__option_1"),
+    ),
+    ("try_block", "try_block", ("T_TRY", "instruction_block")),
+    (
+        "catch_block",
+        "catch_block",
+        ("T_CATCH", "catch_block__option_1", "instruction_block"),
+    ),
+    ("try_catch_statement__list_1", "repeat_list", ("try_catch_statement__repeat_2",)),
+    (
+        "try_catch_statement__repeat_2",
+        "repeat",
+        ("catch_block", "try_catch_statement__repeat_2"),
+    ),
+    ("try_catch_statement__repeat_2", "repeat_end", ()),
+    ("property_access__list_1", "repeat_list", ("property_access__repeat_2",)),
+    (
+        "property_access__repeat_2",
+        "repeat",
+        ("access_operator", "identifier_or_function_call", "property_access__repeat_2"),
+    ),
+    ("property_access__repeat_2", "repeat_end", ()),
+    ("access_operator", "access_operator", ("T_ACCESS",)),
+    ("access_operator", "access_operator", ("T_NULLABLE_ACCESS",)),
+    ("or_expression", "or_expression", ("and_expression", "or_expression__list_1")),
+    (
+        "identifier_or_function_call__option_1",
+        "",
+        ("T_LEFT_BRACKET", "identifier_or_function_call__option_2", "T_RIGHT_BRACKET"),
+    ),
+    ("identifier_or_function_call__option_1", "", ()),
+    ("identifier_or_function_call__option_2", "", ("arguments",)),
+    ("identifier_or_function_call__option_2", "", ()),
+    ("arguments", "arguments", ("argument", "arguments__list_1")),
+    (
+        "catch_block__option_1",
+        "",
+        (
+            "T_LEFT_BRACKET",
+            "identifier",
+            "catch_block__list_2",
+            "identifier",
+            "T_RIGHT_BRACKET",
+        ),
+    ),
+    ("catch_block__option_1", "", ()),
+    ("catch_block__list_2", "repeat_list", ("catch_block__repeat_3",)),
+    (
+        "catch_block__repeat_3",
+        "repeat",
+        ("or_operator", "identifier", "catch_block__repeat_3"),
+    ),
+    ("catch_block__repeat_3", "repeat_end", ()),
+    ("or_operator", "or_operator", ("T_OR",)),
+    (
+        "and_expression",
+        "and_expression",
+        ("comparison_expression", "and_expression__list_1"),
+    ),
+    ("or_expression__list_1", "repeat_list", ("or_expression__repeat_2",)),
+    (
+        "or_expression__repeat_2",
+        "repeat",
+        ("or_operator", "and_expression", "or_expression__repeat_2"),
+    ),
+    ("or_expression__repeat_2", "repeat_end", ()),
+    ("argument", "argument", ("argument__option_1", "expression")),
+    ("arguments__list_1", "repeat_list", ("arguments__repeat_2",)),
+    ("arguments__repeat_2", "repeat", ("T_COMMA", "argument", "arguments__repeat_2")),
+    ("arguments__repeat_2", "repeat_end", ()),
+    (
+        "comparison_expression",
+        "comparison_expression",
+        ("additive_expression", "comparison_expression__list_1"),
+    ),
+    ("and_expression__list_1", "repeat_list", ("and_expression__repeat_2",)),
+    (
+        "and_expression__repeat_2",
+        "repeat",
+        ("and_operator", "comparison_expression", "and_expression__repeat_2"),
+    ),
+    ("and_expression__repeat_2", "repeat_end", ()),
+    ("and_operator", "and_operator", ("T_AND",)),
+    ("argument__option_1", "", ("reference_operator",)),
+    ("argument__option_1", "", ()),
+    ("reference_operator", "reference_operator", ("T_REF",)),
+    (
+        "additive_expression",
+        "additive_expression",
+        ("multiplicative_expression", "additive_expression__list_1"),
+    ),
+    (
+        "comparison_expression__list_1",
+        "repeat_list",
+        ("comparison_expression__repeat_2",),
+    ),
+    (
+        "comparison_expression__repeat_2",
+        "repeat",
+        (
+            "comparison_operator",
+            "additive_expression",
+            "comparison_expression__repeat_2",
+        ),
+    ),
+    ("comparison_expression__repeat_2", "repeat_end", ()),
+    ("comparison_operator", "comparison_operator", ("T_EQUAL",)),
+    ("comparison_operator", "comparison_operator", ("T_NOT_EQUAL",)),
+    ("comparison_operator", "comparison_operator", ("T_LESS",)),
+    ("comparison_operator", "comparison_operator", ("T_GREATER",)),
+    ("comparison_operator", "comparison_operator", ("T_LESS_EQUAL",)),
+    ("comparison_operator", "comparison_operator", ("T_GREATER_EQUAL",)),
+    (
+        "multiplicative_expression",
+        "multiplicative_expression",
+        ("negation_expression", "multiplicative_expression__list_1"),
+    ),
+    ("additive_expression__list_1", "repeat_list", ("additive_expression__repeat_2",)),
+    (
+        "additive_expression__repeat_2",
+        "repeat",
+        (
+            "additive_operator",
+            "multiplicative_expression",
+            "additive_expression__repeat_2",
+        ),
+    ),
+    ("additive_expression__repeat_2", "repeat_end", ()),
+    ("additive_operator", "additive_operator", ("T_PLUS",)),
+    ("additive_operator", "additive_operator", ("T_MINUS",)),
+    ("negation_expression", "negation_expression", ("negation_operator", "expression")),
+    ("negation_expression", "", ("type_check_operation",)),
+    (
+        "multiplicative_expression__list_1",
+        "repeat_list",
+        ("multiplicative_expression__repeat_2",),
+    ),
+    (
+        "multiplicative_expression__repeat_2",
+        "repeat",
+        (
+            "multiplicative_operator",
+            "negation_expression",
+            "multiplicative_expression__repeat_2",
+        ),
+    ),
+    ("multiplicative_expression__repeat_2", "repeat_end", ()),
+    ("multiplicative_operator", "multiplicative_operator", ("T_MULTIPLY",)),
+    ("multiplicative_operator", "multiplicative_operator", ("T_DIVIDE",)),
+    ("multiplicative_operator", "multiplicative_operator", ("T_MODULO",)),
+    ("negation_operator", "negation_operator", ("T_NOT",)),
+    ("negation_operator", "negation_operator", ("T_MINUS",)),
+    (
+        "type_check_operation",
+        "type_check_operation",
+        ("base_expression", "type_check_operation__option_1"),
+    ),
+    ("base_expression", "", ("factor",)),
+    (
+        "base_expression",
+        "base_expression",
+        ("T_LEFT_BRACKET", "expression", "T_RIGHT_BRACKET"),
+    ),
+    ("type_check_operation__option_1", "", ("type_check_operator", "identifier")),
+    ("type_check_operation__option_1", "", ()),
+    ("type_check_operator", "type_check_operator", ("T_TYPE_CHECK",)),
+]
+
+parse_table: dict[str, dict[str, int]] = {
+    "program": {"T_IDENTIFIER": 0, "T_EOF": 0},
+    "program__list_1": {"T_IDENTIFIER": 1, "T_EOF": 1},
+    "program__repeat_2": {"T_IDENTIFIER": 2, "T_EOF": 3},
+    "function_definition": {"T_IDENTIFIER": 4},
+    "identifier": {"T_IDENTIFIER": 5},
+    "function_definition__option_1": {"T_RIGHT_BRACKET": 7, "T_IDENTIFIER": 6},
+    "params": {"T_IDENTIFIER": 8},
+    "instruction_block": {"T_LEFT_CURLY_BRACKET": 9},
+    "param": {"T_IDENTIFIER": 10},
+    "params__list_1": {"T_RIGHT_BRACKET": 11, "T_COMMA": 11},
+    "params__repeat_2": {"T_RIGHT_BRACKET": 13, "T_COMMA": 12},
+    "instruction_block__list_1": {
+        "T_RETURN": 14,
+        "T_BREAK": 14,
+        "T_CONTINUE": 14,
+        "T_TRY": 14,
+        "T_THROW": 14,
+        "T_IF": 14,
+        "T_WHILE": 14,
+        "T_FOR": 14,
+        "T_RIGHT_CURLY_BRACKET": 14,
+        "T_IDENTIFIER": 14,
+    },
+    "instruction_block__repeat_2": {
+        "T_RETURN": 15,
+        "T_BREAK": 15,
+        "T_CONTINUE": 15,
+        "T_TRY": 15,
+        "T_THROW": 15,
+        "T_IF": 15,
+        "T_WHILE": 15,
+        "T_FOR": 15,
+        "T_RIGHT_CURLY_BRACKET": 16,
+        "T_IDENTIFIER": 15,
+    },
+    "statement": {
+        "T_RETURN": 18,
+        "T_BREAK": 24,
+        "T_CONTINUE": 25,
+        "T_TRY": 23,
+        "T_THROW": 22,
+        "T_IF": 19,
+        "T_WHILE": 20,
+        "T_FOR": 21,
+        "T_IDENTIFIER": 17,
+    },
+    "param__option_1": {"T_RIGHT_BRACKET": 27, "T_COMMA": 27, "T_OPTIONAL": 26},
+    "param__option_2": {"T_ASSIGN": 28, "T_RIGHT_BRACKET": 29, "T_COMMA": 29},
+    "factor": {
+        "T_INT_LITERAL": 31,
+        "T_FLOAT_LITERAL": 31,
+        "T_STRING_LITERAL": 32,
+        "T_TRUE": 33,
+        "T_FALSE": 33,
+        "T_NULL": 34,
+        "T_IDENTIFIER": 30,
+    },
+    "variable_value_change_statement": {"T_IDENTIFIER": 35},
+    "return_statement": {"T_RETURN": 36},
+    "if_statement": {"T_IF": 37},
+    "while_statement": {"T_WHILE": 38},
+    "iterator_for_statement": {"T_FOR": 39},
+    "exception_throw_statement": {"T_THROW": 40},
+    "try_catch_statement": {"T_TRY": 41},
+    "property_access": {"T_IDENTIFIER": 42},
+    "number": {"T_INT_LITERAL": 43, "T_FLOAT_LITERAL": 44},
+    "string": {"T_STRING_LITERAL": 45},
+    "boolean": {"T_TRUE": 46, "T_FALSE": 47},
+    "null": {"T_NULL": 48},
+    "variable_value_change_statement__option_1": {
+        "T_ASSIGN": 49,
+        "T_ASSIGN_PLUS": 49,
+        "T_ASSIGN_MINUS": 49,
+        "T_ASSIGN_MULTIPLY": 49,
+        "T_ASSIGN_DIVIDE": 49,
+        "T_ASSIGN_MODULO": 49,
+        "T_SEMICOLON": 50,
+    },
+    "assignment_operator": {
+        "T_ASSIGN": 51,
+        "T_ASSIGN_PLUS": 52,
+        "T_ASSIGN_MINUS": 53,
+        "T_ASSIGN_MULTIPLY": 54,
+        "T_ASSIGN_DIVIDE": 55,
+        "T_ASSIGN_MODULO": 56,
+    },
+    "expression": {
+        "T_INT_LITERAL": 57,
+        "T_FLOAT_LITERAL": 57,
+        "T_STRING_LITERAL": 57,
+        "T_TRUE": 57,
+        "T_FALSE": 57,
+        "T_NULL": 57,
+        "T_MINUS": 57,
+        "T_NOT": 57,
+        "T_LEFT_BRACKET": 57,
+        "T_IDENTIFIER": 57,
+    },
+    "return_statement__option_1": {
+        "T_INT_LITERAL": 58,
+        "T_FLOAT_LITERAL": 58,
+        "T_STRING_LITERAL": 58,
+        "T_TRUE": 58,
+        "T_FALSE": 58,
+        "T_NULL": 58,
+        "T_MINUS": 58,
+        "T_NOT": 58,
+        "T_LEFT_BRACKET": 58,
+        "T_IDENTIFIER": 58,
+        "T_SEMICOLON": 59,
+    },
+    "if_block": {"T_IF": 60},
+    "if_statement__list_1": {
+        "T_RETURN": 61,
+        "T_BREAK": 61,
+        "T_CONTINUE": 61,
+        "T_TRY": 61,
+        "T_THROW": 61,
+        "T_IF": 61,
+        "T_ELIF": 61,
+        "T_ELSE": 61,
+        "T_WHILE": 61,
+        "T_FOR": 61,
+        "T_RIGHT_CURLY_BRACKET": 61,
+        "T_IDENTIFIER": 61,
+    },
+    "if_statement__repeat_2": {
+        "T_RETURN": 63,
+        "T_BREAK": 63,
+        "T_CONTINUE": 63,
+        "T_TRY": 63,
+        "T_THROW": 63,
+        "T_IF": 63,
+        "T_ELIF": 62,
+        "T_ELSE": 63,
+        "T_WHILE": 63,
+        "T_FOR": 63,
+        "T_RIGHT_CURLY_BRACKET": 63,
+        "T_IDENTIFIER": 63,
+    },
+    "else_if_block": {"T_ELIF": 64},
+    "if_statement__option_3": {
+        "T_RETURN": 66,
+        "T_BREAK": 66,
+        "T_CONTINUE": 66,
+        "T_TRY": 66,
+        "T_THROW": 66,
+        "T_IF": 66,
+        "T_ELSE": 65,
+        "T_WHILE": 66,
+        "T_FOR": 66,
+        "T_RIGHT_CURLY_BRACKET": 66,
+        "T_IDENTIFIER": 66,
+    },
+    "else_block": {"T_ELSE": 67},
+    "identifier_or_function_call": {"T_IDENTIFIER": 68},
+    "try_block": {"T_TRY": 69},
+    "catch_block": {"T_CATCH": 70},
+    "try_catch_statement__list_1": {
+        "T_RETURN": 71,
+        "T_BREAK": 71,
+        "T_CONTINUE": 71,
+        "T_TRY": 71,
+        "T_CATCH": 71,
+        "T_THROW": 71,
+        "T_IF": 71,
+        "T_WHILE": 71,
+        "T_FOR": 71,
+        "T_RIGHT_CURLY_BRACKET": 71,
+        "T_IDENTIFIER": 71,
+    },
+    "try_catch_statement__repeat_2": {
+        "T_RETURN": 73,
+        "T_BREAK": 73,
+        "T_CONTINUE": 73,
+        "T_TRY": 73,
+        "T_CATCH": 72,
+        "T_THROW": 73,
+        "T_IF": 73,
+        "T_WHILE": 73,
+        "T_FOR": 73,
+        "T_RIGHT_CURLY_BRACKET": 73,
+        "T_IDENTIFIER": 73,
+    },
+    "property_access__list_1": {
+        "T_PLUS": 74,
+        "T_MINUS": 74,
+        "T_MULTIPLY": 74,
+        "T_DIVIDE": 74,
+        "T_MODULO": 74,
+        "T_ASSIGN": 74,
+        "T_ASSIGN_PLUS": 74,
+        "T_ASSIGN_MINUS": 74,
+        "T_ASSIGN_MULTIPLY": 74,
+        "T_ASSIGN_DIVIDE": 74,
+        "T_ASSIGN_MODULO": 74,
+        "T_GREATER": 74,
+        "T_LESS": 74,
+        "T_GREATER_EQUAL": 74,
+        "T_LESS_EQUAL": 74,
+        "T_EQUAL": 74,
+        "T_NOT_EQUAL": 74,
+        "T_AND": 74,
+        "T_OR": 74,
+        "T_ACCESS": 74,
+        "T_NULLABLE_ACCESS": 74,
+        "T_TYPE_CHECK": 74,
+        "T_RIGHT_BRACKET": 74,
+        "T_SEMICOLON": 74,
+        "T_COMMA": 74,
+    },
+    "property_access__repeat_2": {
+        "T_PLUS": 76,
+        "T_MINUS": 76,
+        "T_MULTIPLY": 76,
+        "T_DIVIDE": 76,
+        "T_MODULO": 76,
+        "T_ASSIGN": 76,
+        "T_ASSIGN_PLUS": 76,
+        "T_ASSIGN_MINUS": 76,
+        "T_ASSIGN_MULTIPLY": 76,
+        "T_ASSIGN_DIVIDE": 76,
+        "T_ASSIGN_MODULO": 76,
+        "T_GREATER": 76,
+        "T_LESS": 76,
+        "T_GREATER_EQUAL": 76,
+        "T_LESS_EQUAL": 76,
+        "T_EQUAL": 76,
+        "T_NOT_EQUAL": 76,
+        "T_AND": 76,
+        "T_OR": 76,
+        "T_ACCESS": 75,
+        "T_NULLABLE_ACCESS": 75,
+        "T_TYPE_CHECK": 76,
+        "T_RIGHT_BRACKET": 76,
+        "T_SEMICOLON": 76,
+        "T_COMMA": 76,
+    },
+    "access_operator": {"T_ACCESS": 77, "T_NULLABLE_ACCESS": 78},
+    "or_expression": {
+        "T_INT_LITERAL": 79,
+        "T_FLOAT_LITERAL": 79,
+        "T_STRING_LITERAL": 79,
+        "T_TRUE": 79,
+        "T_FALSE": 79,
+        "T_NULL": 79,
+        "T_MINUS": 79,
+        "T_NOT": 79,
+        "T_LEFT_BRACKET": 79,
+        "T_IDENTIFIER": 79,
+    },
+    "identifier_or_function_call__option_1": {
+        "T_PLUS": 81,
+        "T_MINUS": 81,
+        "T_MULTIPLY": 81,
+        "T_DIVIDE": 81,
+        "T_MODULO": 81,
+        "T_ASSIGN": 81,
+        "T_ASSIGN_PLUS": 81,
+        "T_ASSIGN_MINUS": 81,
+        "T_ASSIGN_MULTIPLY": 81,
+        "T_ASSIGN_DIVIDE": 81,
+        "T_ASSIGN_MODULO": 81,
+        "T_GREATER": 81,
+        "T_LESS": 81,
+        "T_GREATER_EQUAL": 81,
+        "T_LESS_EQUAL": 81,
+        "T_EQUAL": 81,
+        "T_NOT_EQUAL": 81,
+        "T_AND": 81,
+        "T_OR": 81,
+        "T_ACCESS": 81,
+        "T_NULLABLE_ACCESS": 81,
+        "T_TYPE_CHECK": 81,
+        "T_LEFT_BRACKET": 80,
+        "T_RIGHT_BRACKET": 81,
+        "T_SEMICOLON": 81,
+        "T_COMMA": 81,
+    },
+    "identifier_or_function_call__option_2": {
+        "T_INT_LITERAL": 82,
+        "T_FLOAT_LITERAL": 82,
+        "T_STRING_LITERAL": 82,
+        "T_TRUE": 82,
+        "T_FALSE": 82,
+        "T_NULL": 82,
+        "T_MINUS": 82,
+        "T_NOT": 82,
+        "T_REF": 82,
+        "T_LEFT_BRACKET": 82,
+        "T_RIGHT_BRACKET": 83,
+        "T_IDENTIFIER": 82,
+    },
+    "arguments": {
+        "T_INT_LITERAL": 84,
+        "T_FLOAT_LITERAL": 84,
+        "T_STRING_LITERAL": 84,
+        "T_TRUE": 84,
+        "T_FALSE": 84,
+        "T_NULL": 84,
+        "T_MINUS": 84,
+        "T_NOT": 84,
+        "T_REF": 84,
+        "T_LEFT_BRACKET": 84,
+        "T_IDENTIFIER": 84,
+    },
+    "catch_block__option_1": {"T_LEFT_BRACKET": 85, "T_LEFT_CURLY_BRACKET": 86},
+    "catch_block__list_2": {"T_OR": 87, "T_IDENTIFIER": 87},
+    "catch_block__repeat_3": {"T_OR": 88, "T_IDENTIFIER": 89},
+    "or_operator": {"T_OR": 90},
+    "and_expression": {
+        "T_INT_LITERAL": 91,
+        "T_FLOAT_LITERAL": 91,
+        "T_STRING_LITERAL": 91,
+        "T_TRUE": 91,
+        "T_FALSE": 91,
+        "T_NULL": 91,
+        "T_MINUS": 91,
+        "T_NOT": 91,
+        "T_LEFT_BRACKET": 91,
+        "T_IDENTIFIER": 91,
+    },
+    "or_expression__list_1": {
+        "T_PLUS": 92,
+        "T_MINUS": 92,
+        "T_MULTIPLY": 92,
+        "T_DIVIDE": 92,
+        "T_MODULO": 92,
+        "T_GREATER": 92,
+        "T_LESS": 92,
+        "T_GREATER_EQUAL": 92,
+        "T_LESS_EQUAL": 92,
+        "T_EQUAL": 92,
+        "T_NOT_EQUAL": 92,
+        "T_AND": 92,
+        "T_OR": 92,
+        "T_RIGHT_BRACKET": 92,
+        "T_SEMICOLON": 92,
+        "T_COMMA": 92,
+    },
+    "or_expression__repeat_2": {
+        "T_PLUS": 94,
+        "T_MINUS": 94,
+        "T_MULTIPLY": 94,
+        "T_DIVIDE": 94,
+        "T_MODULO": 94,
+        "T_GREATER": 94,
+        "T_LESS": 94,
+        "T_GREATER_EQUAL": 94,
+        "T_LESS_EQUAL": 94,
+        "T_EQUAL": 94,
+        "T_NOT_EQUAL": 94,
+        "T_AND": 94,
+        "T_OR": 93,
+        "T_RIGHT_BRACKET": 94,
+        "T_SEMICOLON": 94,
+        "T_COMMA": 94,
+    },
+    "argument": {
+        "T_INT_LITERAL": 95,
+        "T_FLOAT_LITERAL": 95,
+        "T_STRING_LITERAL": 95,
+        "T_TRUE": 95,
+        "T_FALSE": 95,
+        "T_NULL": 95,
+        "T_MINUS": 95,
+        "T_NOT": 95,
+        "T_REF": 95,
+        "T_LEFT_BRACKET": 95,
+        "T_IDENTIFIER": 95,
+    },
+    "arguments__list_1": {"T_RIGHT_BRACKET": 96, "T_COMMA": 96},
+    "arguments__repeat_2": {"T_RIGHT_BRACKET": 98, "T_COMMA": 97},
+    "comparison_expression": {
+        "T_INT_LITERAL": 99,
+        "T_FLOAT_LITERAL": 99,
+        "T_STRING_LITERAL": 99,
+        "T_TRUE": 99,
+        "T_FALSE": 99,
+        "T_NULL": 99,
+        "T_MINUS": 99,
+        "T_NOT": 99,
+        "T_LEFT_BRACKET": 99,
+        "T_IDENTIFIER": 99,
+    },
+    "and_expression__list_1": {
+        "T_PLUS": 100,
+        "T_MINUS": 100,
+        "T_MULTIPLY": 100,
+        "T_DIVIDE": 100,
+        "T_MODULO": 100,
+        "T_GREATER": 100,
+        "T_LESS": 100,
+        "T_GREATER_EQUAL": 100,
+        "T_LESS_EQUAL": 100,
+        "T_EQUAL": 100,
+        "T_NOT_EQUAL": 100,
+        "T_AND": 100,
+        "T_OR": 100,
+        "T_RIGHT_BRACKET": 100,
+        "T_SEMICOLON": 100,
+        "T_COMMA": 100,
+    },
+    "and_expression__repeat_2": {
+        "T_PLUS": 102,
+        "T_MINUS": 102,
+        "T_MULTIPLY": 102,
+        "T_DIVIDE": 102,
+        "T_MODULO": 102,
+        "T_GREATER": 102,
+        "T_LESS": 102,
+        "T_GREATER_EQUAL": 102,
+        "T_LESS_EQUAL": 102,
+        "T_EQUAL": 102,
+        "T_NOT_EQUAL": 102,
+        "T_AND": 101,
+        "T_OR": 102,
+        "T_RIGHT_BRACKET": 102,
+        "T_SEMICOLON": 102,
+        "T_COMMA": 102,
+    },
+    "and_operator": {"T_AND": 103},
+    "argument__option_1": {
+        "T_INT_LITERAL": 105,
+        "T_FLOAT_LITERAL": 105,
+        "T_STRING_LITERAL": 105,
+        "T_TRUE": 105,
+        "T_FALSE": 105,
+        "T_NULL": 105,
+        "T_MINUS": 105,
+        "T_NOT": 105,
+        "T_REF": 104,
+        "T_LEFT_BRACKET": 105,
+        "T_IDENTIFIER": 105,
+    },
+    "reference_operator": {"T_REF": 106},
+    "additive_expression": {
+        "T_INT_LITERAL": 107,
+        "T_FLOAT_LITERAL": 107,
+        "T_STRING_LITERAL": 107,
+        "T_TRUE": 107,
+        "T_FALSE": 107,
+        "T_NULL": 107,
+        "T_MINUS": 107,
+        "T_NOT": 107,
+        "T_LEFT_BRACKET": 107,
+        "T_IDENTIFIER": 107,
+    },
+    "comparison_expression__list_1": {
+        "T_PLUS": 108,
+        "T_MINUS": 108,
+        "T_MULTIPLY": 108,
+        "T_DIVIDE": 108,
+        "T_MODULO": 108,
+        "T_GREATER": 108,
+        "T_LESS": 108,
+        "T_GREATER_EQUAL": 108,
+        "T_LESS_EQUAL": 108,
+        "T_EQUAL": 108,
+        "T_NOT_EQUAL": 108,
+        "T_AND": 108,
+        "T_OR": 108,
+        "T_RIGHT_BRACKET": 108,
+        "T_SEMICOLON": 108,
+        "T_COMMA": 108,
+    },
+    "comparison_expression__repeat_2": {
+        "T_PLUS": 110,
+        "T_MINUS": 110,
+        "T_MULTIPLY": 110,
+        "T_DIVIDE": 110,
+        "T_MODULO": 110,
+        "T_GREATER": 109,
+        "T_LESS": 109,
+        "T_GREATER_EQUAL": 109,
+        "T_LESS_EQUAL": 109,
+        "T_EQUAL": 109,
+        "T_NOT_EQUAL": 109,
+        "T_AND": 110,
+        "T_OR": 110,
+        "T_RIGHT_BRACKET": 110,
+        "T_SEMICOLON": 110,
+        "T_COMMA": 110,
+    },
+    "comparison_operator": {
+        "T_GREATER": 114,
+        "T_LESS": 113,
+        "T_GREATER_EQUAL": 116,
+        "T_LESS_EQUAL": 115,
+        "T_EQUAL": 111,
+        "T_NOT_EQUAL": 112,
+    },
+    "multiplicative_expression": {
+        "T_INT_LITERAL": 117,
+        "T_FLOAT_LITERAL": 117,
+        "T_STRING_LITERAL": 117,
+        "T_TRUE": 117,
+        "T_FALSE": 117,
+        "T_NULL": 117,
+        "T_MINUS": 117,
+        "T_NOT": 117,
+        "T_LEFT_BRACKET": 117,
+        "T_IDENTIFIER": 117,
+    },
+    "additive_expression__list_1": {
+        "T_PLUS": 118,
+        "T_MINUS": 118,
+        "T_MULTIPLY": 118,
+        "T_DIVIDE": 118,
+        "T_MODULO": 118,
+        "T_GREATER": 118,
+        "T_LESS": 118,
+        "T_GREATER_EQUAL": 118,
+        "T_LESS_EQUAL": 118,
+        "T_EQUAL": 118,
+        "T_NOT_EQUAL": 118,
+        "T_AND": 118,
+        "T_OR": 118,
+        "T_RIGHT_BRACKET": 118,
+        "T_SEMICOLON": 118,
+        "T_COMMA": 118,
+    },
+    "additive_expression__repeat_2": {
+        "T_PLUS": 119,
+        "T_MINUS": 119,
+        "T_MULTIPLY": 120,
+        "T_DIVIDE": 120,
+        "T_MODULO": 120,
+        "T_GREATER": 120,
+        "T_LESS": 120,
+        "T_GREATER_EQUAL": 120,
+        "T_LESS_EQUAL": 120,
+        "T_EQUAL": 120,
+        "T_NOT_EQUAL": 120,
+        "T_AND": 120,
+        "T_OR": 120,
+        "T_RIGHT_BRACKET": 120,
+        "T_SEMICOLON": 120,
+        "T_COMMA": 120,
+    },
+    "additive_operator": {"T_PLUS": 121, "T_MINUS": 122},
+    "negation_expression": {
+        "T_INT_LITERAL": 124,
+        "T_FLOAT_LITERAL": 124,
+        "T_STRING_LITERAL": 124,
+        "T_TRUE": 124,
+        "T_FALSE": 124,
+        "T_NULL": 124,
+        "T_MINUS": 123,
+        "T_NOT": 123,
+        "T_LEFT_BRACKET": 124,
+        "T_IDENTIFIER": 124,
+    },
+    "multiplicative_expression__list_1": {
+        "T_PLUS": 125,
+        "T_MINUS": 125,
+        "T_MULTIPLY": 125,
+        "T_DIVIDE": 125,
+        "T_MODULO": 125,
+        "T_GREATER": 125,
+        "T_LESS": 125,
+        "T_GREATER_EQUAL": 125,
+        "T_LESS_EQUAL": 125,
+        "T_EQUAL": 125,
+        "T_NOT_EQUAL": 125,
+        "T_AND": 125,
+        "T_OR": 125,
+        "T_RIGHT_BRACKET": 125,
+        "T_SEMICOLON": 125,
+        "T_COMMA": 125,
+    },
+    "multiplicative_expression__repeat_2": {
+        "T_PLUS": 127,
+        "T_MINUS": 127,
+        "T_MULTIPLY": 126,
+        "T_DIVIDE": 126,
+        "T_MODULO": 126,
+        "T_GREATER": 127,
+        "T_LESS": 127,
+        "T_GREATER_EQUAL": 127,
+        "T_LESS_EQUAL": 127,
+        "T_EQUAL": 127,
+        "T_NOT_EQUAL": 127,
+        "T_AND": 127,
+        "T_OR": 127,
+        "T_RIGHT_BRACKET": 127,
+        "T_SEMICOLON": 127,
+        "T_COMMA": 127,
+    },
+    "multiplicative_operator": {"T_MULTIPLY": 128, "T_DIVIDE": 129, "T_MODULO": 130},
+    "negation_operator": {"T_MINUS": 132, "T_NOT": 131},
+    "type_check_operation": {
+        "T_INT_LITERAL": 133,
+        "T_FLOAT_LITERAL": 133,
+        "T_STRING_LITERAL": 133,
+        "T_TRUE": 133,
+        "T_FALSE": 133,
+        "T_NULL": 133,
+        "T_LEFT_BRACKET": 133,
+        "T_IDENTIFIER": 133,
+    },
+    "base_expression": {
+        "T_INT_LITERAL": 134,
+        "T_FLOAT_LITERAL": 134,
+        "T_STRING_LITERAL": 134,
+        "T_TRUE": 134,
+        "T_FALSE": 134,
+        "T_NULL": 134,
+        "T_LEFT_BRACKET": 135,
+        "T_IDENTIFIER": 134,
+    },
+    "type_check_operation__option_1": {
+        "T_PLUS": 137,
+        "T_MINUS": 137,
+        "T_MULTIPLY": 137,
+        "T_DIVIDE": 137,
+        "T_MODULO": 137,
+        "T_GREATER": 137,
+        "T_LESS": 137,
+        "T_GREATER_EQUAL": 137,
+        "T_LESS_EQUAL": 137,
+        "T_EQUAL": 137,
+        "T_NOT_EQUAL": 137,
+        "T_AND": 137,
+        "T_OR": 137,
+        "T_TYPE_CHECK": 136,
+        "T_RIGHT_BRACKET": 137,
+        "T_SEMICOLON": 137,
+        "T_COMMA": 137,
+    },
+    "type_check_operator": {"T_TYPE_CHECK": 138},
+}
+
+empty_productions: dict[str, int] = {
+    "program": 0,
+    "program__list_1": 1,
+    "program__repeat_2": 3,
+    "function_definition__option_1": 7,
+    "params__list_1": 11,
+    "params__repeat_2": 13,
+    "instruction_block__list_1": 14,
+    "instruction_block__repeat_2": 16,
+    "param__option_1": 27,
+    "param__option_2": 29,
+    "variable_value_change_statement__option_1": 50,
+    "return_statement__option_1": 59,
+    "if_statement__list_1": 61,
+    "if_statement__repeat_2": 63,
+    "if_statement__option_3": 66,
+    "try_catch_statement__list_1": 71,
+    "try_catch_statement__repeat_2": 73,
+    "property_access__list_1": 74,
+    "property_access__repeat_2": 76,
+    "identifier_or_function_call__option_1": 81,
+    "identifier_or_function_call__option_2": 83,
+    "catch_block__option_1": 86,
+    "catch_block__list_2": 87,
+    "catch_block__repeat_3": 89,
+    "or_expression__list_1": 92,
+    "or_expression__repeat_2": 94,
+    "arguments__list_1": 96,
+    "arguments__repeat_2": 98,
+    "and_expression__list_1": 100,
+    "and_expression__repeat_2": 102,
+    "argument__option_1": 105,
+    "comparison_expression__list_1": 108,
+    "comparison_expression__repeat_2": 110,
+    "additive_expression__list_1": 118,
+    "additive_expression__repeat_2": 120,
+    "multiplicative_expression__list_1": 125,
+    "multiplicative_expression__repeat_2": 127,
+    "type_check_operation__option_1": 137,
+}
@@ -1,85 +1,151 @@
-from enum import Enum
+from collections.abc import Iterator
 
 from lexer.token_type_enum import TokenType
 from parser.statement_classes import *
 from parser.parser_error_class import PARSER_ERROR_TYPES
 
 
-class INFIX_EXPRESSIONS(Enum):
-    OR = "or"
-    AND = "and"
-    COMPARISON = "comparison"
-    ADDITION = "addition"
-    MULTIPLICATION = "multiplication"
-    PROPERTY_ACCESS = "property_access"
-
-
-type_check_token_to_constructor: dict[TokenType, TypeCheckExpression] = {
-    TokenType.T_TYPE_CHECK: TypeCheckExpression,
-}
-
-identifier_token_to_constructor: dict[TokenType, IdentifierExpression] = {
-    TokenType.T_IDENTIFIER: IdentifierExpression
-}
-
-or_token_to_constructor: dict[TokenType, OrExpression] = {
-    TokenType.T_OR: OrExpression,
-}
-
-and_token_to_constructor: dict[TokenType, AndExpression] = {
-    TokenType.T_AND: AndExpression,
-}
-
-assignment_token_to_constructor: dict[TokenType, AssignmentStatement] = {
-    TokenType.T_ASSIGN: AssignmentStatement,
-    TokenType.T_ASSIGN_PLUS: AssignmentPlusStatement,
-    TokenType.T_ASSIGN_MINUS: AssignmentMinusStatement,
-    TokenType.T_ASSIGN_MULTIPLY: AssignmentMultiplyStatement,
-    TokenType.T_ASSIGN_DIVIDE: AssignmentDivideStatement,
-    TokenType.T_ASSIGN_MODULO: AssignmentModuloStatement,
-}
-
-comparison_token_to_constructor: dict[TokenType, InfixExpression] = {
-    TokenType.T_EQUAL: EqualExpression,
-    TokenType.T_NOT_EQUAL: NotEqualExpression,
-    TokenType.T_GREATER: GreaterThanExpression,
-    TokenType.T_GREATER_EQUAL: GreaterEqualExpression,
-    TokenType.T_LESS: LessThanExpression,
-    TokenType.T_LESS_EQUAL: LessEqualExpression,
-}
-
-additive_token_to_constructor: dict[TokenType, InfixExpression] = {
-    TokenType.T_PLUS: AddExpression,
-    TokenType.T_MINUS: SubtractExpression,
-}
-
-multiplicative_token_to_constructor: dict[TokenType, InfixExpression] = {
-    TokenType.T_MULTIPLY: MultiplyExpression,
-    TokenType.T_DIVIDE: DivideExpression,
-    TokenType.T_MODULO: ModuloExpression,
-}
-
-access_token_to_constructor: dict[TokenType, PropertyAccessExpression] = {
-    TokenType.T_ACCESS: PropertyAccessExpression,
-    TokenType.T_NULLABLE_ACCESS: OptionalPropertyAccessExpression,
-}
-
-literal_with_value_token_to_constructor: dict[TokenType, LiteralExpression] = {
-    TokenType.T_INT_LITERAL: IntegerLiteral,
-    TokenType.T_FLOAT_LITERAL: FloatLiteral,
-    TokenType.T_STRING_LITERAL: StringLiteral,
-}
-
-literal_without_value_token_to_constructor: dict[TokenType, LiteralExpression] = {
-    TokenType.T_TRUE: TrueLiteral,
-    TokenType.T_FALSE: FalseLiteral,
-    TokenType.T_NULL: NullLiteral,
-}
-
-negation_token_to_constructor: dict[TokenType, IExpression] = {
-    TokenType.T_NOT: BitwiseNegationExpression,
-    TokenType.T_MINUS: NumericNegationExpression,
+def create_token_kind_table(token_to_value: dict[TokenType, any]) -> list:
+    table = [None] * len(TokenType)
+    for token_type, value in token_to_value.items():
+        table[token_type] = value
+    return table
+
+
+type_check_token_to_constructor: list[TypeCheckExpression] = create_token_kind_table(
+    {
+        TokenType.T_TYPE_CHECK: TypeCheckExpression,
+    }
+)
+
+identifier_token_to_constructor: list[IdentifierExpression] = create_token_kind_table(
+    {
+        TokenType.T_IDENTIFIER: IdentifierExpression,
+    }
+)
+
+or_token_to_constructor: list[OrExpression] = create_token_kind_table(
+    {
+        TokenType.T_OR: OrExpression,
+    }
+)
+
+and_token_to_constructor: list[AndExpression] = create_token_kind_table(
+    {
+        TokenType.T_AND: AndExpression,
+    }
+)
+
+assignment_token_to_constructor: list[AssignmentStatement] = create_token_kind_table(
+    {
+        TokenType.T_ASSIGN: AssignmentStatement,
+        TokenType.T_ASSIGN_PLUS: AssignmentPlusStatement,
+        TokenType.T_ASSIGN_MINUS: AssignmentMinusStatement,
+        TokenType.T_ASSIGN_MULTIPLY: AssignmentMultiplyStatement,
+        TokenType.T_ASSIGN_DIVIDE: AssignmentDivideStatement,
+        TokenType.T_ASSIGN_MODULO: AssignmentModuloStatement,
+    }
+)
+
+comparison_token_to_constructor: list[InfixExpression] = create_token_kind_table(
+    {
+        TokenType.T_EQUAL: EqualExpression,
+        TokenType.T_NOT_EQUAL: NotEqualExpression,
+        TokenType.T_GREATER: GreaterThanExpression,
+        TokenType.T_GREATER_EQUAL: GreaterEqualExpression,
+        TokenType.T_LESS: LessThanExpression,
+        TokenType.T_LESS_EQUAL: LessEqualExpression,
+    }
+)
+
+additive_token_to_constructor: list[InfixExpression] = create_token_kind_table(
+    {
+        TokenType.T_PLUS: AddExpression,
+        TokenType.T_MINUS: SubtractExpression,
+    }
+)
+
+multiplicative_token_to_constructor: list[InfixExpression] = create_token_kind_table(
+    {
+        TokenType.T_MULTIPLY: MultiplyExpression,
+        TokenType.T_DIVIDE: DivideExpression,
+        TokenType.T_MODULO: ModuloExpression,
+    }
+)
+
+access_token_to_constructor: list[PropertyAccessExpression] = create_token_kind_table(
+    {
+        TokenType.T_ACCESS: PropertyAccessExpression,
+        TokenType.T_NULLABLE_ACCESS: OptionalPropertyAccessExpression,
+    }
+)
+
+literal_with_value_token_to_constructor: list[LiteralExpression] = (
+    create_token_kind_table(
+        {
+            TokenType.T_INT_LITERAL: IntegerLiteral,
+            TokenType.T_FLOAT_LITERAL: FloatLiteral,
+            TokenType.T_STRING_LITERAL: StringLiteral,
+        }
+    )
+)
+
+literal_without_value_token_to_constructor: list[LiteralExpression] = (
+    create_token_kind_table(
+        {
+            TokenType.T_TRUE: TrueLiteral,
+            TokenType.T_FALSE: FalseLiteral,
+            TokenType.T_NULL: NullLiteral,
+        }
+    )
+)
+
+negation_token_to_constructor: list[IExpression] = create_token_kind_table(
+    {
+        TokenType.T_NOT: BitwiseNegationExpression,
+        TokenType.T_MINUS: NumericNegationExpression,
+    }
+)
+
+infix_token_tables_by_precedence: list[list[InfixExpression]] = [
+    or_token_to_constructor,
+    and_token_to_constructor,
+    comparison_token_to_constructor,
+    additive_token_to_constructor,
+    multiplicative_token_to_constructor,
+]
+
+infix_token_to_constructor: list[InfixExpression] = create_token_kind_table(
+    {
+        token_kind: constructor
+        for token_table in infix_token_tables_by_precedence
+        for token_kind, constructor in enumerate(token_table)
+        if constructor is not None
+    }
+)
+
+infix_token_to_binding_power: list[int] = [0] * len(TokenType)
+for binding_power, token_table in enumerate(infix_token_tables_by_precedence, 1):
+    for token_kind, constructor in enumerate(token_table):
+        if constructor is not None:
+            infix_token_to_binding_power[token_kind] = binding_power
+
+shareable_node_fields: dict[type, tuple[str, ...]] = {
+    constructor: ("value",)
+    for token_table in [
+        literal_with_value_token_to_constructor,
+        literal_without_value_token_to_constructor,
+    ]
+    for constructor in token_table
+    if constructor is not None
 }
+shareable_node_fields.update(
+    {
+        EqualExpression: ("left", "right"),
+        NotEqualExpression: ("left", "right"),
+        IdentifierExpression: ("name",),
+    }
+)
 
 
 token_to_error: dict[TokenType, PARSER_ERROR_TYPES] = {
@@ -92,3 +158,17 @@ token_to_error: dict[TokenType, PARSER_ERROR_TYPES] = {
     TokenType.T_COLON: PARSER_ERROR_TYPES.MISSING_FOR_LOOP_COLON,
     TokenType.T_IDENTIFIER: PARSER_ERROR_TYPES.MISSING_TYPE_NAME,
 }
+
+node_classes: tuple[type, ...] = (IExpression, IStatement, BlockStatement, Argument)
+
+
+def iterate_children(node: any) -> Iterator[any]:
+    for node_class in type(node).__mro__:
+        for slot in getattr(node_class, "__slots__", ()):
+            if slot == "error_types":
+                continue
+            child = getattr(node, slot, None)
+            if isinstance(child, node_classes):
+                yield child
+            elif isinstance(child, list):
+                yield from (item for item in child if isinstance(item, node_classes))
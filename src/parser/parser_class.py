@@ -1,59 +1,127 @@
+import asyncio
+from collections.abc import Callable, Generator
+from functools import partial
+
+from lexer.async_lexer_class import AsyncLexer
 from lexer.lexer_class import Lexer
+from lexer.token_buffer_class import TokenBufferReader
 from parser.statement_classes import *
 from lexer.token_type_enum import TokenType
 from parser.helpers import *
 from parser.parser_error_class import PARSER_ERROR_TYPES, ParserError
+from parser.rule_profiler_class import RuleProfiler
 from program.program_class import Program
 from lexer.token_class import Token
 from interpreter.built_in_functions import BuiltInFunction, get_built_in_functions
 
+PENDING: object = object()
+
+
+class ExpressionFrame:
+    __slots__ = (
+        "resume",
+        "min_binding_power",
+        "upper_binding_power",
+        "left",
+        "constructor",
+        "offset",
+        "name",
+        "arguments",
+        "argument_offset",
+        "is_reference",
+    )
+
+    def __init__(
+        self,
+        resume: Callable,
+        min_binding_power: int | None = None,
+        constructor: Callable | None = None,
+        offset: int | None = None,
+        name: str | None = None,
+        arguments: list[Argument] | None = None,
+    ) -> None:
+        self.resume: Callable = resume
+        self.min_binding_power: int | None = min_binding_power
+        self.upper_binding_power: int | None = None
+        self.left: IExpression | None = None
+        self.constructor: Callable | None = constructor
+        self.offset: int | None = offset
+        self.name: str | None = name
+        self.arguments: list[Argument] | None = arguments
+        self.argument_offset: int | None = None
+        self.is_reference: bool = False
+
 
 class Parser:
-    def __init__(self, lexer: Lexer) -> None:
+    def __init__(
+        self,
+        lexer: Lexer,
+        hash_consing: bool = False,
+        rule_profiler: RuleProfiler | None = None,
+        lazy_bodies: bool = False,
+    ) -> None:
+        if rule_profiler is not None:
+            rule_profiler.instrument(self)
         self.lexer = lexer
         self.error_handler = lexer.error_handler
+        self.shared_nodes: dict[tuple, IExpression] | None = (
+            {} if hash_consing else None
+        )
+        self.shared_node_ids: set[int] = set()
+        self.lazy_bodies: bool = lazy_bodies and isinstance(lexer, TokenBufferReader)
+        self.block_loaders: dict[str, Callable[[], BlockStatement]] = {}
+        (
+            self.infix_token_to_constructor,
+            self.access_token_to_constructor,
+            self.literal_with_value_token_to_constructor,
+            self.literal_without_value_token_to_constructor,
+            self.negation_token_to_constructor,
+            self.identifier_token_to_constructor,
+            self.type_check_token_to_constructor,
+        ) = (
+            self.__share_constructors(token_to_constructor)
+            for token_to_constructor in [
+                infix_token_to_constructor,
+                access_token_to_constructor,
+                literal_with_value_token_to_constructor,
+                literal_without_value_token_to_constructor,
+                negation_token_to_constructor,
+                identifier_token_to_constructor,
+                type_check_token_to_constructor,
+            ]
+        )
         self.current_token: Token = lexer.build_next_token()
-
-        self.infix_expression_params: dict[INFIX_EXPRESSIONS] = {
-            INFIX_EXPRESSIONS.OR: self.__create_infix_expression_param(
-                self.__parse_and_expression, or_token_to_constructor
-            ),
-            INFIX_EXPRESSIONS.AND: self.__create_infix_expression_param(
-                self.__parse_comparation_expression,
-                and_token_to_constructor,
-            ),
-            INFIX_EXPRESSIONS.COMPARISON: self.__create_infix_expression_param(
-                self.__parse_addition_expression,
-                comparison_token_to_constructor,
-            ),
-            INFIX_EXPRESSIONS.ADDITION: self.__create_infix_expression_param(
-                self.__parse_multiplication_expression, additive_token_to_constructor
-            ),
-            INFIX_EXPRESSIONS.MULTIPLICATION: self.__create_infix_expression_param(
-                self.__parse_negation_expression, multiplicative_token_to_constructor
-            ),
-            INFIX_EXPRESSIONS.PROPERTY_ACCESS: self.__create_infix_expression_param(
-                self.__parse_identifier_or_function_call, access_token_to_constructor
-            ),
-        }
+        self.statement_parsers: list = create_token_kind_table(
+            {
+                TokenType.T_RETURN: self.__parse_return_statement,
+                TokenType.T_IDENTIFIER: self.__parse_variable_statement,
+                TokenType.T_THROW: self.__parse_throw_exception_statement,
+                TokenType.T_BREAK: self.__parse_break_statement,
+                TokenType.T_CONTINUE: self.__parse_continue_statement,
+            }
+        )
+        self.block_statement_parsers: list = create_token_kind_table(
+            {
+                TokenType.T_IF: self.__parse_if_statement,
+                TokenType.T_WHILE: self.__parse_while_statement,
+                TokenType.T_FOR: self.__parse_for_statement,
+                TokenType.T_TRY: self.__parse_try_catch_statement,
+            }
+        )
 
     ############################## UTILS ##############################
 
-    @staticmethod
-    def __create_infix_expression_param(
-        function, constructor_dict: dict[IExpression]
-    ) -> dict:
-        return {
-            "function": function,
-            "constructor_dict": constructor_dict,
-        }
-
     def __expect_block(self):
         block = self.__parse_block_statement()
         if not block:
             self.__add_error(PARSER_ERROR_TYPES.MISSING_BLOCK_START)
         return block
 
+    def __expect_nested_block(self) -> Generator[None, BlockStatement, BlockStatement]:
+        if not (block := (yield)):
+            self.__add_error(PARSER_ERROR_TYPES.MISSING_BLOCK_START)
+        return block
+
     def __expect_token_type(self, token_type: TokenType) -> None:
         if not self.__consume_if(token_type):
             self.__add_error(token_to_error[token_type])
@@ -74,7 +142,7 @@ class Parser:
         return self.current_token.type == token_type
 
     def __consume_if(self, token_type: TokenType) -> bool:
-        if self.__check_token_type(token_type):
+        if self.current_token.type == token_type:
             self.__next_token()
             return True
         return False
@@ -82,146 +150,349 @@ class Parser:
     def __next_token(self) -> None:
         self.current_token = self.lexer.build_next_token_without_comments()
 
+    ############################## HASH CONSING ##############################
+
+    def __share(self, node: IExpression) -> IExpression:
+        key = [type(node)]
+        for field in shareable_node_fields[type(node)]:
+            value = getattr(node, field)
+            if isinstance(value, IExpression):
+                if id(value) not in self.shared_node_ids:
+                    return node
+                value = id(value)
+            key.append(value)
+        key = tuple(key)
+        if (shared_node := self.shared_nodes.get(key)) is None:
+            shared_node = self.shared_nodes[key] = node
+            self.shared_node_ids.add(id(node))
+        return shared_node
+
+    def __share_constructor(self, constructor: type) -> Callable[..., IExpression]:
+        return lambda *arguments: self.__share(constructor(*arguments))
+
+    def __share_constructors(self, token_to_constructor: list) -> list:
+        if self.shared_nodes is None:
+            return token_to_constructor
+        return [
+            (
+                self.__share_constructor(constructor)
+                if constructor in shareable_node_fields
+                else constructor
+            )
+            for constructor in token_to_constructor
+        ]
+
     ############################## EXPRESSIONS ##############################
 
-    def __parse_infix_expression(
-        self, expression_type: INFIX_EXPRESSIONS
+    def __parse_iteratively(
+        self, start_parsing: Callable[[list[ExpressionFrame]], IExpression]
     ) -> IExpression:
-        func_params = self.infix_expression_params[expression_type]
-        left = func_params["function"]()
-        if not left:
-            return None
-        while construtor := func_params["constructor_dict"].get(
-            self.current_token.type
-        ):
-            position = self.current_token.position
-            self.__next_token()
-            right = self.__expect_expression(
-                func_params["function"], PARSER_ERROR_TYPES.MISSING_EXPRESSION
-            )
-            left = construtor(left, right, position)
-        return left
+        frames: list[ExpressionFrame] = []
+        expression = start_parsing(frames)
+        while frames:
+            frame = frames[-1]
+            expression = frame.resume(frames, frame, expression)
+        return expression
 
-    def __parse_property_access_expression(self) -> IExpression:
-        return self.__parse_infix_expression(INFIX_EXPRESSIONS.PROPERTY_ACCESS)
-
-    def __parse_arguments(self) -> list[IExpression]:
-        position = self.current_token.position
-        is_reference = self.__consume_if(TokenType.T_REF)
-        argument = self.__parse_expression()
-        if not argument:
-            return []
-        arguments = [Argument(argument, is_reference, position)]
-        while self.__consume_if(TokenType.T_COMMA):
-            position = self.current_token.position
-            is_reference = self.__consume_if(TokenType.T_REF)
-            argument = self.__expect_expression(
-                self.__parse_expression, PARSER_ERROR_TYPES.MISSING_ARGUMENT
-            )
-            arguments.append(Argument(argument, is_reference, position))
-        return arguments
+    def __start_argument(self, frame: ExpressionFrame) -> object:
+        frame.argument_offset = self.current_token.offset
+        frame.is_reference = self.__consume_if(TokenType.T_REF)
+        return PENDING
 
-    def __parse_rest_of_function_call(
-        self, name: str, position: Position
+    def __resume_function_call(
+        self,
+        frames: list[ExpressionFrame],
+        frame: ExpressionFrame,
+        argument: IExpression,
     ) -> IExpression:
-        if not self.__consume_if(TokenType.T_LEFT_BRACKET):
-            return None
-        arguments = self.__parse_arguments()
+        arguments = frame.arguments
+        if argument or arguments:
+            if not argument:
+                self.__add_error(PARSER_ERROR_TYPES.MISSING_ARGUMENT)
+            arguments.append(
+                Argument(argument, frame.is_reference, frame.argument_offset)
+            )
+            if self.__consume_if(TokenType.T_COMMA):
+                self.__start_argument(frame)
+                return self.__start_binary_expression(frames)
         self.__expect_token_type(TokenType.T_RIGHT_BRACKET)
-        return FunctionCallExpression(name, arguments, position)
+        frames.pop()
+        return FunctionCallExpression(frame.name, arguments, frame.offset)
+
+    def __start_function_call(
+        self, frames: list[ExpressionFrame], name: str, offset: int
+    ) -> object:
+        frame = ExpressionFrame(
+            self.__resume_function_call, offset=offset, name=name, arguments=[]
+        )
+        frames.append(frame)
+        return self.__start_argument(frame)
 
-    def __parse_identifier_or_function_call(self) -> IExpression:
+    def __start_identifier_or_function_call(
+        self, frames: list[ExpressionFrame], is_access_target: bool = False
+    ) -> IExpression | object:
         if not self.__check_token_type(TokenType.T_IDENTIFIER):
             return None
 
         name = self.current_token.value
-        position = self.current_token.position
+        offset = self.current_token.offset
+        constructor = (
+            identifier_token_to_constructor
+            if is_access_target
+            else self.identifier_token_to_constructor
+        )[self.current_token.type]
         self.__next_token()
 
-        expression = self.__parse_rest_of_function_call(name, position)
-        if not expression:
-            return IdentifierExpression(name, position)
-        return expression
-
-    def __parse_expression_in_brackets(self) -> IExpression:
         if not self.__consume_if(TokenType.T_LEFT_BRACKET):
-            return None
-        expression = self.__expect_expression(
-            self.__parse_expression, PARSER_ERROR_TYPES.MISSING_EXPRESSION
-        )
-        self.__expect_token_type(TokenType.T_RIGHT_BRACKET)
-        return expression
-
-    def __parse_base_expression(self):
-        if constructor := literal_with_value_token_to_constructor.get(
-            self.current_token.type
-        ):
-            expression = constructor(
-                self.current_token.value, self.current_token.position
-            )
-            self.__next_token()
-        elif self.__check_token_type(TokenType.T_IDENTIFIER):
-            expression = self.__parse_property_access_expression()
-        elif constructor := literal_without_value_token_to_constructor.get(
-            self.current_token.type
-        ):
-            expression = constructor(self.current_token.position)
-            self.__next_token()
+            return constructor(name, offset)
+        return self.__start_function_call(frames, name, offset)
+
+    def __resume_property_access_expression(
+        self,
+        frames: list[ExpressionFrame],
+        frame: ExpressionFrame,
+        expression: IExpression,
+    ) -> IExpression:
+        if frame.constructor is None:
+            if not expression:
+                frames.pop()
+                return None
+            left = expression
         else:
-            expression = self.__parse_expression_in_brackets()
-        return expression
+            if not expression:
+                self.__add_error(PARSER_ERROR_TYPES.MISSING_EXPRESSION)
+            left = frame.constructor(frame.left, expression, frame.offset)
+        if constructor := self.access_token_to_constructor[self.current_token.type]:
+            frame.left = left
+            frame.constructor = constructor
+            frame.offset = self.current_token.offset
+            self.__next_token()
+            if (
+                expression := self.__start_identifier_or_function_call(frames, True)
+            ) is PENDING:
+                return self.__start_binary_expression(frames)
+            return expression
+        if frame.min_binding_power is None:
+            frames.pop()
+            return left
+        return self.__continue_binary_expression(
+            frames, frame, self.__parse_type_check_suffix(left)
+        )
 
-    def __parse_type_check_expression(self) -> IExpression:
-        expression = self.__parse_base_expression()
-        position = self.current_token.position
+    def __start_property_access_expression(
+        self, frames: list[ExpressionFrame]
+    ) -> IExpression:
+        frame = ExpressionFrame(self.__resume_property_access_expression)
+        frames.append(frame)
+        if (expression := self.__start_identifier_or_function_call(frames)) is PENDING:
+            return self.__start_binary_expression(frames)
+        return self.__resume_property_access_expression(frames, frame, expression)
+
+    def __resume_expression_in_brackets(
+        self,
+        frames: list[ExpressionFrame],
+        frame: ExpressionFrame,
+        expression: IExpression,
+    ) -> IExpression:
+        if not expression:
+            self.__add_error(PARSER_ERROR_TYPES.MISSING_EXPRESSION)
+        self.__expect_token_type(TokenType.T_RIGHT_BRACKET)
         if not expression:
+            frames.pop()
             return None
-        if not self.__consume_if(TokenType.T_TYPE_CHECK):
+        return self.__continue_binary_expression(
+            frames, frame, self.__parse_type_check_suffix(expression)
+        )
+
+    def __parse_type_check_suffix(self, expression: IExpression) -> IExpression:
+        offset = self.current_token.offset
+        if not (
+            constructor := self.type_check_token_to_constructor[self.current_token.type]
+        ):
             return expression
+        self.__next_token()
         type_token = self.current_token
         self.__expect_token_type(TokenType.T_IDENTIFIER)
         type_name = type_token.value
-        return TypeCheckExpression(expression, type_name, position)
+        return constructor(expression, type_name, offset)
 
-    def __parse_negation_expression(self) -> IExpression:
-        if constructor := negation_token_to_constructor.get(self.current_token.type):
-            position = self.current_token.position
-            self.__next_token()
-            expression = self.__expect_expression(
-                self.__parse_expression, PARSER_ERROR_TYPES.MISSING_EXPRESSION
-            )
-            return constructor(expression, position)
-        return self.__parse_type_check_expression()
+    def __resume_negation_expression(
+        self,
+        frames: list[ExpressionFrame],
+        frame: ExpressionFrame,
+        expression: IExpression,
+    ) -> IExpression:
+        if not expression:
+            self.__add_error(PARSER_ERROR_TYPES.MISSING_EXPRESSION)
+        return self.__continue_binary_expression(
+            frames, frame, frame.constructor(expression, frame.offset)
+        )
+
+    def __set_binary_operator(
+        self, frame: ExpressionFrame, binding_power: int, left: IExpression
+    ) -> None:
+        frame.resume = self.__resume_binary_expression
+        frame.upper_binding_power = binding_power
+        frame.left = left
+        frame.constructor = self.infix_token_to_constructor[self.current_token.type]
+        frame.offset = self.current_token.offset
+
+    def __continue_binary_expression(
+        self,
+        frames: list[ExpressionFrame],
+        frame: ExpressionFrame,
+        left: IExpression,
+    ) -> IExpression:
+        if frame.min_binding_power > (
+            binding_power := infix_token_to_binding_power[self.current_token.type]
+        ):
+            frames.pop()
+            return left
+        self.__set_binary_operator(frame, binding_power, left)
+        self.__next_token()
+        return self.__start_binary_expression(frames, binding_power + 1)
 
-    def __parse_multiplication_expression(self) -> IExpression:
-        return self.__parse_infix_expression(INFIX_EXPRESSIONS.MULTIPLICATION)
+    def __resume_binary_expression(
+        self,
+        frames: list[ExpressionFrame],
+        frame: ExpressionFrame,
+        expression: IExpression,
+    ) -> IExpression:
+        if not expression:
+            self.__add_error(PARSER_ERROR_TYPES.MISSING_EXPRESSION)
+        left = frame.constructor(frame.left, expression, frame.offset)
+        if (
+            frame.min_binding_power
+            <= (binding_power := infix_token_to_binding_power[self.current_token.type])
+            <= frame.upper_binding_power
+        ):
+            self.__set_binary_operator(frame, binding_power, left)
+            self.__next_token()
+            return self.__start_binary_expression(frames, binding_power + 1)
+        frames.pop()
+        return left
 
-    def __parse_addition_expression(self) -> IExpression:
-        return self.__parse_infix_expression(INFIX_EXPRESSIONS.ADDITION)
+    def __start_binary_expression(
+        self, frames: list[ExpressionFrame], min_binding_power: int = 1
+    ) -> IExpression:
+        while True:
+            token = self.current_token
+            if constructor := self.negation_token_to_constructor[token.type]:
+                frames.append(
+                    ExpressionFrame(
+                        self.__resume_negation_expression,
+                        min_binding_power,
+                        constructor,
+                        token.offset,
+                    )
+                )
+                self.__next_token()
+                min_binding_power = 1
+                continue
+            if constructor := self.literal_with_value_token_to_constructor[token.type]:
+                expression = constructor(token.value, token.offset)
+                self.__next_token()
+            elif token.type == TokenType.T_IDENTIFIER:
+                constructor = self.identifier_token_to_constructor[token.type]
+                self.__next_token()
+                if self.__consume_if(TokenType.T_LEFT_BRACKET):
+                    frames.append(
+                        ExpressionFrame(
+                            self.__resume_property_access_expression,
+                            min_binding_power,
+                        )
+                    )
+                    self.__start_function_call(frames, token.value, token.offset)
+                    min_binding_power = 1
+                    continue
+                expression = constructor(token.value, token.offset)
+                if self.access_token_to_constructor[self.current_token.type]:
+                    frames.append(
+                        ExpressionFrame(
+                            self.__resume_property_access_expression,
+                            min_binding_power,
+                        )
+                    )
+                    return expression
+            elif constructor := self.literal_without_value_token_to_constructor[
+                token.type
+            ]:
+                expression = constructor(token.offset)
+                self.__next_token()
+            elif self.__consume_if(TokenType.T_LEFT_BRACKET):
+                frames.append(
+                    ExpressionFrame(
+                        self.__resume_expression_in_brackets, min_binding_power
+                    )
+                )
+                min_binding_power = 1
+                continue
+            else:
+                return None
+            expression = self.__parse_type_check_suffix(expression)
+            if min_binding_power > (
+                binding_power := infix_token_to_binding_power[self.current_token.type]
+            ):
+                return expression
+            frame = ExpressionFrame(self.__resume_binary_expression, min_binding_power)
+            self.__set_binary_operator(frame, binding_power, expression)
+            frames.append(frame)
+            self.__next_token()
+            min_binding_power = binding_power + 1
 
-    def __parse_comparation_expression(self) -> IExpression:
-        return self.__parse_infix_expression(INFIX_EXPRESSIONS.COMPARISON)
+    def __start_identifier_or_function_call_expression(
+        self, frames: list[ExpressionFrame]
+    ) -> IExpression:
+        if (expression := self.__start_identifier_or_function_call(frames)) is PENDING:
+            return self.__start_binary_expression(frames)
+        return expression
 
-    def __parse_and_expression(self) -> IExpression:
-        return self.__parse_infix_expression(INFIX_EXPRESSIONS.AND)
+    def __parse_identifier_or_function_call(self) -> IExpression:
+        return self.__parse_iteratively(
+            self.__start_identifier_or_function_call_expression
+        )
 
-    def __parse_or_expression(self) -> IExpression:
-        return self.__parse_infix_expression(INFIX_EXPRESSIONS.OR)
+    def __parse_property_access_expression(self) -> IExpression:
+        return self.__parse_iteratively(self.__start_property_access_expression)
 
     def __parse_expression(self) -> IExpression:
-        return self.__parse_or_expression()
+        return self.__parse_iteratively(self.__start_binary_expression)
 
     ############################## STATEMENTS ##############################
 
     def __parse_block_statement(self) -> BlockStatement:
-        position = self.current_token.position
+        offset = self.current_token.offset
         if not self.__consume_if(TokenType.T_LEFT_CURLY_BRACKET):
             return None
-        statements: list[IStatement] = []
-        while (statement := self.__parse_statement()) is not None:
-            statements.append(statement)
-        self.__expect_token_type(TokenType.T_RIGHT_CURLY_BRACKET)
-        return BlockStatement(statements, position)
+        blocks: list[tuple[list[IStatement], int]] = [([], offset)]
+        block_statement_parsers: list[Generator] = []
+        while True:
+            statements = blocks[-1][0]
+            if parse_statement := self.block_statement_parsers[self.current_token.type]:
+                block_statement_parsers.append(
+                    parse_statement(self.current_token.offset)
+                )
+                block = None
+            elif (statement := self.__parse_statement()) is not None:
+                statements.append(statement)
+                continue
+            else:
+                self.__expect_token_type(TokenType.T_RIGHT_CURLY_BRACKET)
+                block = BlockStatement(*blocks.pop())
+                if not blocks:
+                    return block
+            while True:
+                try:
+                    block_statement_parsers[-1].send(block)
+                except StopIteration as stop:
+                    block_statement_parsers.pop()
+                    blocks[-1][0].append(stop.value)
+                    break
+                offset = self.current_token.offset
+                if self.__consume_if(TokenType.T_LEFT_CURLY_BRACKET):
+                    blocks.append(([], offset))
+                    break
+                block = None
 
     def __parse_condition(self) -> IExpression:
         self.__expect_token_type(TokenType.T_LEFT_BRACKET)
@@ -231,39 +502,45 @@ class Parser:
         self.__expect_token_type(TokenType.T_RIGHT_BRACKET)
         return condition
 
-    def __parse_if_statement(self, position: Position) -> IStatement:
+    def __parse_if_statement(
+        self, offset: int
+    ) -> Generator[None, BlockStatement, IStatement]:
         if not self.__consume_if(TokenType.T_IF):
             return None
         elif_statements: list[BlockStatement] = []
         else_statement: BlockStatement = None
         condition = self.__parse_condition()
-        statement = self.__expect_block()
+        statement = yield from self.__expect_nested_block()
         while self.__consume_if(TokenType.T_ELIF):
-            elif_position = self.current_token.position
+            elif_offset = self.current_token.offset
             elif_condition = self.__expect_expression(
                 self.__parse_condition,
                 PARSER_ERROR_TYPES.MISSING_CONDITIONAL_EXPRESSION,
             )
-            elif_statement = self.__expect_block()
+            elif_statement = yield from self.__expect_nested_block()
             elif_statements.append(
-                ConditionalStatement(elif_condition, elif_statement, elif_position)
+                ConditionalStatement(elif_condition, elif_statement, elif_offset)
             )
         if self.__consume_if(TokenType.T_ELSE):
-            else_statement = self.__expect_block()
+            else_statement = yield from self.__expect_nested_block()
         return IfStatement(
-            condition, statement, elif_statements, else_statement, position
+            condition, statement, elif_statements, else_statement, offset
         )
 
-    def __parse_while_statement(self, position: Position) -> IStatement:
+    def __parse_while_statement(
+        self, offset: int
+    ) -> Generator[None, BlockStatement, IStatement]:
         if not self.__consume_if(TokenType.T_WHILE):
             return None
         condition = self.__expect_expression(
             self.__parse_condition, PARSER_ERROR_TYPES.MISSING_CONDITIONAL_EXPRESSION
         )
-        statement = self.__expect_block()
-        return WhileStatement(condition, statement, position)
+        statement = yield from self.__expect_nested_block()
+        return WhileStatement(condition, statement, offset)
 
-    def __parse_for_statement(self, position: Position) -> IStatement:
+    def __parse_for_statement(
+        self, offset: int
+    ) -> Generator[None, BlockStatement, IStatement]:
         if not self.__consume_if(TokenType.T_FOR):
             return None
         self.__expect_token_type(TokenType.T_LEFT_BRACKET)
@@ -276,34 +553,36 @@ class Parser:
             PARSER_ERROR_TYPES.MISSING_FOR_LOOP_ITERABLE,
         )
         self.__expect_token_type(TokenType.T_RIGHT_BRACKET)
-        statement = self.__expect_block()
-        return ForStatement(variable_name, iterable, statement, position)
+        statement = yield from self.__expect_nested_block()
+        return ForStatement(variable_name, iterable, statement, offset)
 
-    def __parse_return_statement(self, position: Position) -> IStatement:
+    def __parse_return_statement(self, offset: int) -> IStatement:
         if not self.__consume_if(TokenType.T_RETURN):
             return None
         expression = self.__parse_expression()
         self.__expect_token_type(TokenType.T_SEMICOLON)
-        return ReturnStatement(expression, position)
+        return ReturnStatement(expression, offset)
 
-    def __parse_variable_statement(self, position: Position) -> IStatement:
+    def __parse_variable_statement(self, offset: int) -> IStatement:
         identifier_or_fun_call = self.__parse_property_access_expression()
         if not identifier_or_fun_call:
             return None
-        if constructor := assignment_token_to_constructor.get(self.current_token.type):
+        if constructor := assignment_token_to_constructor[self.current_token.type]:
             self.__next_token()
             expression = self.__expect_expression(
                 self.__parse_expression, PARSER_ERROR_TYPES.MISSING_EXPRESSION
             )
             self.__expect_token_type(TokenType.T_SEMICOLON)
-            return constructor(identifier_or_fun_call, expression, position)
+            return constructor(identifier_or_fun_call, expression, offset)
         else:
             self.__expect_token_type(TokenType.T_SEMICOLON)
             return identifier_or_fun_call
 
-    def __parse_catch_statements(self) -> IStatement:
+    def __parse_catch_statements(
+        self,
+    ) -> Generator[None, BlockStatement, list[CatchStatement]]:
         catch_statements: list[CatchStatement] = []
-        position = self.current_token.position
+        offset = self.current_token.offset
         while self.__consume_if(TokenType.T_CATCH):
             exception_types: list[IdentifierExpression] = []
             variable_name: IdentifierExpression = None
@@ -324,24 +603,25 @@ class Parser:
                     PARSER_ERROR_TYPES.MISSING_ERROR_VARIABLE,
                 )
                 self.__expect_token_type(TokenType.T_RIGHT_BRACKET)
+            block = yield from self.__expect_nested_block()
             catch_statements.append(
-                CatchStatement(
-                    self.__expect_block(), exception_types, variable_name, position
-                )
+                CatchStatement(block, exception_types, variable_name, offset)
             )
-            position = self.current_token.position
+            offset = self.current_token.offset
         if len(catch_statements) == 0:
             self.__add_error(PARSER_ERROR_TYPES.MISSING_CATCH_KEYWORD)
         return catch_statements
 
-    def __parse_try_catch_statement(self, position: Position) -> IStatement:
+    def __parse_try_catch_statement(
+        self, offset: int
+    ) -> Generator[None, BlockStatement, IStatement]:
         if not self.__consume_if(TokenType.T_TRY):
             return None
-        try_statement = self.__expect_block()
-        catch_statements = self.__parse_catch_statements()
-        return TryCatchStatement(try_statement, catch_statements, position)
+        try_statement = yield from self.__expect_nested_block()
+        catch_statements = yield from self.__parse_catch_statements()
+        return TryCatchStatement(try_statement, catch_statements, offset)
 
-    def __parse_throw_exception_statement(self, position: Position) -> IStatement:
+    def __parse_throw_exception_statement(self, offset: int) -> IStatement:
         if not self.__consume_if(TokenType.T_THROW):
             return None
         thrown_expression = self.__expect_expression(
@@ -349,33 +629,24 @@ class Parser:
             PARSER_ERROR_TYPES.MISSING_EXPRESSION,
         )
         self.__expect_token_type(TokenType.T_SEMICOLON)
-        return ThrowStatement(thrown_expression, position)
+        return ThrowStatement(thrown_expression, offset)
 
-    def __parse_break_statement(self, position: Position) -> IStatement:
+    def __parse_break_statement(self, offset: int) -> IStatement:
         if not self.__consume_if(TokenType.T_BREAK):
             return None
         self.__expect_token_type(TokenType.T_SEMICOLON)
-        return BreakStatement(position)
+        return BreakStatement(offset)
 
-    def __parse_continue_statement(self, position: Position) -> IStatement:
+    def __parse_continue_statement(self, offset: int) -> IStatement:
         if not self.__consume_if(TokenType.T_CONTINUE):
             return None
         self.__expect_token_type(TokenType.T_SEMICOLON)
-        return ContinueStatement(position)
+        return ContinueStatement(offset)
 
     def __parse_statement(self) -> IStatement:
-        position = self.current_token.position
-        return (
-            self.__parse_if_statement(position)
-            or self.__parse_while_statement(position)
-            or self.__parse_return_statement(position)
-            or self.__parse_for_statement(position)
-            or self.__parse_variable_statement(position)
-            or self.__parse_try_catch_statement(position)
-            or self.__parse_throw_exception_statement(position)
-            or self.__parse_break_statement(position)
-            or self.__parse_continue_statement(position)
-        )
+        if parse_statement := self.statement_parsers[self.current_token.type]:
+            return parse_statement(self.current_token.offset)
+        return None
 
     ############################## FUNCTION DEF ##############################
 
@@ -389,22 +660,21 @@ class Parser:
         if not self.__consume_if(TokenType.T_ASSIGN):
             return Parameter(name, is_optional=True)
         token = self.current_token
-        if constructor := literal_with_value_token_to_constructor.get(token.type):
+        if constructor := self.literal_with_value_token_to_constructor[token.type]:
             self.__next_token()
             return Parameter(
                 name,
                 is_optional=True,
-                value=constructor(token.value),
+                value=constructor(token.value, token.offset),
             )
-        elif constructor := literal_without_value_token_to_constructor.get(token.type):
+        elif constructor := self.literal_without_value_token_to_constructor[token.type]:
             self.__next_token()
             return Parameter(
                 name,
                 is_optional=True,
-                value=constructor(),
+                value=constructor(token.offset),
             )
         elif self.__check_token_type(TokenType.T_IDENTIFIER):
-            self.__next_token()
             expression = self.__expect_expression(
                 self.__parse_property_access_expression,
                 PARSER_ERROR_TYPES.MISSING_EXPRESSION,
@@ -434,25 +704,60 @@ class Parser:
             self.__check_if_param_is_valid(param, parameters)
         return parameters
 
+    def __skip_block(self) -> int | None:
+        if not self.__check_token_type(TokenType.T_LEFT_CURLY_BRACKET):
+            return None
+        kinds = self.lexer.token_buffer.kinds
+        start = self.lexer.index - 1
+        index = start + 1
+        depth = 1
+        while depth:
+            try:
+                end = kinds.index(TokenType.T_RIGHT_CURLY_BRACKET, index)
+            except ValueError:
+                return None
+            depth += kinds[index:end].count(TokenType.T_LEFT_CURLY_BRACKET) - 1
+            index = end + 1
+        self.lexer.index = index
+        self.__next_token()
+        return start
+
     def __parse_func_def(self, functions: dict) -> bool:
         while self.__consume_if(TokenType.T_COMMENT):
             pass
         if not self.__check_token_type(TokenType.T_IDENTIFIER):
             return False
         name = self.current_token.value
-        position = self.current_token.position
+        offset = self.current_token.offset
         self.__next_token()
         self.__expect_token_type(TokenType.T_LEFT_BRACKET)
         parameters = self.__parse_parameters()
         self.__expect_token_type(TokenType.T_RIGHT_BRACKET)
-        block = self.__expect_block()
+        if self.lazy_bodies and (start := self.__skip_block()) is not None:
+            block = None
+            self.block_loaders[name] = partial(self.parse_block_at, start)
+        else:
+            block = self.__expect_block()
+            self.block_loaders.pop(name, None)
         if functions.get(name):
             self.__add_error(PARSER_ERROR_TYPES.FUNCTION_ALREADY_EXIST)
-        functions[name] = FunctionDef(name, parameters, block, position)
+        functions[name] = FunctionDef(name, parameters, block, offset)
         return True
 
     def parse(self) -> Program:
         functions: dict[str, FunctionDef | BuiltInFunction] = get_built_in_functions()
         while self.__parse_func_def(functions):
             pass
-        return Program(functions)
+        return Program(functions, self.lexer.line_index, self.block_loaders)
+
+    def parse_block_at(self, index: int) -> BlockStatement:
+        self.lexer.index = index
+        self.__next_token()
+        return self.__parse_block_statement()
+
+    @staticmethod
+    async def parse_async(async_lexer: AsyncLexer) -> Program:
+        loop = asyncio.get_running_loop()
+        return await asyncio.to_thread(
+            lambda: Parser(async_lexer.create_lexer(loop)).parse()
+        )
@@ -0,0 +1,64 @@
+import inspect
+import time
+from collections.abc import Callable, Generator
+
+RULE_METHOD_PREFIX = "_Parser__"
+RULE_NAME_PREFIXES: tuple[str, ...] = ("parse_", "start_", "resume_")
+
+
+class RuleProfiler:
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = {}
+        self.times: dict[str, float] = {}
+
+    def instrument(self, parser: any) -> None:
+        for attribute in dir(type(parser)):
+            rule = attribute.removeprefix(RULE_METHOD_PREFIX)
+            if rule == attribute or not rule.startswith(RULE_NAME_PREFIXES):
+                continue
+            method = getattr(parser, attribute)
+            self.calls.setdefault(rule, 0)
+            self.times.setdefault(rule, 0.0)
+            if inspect.isgeneratorfunction(method):
+                setattr(parser, attribute, self.__wrap_generator(rule, method))
+            else:
+                setattr(parser, attribute, self.__wrap(rule, method))
+
+    def __wrap(self, rule: str, method: Callable) -> Callable:
+        def profiled_method(*arguments: any) -> any:
+            self.calls[rule] += 1
+            start = time.perf_counter()
+            try:
+                return method(*arguments)
+            finally:
+                self.times[rule] += time.perf_counter() - start
+
+        return profiled_method
+
+    def __wrap_generator(self, rule: str, method: Callable) -> Callable:
+        def profiled_generator(*arguments: any) -> Generator:
+            self.calls[rule] += 1
+            generator = method(*arguments)
+            sent = None
+            while True:
+                start = time.perf_counter()
+                try:
+                    request = generator.send(sent)
+                except StopIteration as stop:
+                    return stop.value
+                finally:
+                    self.times[rule] += time.perf_counter() - start
+                sent = yield request
+
+        return profiled_generator
+
+    def get_rule_stats(self) -> list[tuple[str, int, float]]:
+        return sorted(
+            (
+                (rule, calls, self.times[rule])
+                for rule, calls in self.calls.items()
+                if calls
+            ),
+            key=lambda stats: stats[2],
+            reverse=True,
+        )
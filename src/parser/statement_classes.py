@@ -1,5 +1,4 @@
 from __future__ import annotations
-from utils.position_class import Position
 
 from typing import TYPE_CHECKING
 
@@ -8,8 +7,10 @@ if TYPE_CHECKING:
 
 
 class IExpression:
-    def __init__(self, position: Position = None) -> None:
-        self.position: Position = position
+    __slots__ = ("offset",)
+
+    def __init__(self, offset: int = None) -> None:
+        self.offset: int = offset
 
     def __eq__(self, other):
         return type(self) == type(other)
@@ -19,10 +20,12 @@ class IExpression:
 
 
 class InfixExpression(IExpression):
+    __slots__ = ("left", "right")
+
     def __init__(
-        self, left: IExpression, right: IExpression, position: Position = None
+        self, left: IExpression, right: IExpression, offset: int = None
     ) -> None:
-        super().__init__(position)
+        super().__init__(offset)
         self.left: IExpression = left
         self.right: IExpression = right
 
@@ -37,120 +40,154 @@ class InfixExpression(IExpression):
 
 
 class OrExpression(InfixExpression):
+    __slots__ = ()
+
     def __init__(
-        self, left: IExpression, right: IExpression, position: Position = None
+        self, left: IExpression, right: IExpression, offset: int = None
     ) -> None:
-        super().__init__(left, right, position)
+        super().__init__(left, right, offset)
 
 
 class AndExpression(InfixExpression):
+    __slots__ = ()
+
     def __init__(
-        self, left: IExpression, right: IExpression, position: Position = None
+        self, left: IExpression, right: IExpression, offset: int = None
     ) -> None:
-        super().__init__(left, right, position)
+        super().__init__(left, right, offset)
 
 
 class EqualExpression(InfixExpression):
+    __slots__ = ()
+
     def __init__(
-        self, left: IExpression, right: IExpression, position: Position = None
+        self, left: IExpression, right: IExpression, offset: int = None
     ) -> None:
-        super().__init__(left, right, position)
+        super().__init__(left, right, offset)
 
 
 class NotEqualExpression(InfixExpression):
+    __slots__ = ()
+
     def __init__(
-        self, left: IExpression, right: IExpression, position: Position = None
+        self, left: IExpression, right: IExpression, offset: int = None
     ) -> None:
-        super().__init__(left, right, position)
+        super().__init__(left, right, offset)
 
 
 class GreaterThanExpression(InfixExpression):
+    __slots__ = ()
+
     def __init__(
-        self, left: IExpression, right: IExpression, position: Position = None
+        self, left: IExpression, right: IExpression, offset: int = None
     ) -> None:
-        super().__init__(left, right, position)
+        super().__init__(left, right, offset)
 
 
 class GreaterEqualExpression(InfixExpression):
+    __slots__ = ()
+
     def __init__(
-        self, left: IExpression, right: IExpression, position: Position = None
+        self, left: IExpression, right: IExpression, offset: int = None
     ) -> None:
-        super().__init__(left, right, position)
+        super().__init__(left, right, offset)
 
 
 class LessThanExpression(InfixExpression):
+    __slots__ = ()
+
     def __init__(
-        self, left: IExpression, right: IExpression, position: Position = None
+        self, left: IExpression, right: IExpression, offset: int = None
     ) -> None:
-        super().__init__(left, right, position)
+        super().__init__(left, right, offset)
 
 
 class LessEqualExpression(InfixExpression):
+    __slots__ = ()
+
     def __init__(
-        self, left: IExpression, right: IExpression, position: Position = None
+        self, left: IExpression, right: IExpression, offset: int = None
     ) -> None:
-        super().__init__(left, right, position)
+        super().__init__(left, right, offset)
 
 
 class AddExpression(InfixExpression):
+    __slots__ = ()
+
     def __init__(
-        self, left: IExpression, right: IExpression, position: Position = None
+        self, left: IExpression, right: IExpression, offset: int = None
     ) -> None:
-        super().__init__(left, right, position)
+        super().__init__(left, right, offset)
 
 
 class SubtractExpression(InfixExpression):
+    __slots__ = ()
+
     def __init__(
-        self, left: IExpression, right: IExpression, position: Position = None
+        self, left: IExpression, right: IExpression, offset: int = None
     ) -> None:
-        super().__init__(left, right, position)
+        super().__init__(left, right, offset)
 
 
 class MultiplyExpression(InfixExpression):
+    __slots__ = ()
+
     def __init__(
-        self, left: IExpression, right: IExpression, position: Position = None
+        self, left: IExpression, right: IExpression, offset: int = None
     ) -> None:
-        super().__init__(left, right, position)
+        super().__init__(left, right, offset)
 
 
 class DivideExpression(InfixExpression):
+    __slots__ = ()
+
     def __init__(
-        self, left: IExpression, right: IExpression, position: Position = None
+        self, left: IExpression, right: IExpression, offset: int = None
     ) -> None:
-        super().__init__(left, right, position)
+        super().__init__(left, right, offset)
 
 
 class ModuloExpression(InfixExpression):
+    __slots__ = ()
+
     def __init__(
-        self, left: IExpression, right: IExpression, position: Position = None
+        self, left: IExpression, right: IExpression, offset: int = None
     ) -> None:
-        super().__init__(left, right, position)
+        super().__init__(left, right, offset)
 
 
 class BitwiseNegationExpression(IExpression):
-    def __init__(self, expression: IExpression, position: Position = None) -> None:
-        super().__init__(position)
+    __slots__ = ("expression",)
+
+    def __init__(self, expression: IExpression, offset: int = None) -> None:
+        super().__init__(offset)
         self.expression: IExpression = expression
 
 
 class NumericNegationExpression(IExpression):
-    def __init__(self, expression: IExpression, position: Position = None) -> None:
-        super().__init__(position)
+    __slots__ = ("expression",)
+
+    def __init__(self, expression: IExpression, offset: int = None) -> None:
+        super().__init__(offset)
         self.expression: IExpression = expression
 
 
 class TypeCheckExpression(IExpression):
+    __slots__ = ("expression", "type_name")
+
     def __init__(
-        self, expression: IExpression, type_name: str, position: Position = None
+        self, expression: IExpression, type_name: str, offset: int = None
     ) -> None:
-        super().__init__(position)
+        super().__init__(offset)
         self.expression: IExpression = expression
         self.type_name: str = type_name
 
 
 class LiteralExpression(IExpression):
-    def __init__(self, value: any, position: Position = None) -> None:
-        super().__init__(position)
+    __slots__ = ("value",)
+
+    def __init__(self, value: any, offset: int = None) -> None:
+        super().__init__(offset)
         self.value: any = value
 
     def __eq__(self, other):
@@ -160,43 +197,59 @@ class LiteralExpression(IExpression):
 
 
 class NullLiteral(LiteralExpression):
-    def __init__(self, position: Position = None) -> None:
-        super().__init__(None, position)
+    __slots__ = ()
+
+    def __init__(self, offset: int = None) -> None:
+        super().__init__(None, offset)
 
 
 class IntegerLiteral(LiteralExpression):
-    def __init__(self, value: int, position: Position = None) -> None:
-        super().__init__(value, position)
+    __slots__ = ()
+
+    def __init__(self, value: int, offset: int = None) -> None:
+        super().__init__(value, offset)
 
 
 class FloatLiteral(LiteralExpression):
-    def __init__(self, value: float, position: Position = None) -> None:
-        super().__init__(value, position)
+    __slots__ = ()
+
+    def __init__(self, value: float, offset: int = None) -> None:
+        super().__init__(value, offset)
 
 
 class StringLiteral(LiteralExpression):
-    def __init__(self, value: str, position: Position = None) -> None:
-        super().__init__(value, position)
+    __slots__ = ()
+
+    def __init__(self, value: str, offset: int = None) -> None:
+        super().__init__(value, offset)
 
 
 class BooleanLiteral(LiteralExpression):
-    def __init__(self, value: bool, position: Position = None) -> None:
-        super().__init__(value, position)
+    __slots__ = ()
+
+    def __init__(self, value: bool, offset: int = None) -> None:
+        super().__init__(value, offset)
 
 
 class FalseLiteral(BooleanLiteral):
-    def __init__(self, position: Position = None) -> None:
-        super().__init__(False, position)
+    __slots__ = ()
+
+    def __init__(self, offset: int = None) -> None:
+        super().__init__(False, offset)
 
 
 class TrueLiteral(BooleanLiteral):
-    def __init__(self, position: Position = None) -> None:
-        super().__init__(True, position)
+    __slots__ = ()
+
+    def __init__(self, offset: int = None) -> None:
+        super().__init__(True, offset)
 
 
 class IdentifierExpression(IExpression):
-    def __init__(self, name: str, position: Position = None) -> None:
-        super().__init__(position)
+    __slots__ = ("name",)
+
+    def __init__(self, name: str, offset: int = None) -> None:
+        super().__init__(offset)
         self.name: str = name
 
     def __eq__(self, other):
@@ -206,10 +259,12 @@ class IdentifierExpression(IExpression):
 
 
 class FunctionCallExpression(IExpression):
+    __slots__ = ("name", "arguments")
+
     def __init__(
-        self, name: str, arguments: list[IExpression], position: Position = None
+        self, name: str, arguments: list[IExpression], offset: int = None
     ) -> None:
-        super().__init__(position)
+        super().__init__(offset)
         self.name: str = name
         self.arguments: list[Argument] = arguments
 
@@ -224,28 +279,34 @@ class FunctionCallExpression(IExpression):
 
 
 class PropertyAccessExpression(InfixExpression):
+    __slots__ = ()
+
     def __init__(
         self,
         main_object: FunctionCallExpression | IdentifierExpression,
         property: FunctionCallExpression | IdentifierExpression,
-        position: Position = None,
+        offset: int = None,
     ) -> None:
-        super().__init__(main_object, property, position)
+        super().__init__(main_object, property, offset)
 
 
 class OptionalPropertyAccessExpression(InfixExpression):
+    __slots__ = ()
+
     def __init__(
         self,
         main_object: FunctionCallExpression | IdentifierExpression,
         property: FunctionCallExpression | IdentifierExpression,
-        position: Position = None,
+        offset: int = None,
     ) -> None:
-        super().__init__(main_object, property, position)
+        super().__init__(main_object, property, offset)
 
 
 class IStatement:
-    def __init__(self, position: Position = None) -> None:
-        self.position: Position = position
+    __slots__ = ("offset",)
+
+    def __init__(self, offset: int = None) -> None:
+        self.offset: int = offset
 
     def __eq__(self, other):
         return type(self) == type(other)
@@ -255,9 +316,11 @@ class IStatement:
 
 
 class BlockStatement:
-    def __init__(self, statements: list[IStatement], position: Position = None) -> None:
+    __slots__ = ("statements", "offset")
+
+    def __init__(self, statements: list[IStatement], offset: int = None) -> None:
         self.statements: list[IStatement] = statements
-        self.position: Position = position
+        self.offset: int = offset
 
     def __eq__(self, other):
         if isinstance(other, BlockStatement):
@@ -269,10 +332,12 @@ class BlockStatement:
 
 
 class ConditionalStatement(IStatement):
+    __slots__ = ("condition", "block")
+
     def __init__(
-        self, condition: IExpression, block: BlockStatement, position: Position = None
+        self, condition: IExpression, block: BlockStatement, offset: int = None
     ) -> None:
-        super().__init__(position)
+        super().__init__(offset)
         self.condition: IExpression = condition
         self.block: BlockStatement = block
 
@@ -287,15 +352,17 @@ class ConditionalStatement(IStatement):
 
 
 class IfStatement(ConditionalStatement):
+    __slots__ = ("elif_statements", "else_statement")
+
     def __init__(
         self,
         condition: IExpression,
         block: BlockStatement,
         elif_statements: list[ConditionalStatement] = [],
         else_statement: BlockStatement = None,
-        position: Position = None,
+        offset: int = None,
     ) -> None:
-        super().__init__(condition, block, position)
+        super().__init__(condition, block, offset)
         self.elif_statements: list[ConditionalStatement] = elif_statements
         self.else_statement: BlockStatement = else_statement
 
@@ -307,21 +374,25 @@ class IfStatement(ConditionalStatement):
 
 
 class WhileStatement(ConditionalStatement):
+    __slots__ = ()
+
     def __init__(
-        self, condition: IExpression, block: BlockStatement, position: Position = None
+        self, condition: IExpression, block: BlockStatement, offset: int = None
     ) -> None:
-        super().__init__(condition, block, position)
+        super().__init__(condition, block, offset)
 
 
 class ForStatement(IStatement):
+    __slots__ = ("variable", "iterable", "block")
+
     def __init__(
         self,
         variable: IdentifierExpression,
         iterable: IExpression,
         block: BlockStatement,
-        position: Position = None,
+        offset: int = None,
     ) -> None:
-        super().__init__(position)
+        super().__init__(offset)
         self.variable: IdentifierExpression = variable
         self.iterable: IExpression = iterable
         self.block: BlockStatement = block
@@ -338,10 +409,10 @@ class ForStatement(IStatement):
 
 
 class ReturnStatement(IStatement):
-    def __init__(
-        self, expression: IExpression = None, position: Position = None
-    ) -> None:
-        super().__init__(position)
+    __slots__ = ("expression",)
+
+    def __init__(self, expression: IExpression = None, offset: int = None) -> None:
+        super().__init__(offset)
         self.expression: IExpression = expression
 
     def __eq__(self, other):
@@ -351,13 +422,15 @@ class ReturnStatement(IStatement):
 
 
 class AssignmentStatement(IStatement):
+    __slots__ = ("variable", "expression")
+
     def __init__(
         self,
         variable: PropertyAccessExpression | OptionalPropertyAccessExpression,
         expression: IExpression,
-        position: Position = None,
+        offset: int = None,
     ) -> None:
-        super().__init__(position)
+        super().__init__(offset)
         self.variable: IdentifierExpression = variable
         self.expression: IExpression = expression
 
@@ -372,64 +445,76 @@ class AssignmentStatement(IStatement):
 
 
 class AssignmentPlusStatement(AssignmentStatement):
+    __slots__ = ()
+
     def __init__(
         self,
         variable: IdentifierExpression,
         expression: IExpression,
-        position: Position = None,
+        offset: int = None,
     ) -> None:
-        super().__init__(variable, expression, position)
+        super().__init__(variable, expression, offset)
 
 
 class AssignmentMinusStatement(AssignmentStatement):
+    __slots__ = ()
+
     def __init__(
         self,
         variable: IdentifierExpression,
         expression: IExpression,
-        position: Position = None,
+        offset: int = None,
     ) -> None:
-        super().__init__(variable, expression, position)
+        super().__init__(variable, expression, offset)
 
 
 class AssignmentMultiplyStatement(AssignmentStatement):
+    __slots__ = ()
+
     def __init__(
         self,
         variable: IdentifierExpression,
         expression: IExpression,
-        position: Position = None,
+        offset: int = None,
     ) -> None:
-        super().__init__(variable, expression, position)
+        super().__init__(variable, expression, offset)
 
 
 class AssignmentDivideStatement(AssignmentStatement):
+    __slots__ = ()
+
     def __init__(
         self,
         variable: IdentifierExpression,
         expression: IExpression,
-        position: Position = None,
+        offset: int = None,
     ) -> None:
-        super().__init__(variable, expression, position)
+        super().__init__(variable, expression, offset)
 
 
 class AssignmentModuloStatement(AssignmentStatement):
+    __slots__ = ()
+
     def __init__(
         self,
         variable: IdentifierExpression,
         expression: IExpression,
-        position: Position = None,
+        offset: int = None,
     ) -> None:
-        super().__init__(variable, expression, position)
+        super().__init__(variable, expression, offset)
 
 
 class CatchStatement(IStatement):
+    __slots__ = ("catch_statement", "error_types", "error_var")
+
     def __init__(
         self,
         catch_statement: BlockStatement,
         error_types: list[IdentifierExpression] = [],
         error_var: IdentifierExpression = None,
-        position: Position = None,
+        offset: int = None,
     ) -> None:
-        super().__init__(position)
+        super().__init__(offset)
         self.catch_statement: BlockStatement = catch_statement
         self.error_types: list[IdentifierExpression] = error_types
         self.error_var: IdentifierExpression = error_var
@@ -446,13 +531,15 @@ class CatchStatement(IStatement):
 
 
 class TryCatchStatement(IStatement):
+    __slots__ = ("try_statement", "catch_statements")
+
     def __init__(
         self,
         try_statement: BlockStatement,
         catch_statements: list[CatchStatement],
-        position: Position = None,
+        offset: int = None,
     ) -> None:
-        super().__init__(position)
+        super().__init__(offset)
         self.try_statement: BlockStatement = try_statement
         self.catch_statements: list[CatchStatement] = catch_statements
 
@@ -467,28 +554,36 @@ class TryCatchStatement(IStatement):
 
 
 class ThrowStatement(IStatement):
-    def __init__(self, expression: IExpression, position: Position = None) -> None:
-        super().__init__(position)
+    __slots__ = ("expression",)
+
+    def __init__(self, expression: IExpression, offset: int = None) -> None:
+        super().__init__(offset)
         self.expression: IExpression = expression
 
 
 class BreakStatement(IStatement):
-    def __init__(self, position: Position = None) -> None:
-        super().__init__(position)
+    __slots__ = ()
+
+    def __init__(self, offset: int = None) -> None:
+        super().__init__(offset)
 
 
 class ContinueStatement(IStatement):
-    def __init__(self, position: Position = None) -> None:
-        super().__init__(position)
+    __slots__ = ()
+
+    def __init__(self, offset: int = None) -> None:
+        super().__init__(offset)
 
 
 class Argument:
+    __slots__ = ("value", "is_reference", "offset")
+
     def __init__(
-        self, value: IExpression, is_reference: bool = False, position: Position = None
+        self, value: IExpression, is_reference: bool = False, offset: int = None
     ) -> None:
         self.value: IExpression = value
         self.is_reference: bool = is_reference
-        self.position: Position = position
+        self.offset: int = offset
 
     def __eq__(self, other):
         if isinstance(other, Argument):
@@ -500,17 +595,19 @@ class Argument:
 
 
 class Parameter:
+    __slots__ = ("name", "is_optional", "value", "offset")
+
     def __init__(
         self,
         name: str,
         is_optional: bool = False,
         value: LiteralExpression = NullLiteral(),
-        position: Position = None,
+        offset: int = None,
     ) -> None:
         self.name: str = name
         self.is_optional: bool = is_optional
         self.value: LiteralExpression = value
-        self.position: Position = position
+        self.offset: int = offset
 
     def __eq__(self, other):
         if isinstance(other, Parameter):
@@ -526,17 +623,19 @@ class Parameter:
 
 
 class FunctionDef:
+    __slots__ = ("name", "parameters", "block", "offset")
+
     def __init__(
         self,
         name: str,
         parameters: list[Parameter],
         block: BlockStatement,
-        position: Position = None,
+        offset: int = None,
     ) -> None:
         self.name: str = name
         self.parameters: list[Parameter] = parameters
         self.block: BlockStatement = block
-        self.position: Position = position
+        self.offset: int = offset
 
     def __eq__(self, other):
         if isinstance(other, FunctionDef):
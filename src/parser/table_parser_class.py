@@ -0,0 +1,397 @@
+from collections.abc import Callable
+
+from interpreter.built_in_functions import BuiltInFunction, get_built_in_functions
+from lexer.lexer_class import Lexer
+from lexer.token_class import Token
+from lexer.token_type_enum import TokenType
+from parser.grammar_tables import (
+    START_SYMBOL,
+    empty_productions,
+    parse_table,
+    productions,
+)
+from parser.helpers import *
+from parser.parser_error_class import PARSER_ERROR_TYPES, ParserError
+from parser.statement_classes import *
+from program.program_class import Program
+
+TERMINAL_COUNT: int = len(TokenType)
+
+nonterminal_to_symbol: dict[str, int] = {
+    nonterminal: TERMINAL_COUNT + index for index, nonterminal in enumerate(parse_table)
+}
+
+
+def get_symbol(name: str) -> int:
+    if name in nonterminal_to_symbol:
+        return nonterminal_to_symbol[name]
+    return TokenType[name].value
+
+
+production_symbols: list[tuple[int, ...]] = [
+    tuple(get_symbol(symbol) for symbol in rhs) for _, _, rhs in productions
+]
+
+nonterminals: list[str] = list(parse_table)
+
+
+def get_production(nonterminal: str, token_type: TokenType) -> int | None:
+    production = parse_table[nonterminal].get(
+        token_type.name, empty_productions.get(nonterminal)
+    )
+    if production is None:
+        return None
+    _, action, rhs = productions[production]
+    if action == "" and len(rhs) == 1 and rhs[0] in parse_table:
+        return get_production(rhs[0], token_type)
+    return production
+
+
+symbol_to_productions: list[list[int | None]] = [[]] * TERMINAL_COUNT + [
+    [get_production(nonterminal, token_type) for token_type in TokenType]
+    for nonterminal in parse_table
+]
+
+PUSH_NONE_SYMBOL: int = TERMINAL_COUNT + len(nonterminals)
+PUSH_LIST_SYMBOL: int = PUSH_NONE_SYMBOL + 1
+
+nonterminal_to_error: dict[str, PARSER_ERROR_TYPES] = {
+    "instruction_block": PARSER_ERROR_TYPES.MISSING_BLOCK_START,
+    "params": PARSER_ERROR_TYPES.MISSING_PARAMETER,
+    "param": PARSER_ERROR_TYPES.MISSING_PARAMETER,
+    "factor": PARSER_ERROR_TYPES.INVALID_PARAMETER_VALUE,
+    "identifier": PARSER_ERROR_TYPES.MISSING_TYPE_NAME,
+    "argument": PARSER_ERROR_TYPES.MISSING_ARGUMENT,
+    "catch_block": PARSER_ERROR_TYPES.MISSING_CATCH_KEYWORD,
+}
+
+
+class TableParser:
+    def __init__(self, lexer: Lexer) -> None:
+        self.lexer = lexer
+        self.error_handler = lexer.error_handler
+        self.functions: dict[str, FunctionDef | BuiltInFunction] = {}
+        self.parameter_names: set[str] = set()
+        self.current_token: Token = lexer.build_next_token()
+        while self.current_token.type == TokenType.T_COMMENT:
+            self.__next_token()
+        rule_builders: dict[str, Callable[[list], any]] = {
+            "repeat": self.__build_repeat,
+            "function_definition": self.__build_function_definition,
+            "params": self.__build_params,
+            "param": self.__build_param,
+            "instruction_block": self.__build_instruction_block,
+            "statement": self.__build_statement,
+            "variable_value_change_statement": self.__build_variable_statement,
+            "return_statement": self.__build_return_statement,
+            "if_block": self.__build_if_block,
+            "else_if_block": self.__build_else_if_block,
+            "else_block": self.__build_else_block,
+            "if_statement": self.__build_if_statement,
+            "while_statement": self.__build_while_statement,
+            "iterator_for_statement": self.__build_for_statement,
+            "exception_throw_statement": self.__build_throw_statement,
+            "try_block": self.__build_try_block,
+            "catch_block": self.__build_catch_block,
+            "try_catch_statement": self.__build_try_catch_statement,
+            "or_expression": self.__build_infix_expression,
+            "and_expression": self.__build_infix_expression,
+            "comparison_expression": self.__build_infix_expression,
+            "additive_expression": self.__build_infix_expression,
+            "multiplicative_expression": self.__build_infix_expression,
+            "negation_expression": self.__build_negation_expression,
+            "type_check_operation": self.__build_type_check_expression,
+            "base_expression": self.__build_expression_in_brackets,
+            "property_access": self.__build_property_access_expression,
+            "identifier_or_function_call": self.__build_identifier_or_function_call,
+            "arguments": self.__build_arguments,
+            "argument": self.__build_argument,
+            "number": self.__build_literal,
+            "string": self.__build_literal,
+            "boolean": self.__build_literal,
+            "null": self.__build_literal,
+        }
+        self.production_actions: list[Callable[[list], any]] = []
+        self.production_arities: list[int] = []
+        self.production_expansions: list[tuple[int, ...]] = []
+        for index, (_, action, _) in enumerate(productions):
+            symbols = production_symbols[index]
+            builder = rule_builders.get(action)
+            arity = len(symbols) + 1
+            if action == "repeat_list":
+                expansion = (*symbols, PUSH_LIST_SYMBOL)
+            elif action == "repeat":
+                expansion = (symbols[-1], ~index, *reversed(symbols[:-1]))
+                arity = len(symbols)
+            elif action == "repeat_end":
+                expansion = ()
+            elif builder is None and not symbols:
+                expansion = (PUSH_NONE_SYMBOL,)
+            elif builder is None and len(symbols) == 1:
+                expansion = symbols
+            else:
+                expansion = (~index, *reversed(symbols))
+            self.production_actions.append(builder or self.__build_sequence)
+            self.production_arities.append(arity)
+            self.production_expansions.append(expansion)
+
+    ############################## UTILS ##############################
+
+    def __add_error(self, error_type: PARSER_ERROR_TYPES) -> None:
+        self.error_handler.add_error(
+            ParserError(error_type, self.current_token.position)
+        )
+
+    def __next_token(self) -> None:
+        self.current_token = self.lexer.build_next_token_without_comments()
+
+    def __add_symbol_error(self, symbol: int) -> None:
+        if symbol < TERMINAL_COUNT:
+            error_type = token_to_error.get(TokenType(symbol))
+        else:
+            error_type = nonterminal_to_error.get(nonterminals[symbol - TERMINAL_COUNT])
+        self.__add_error(error_type or PARSER_ERROR_TYPES.MISSING_EXPRESSION)
+
+    ############################## TABLE DRIVER ##############################
+
+    def __parse_symbols(self, symbols: list[int]) -> list | None:
+        expansions = self.production_expansions
+        arities = self.production_arities
+        actions = self.production_actions
+        build_next_token = self.lexer.build_next_token_without_comments
+        token = self.current_token
+        values: list = []
+        while symbols:
+            symbol = symbols.pop()
+            if symbol < 0:
+                production = ~symbol
+                arity = arities[production]
+                arguments = values[-arity:]
+                del values[-arity:]
+                self.current_token = token
+                values.append(actions[production](arguments))
+            elif symbol < TERMINAL_COUNT:
+                if token.type != symbol:
+                    self.current_token = token
+                    self.__add_symbol_error(symbol)
+                    return None
+                values.append(token)
+                token = build_next_token()
+            elif symbol < PUSH_NONE_SYMBOL:
+                if (production := symbol_to_productions[symbol][token.type]) is None:
+                    self.current_token = token
+                    self.__add_symbol_error(symbol)
+                    return None
+                expansion = expansions[production]
+                if expansion and expansion[0] < 0:
+                    values.append(token.offset)
+                symbols.extend(expansion)
+            elif symbol == PUSH_NONE_SYMBOL:
+                values.append(None)
+            else:
+                values.append([])
+        self.current_token = token
+        return values
+
+    ############################## HELPER RULES ##############################
+
+    @staticmethod
+    def __build_sequence(arguments: list) -> list:
+        return arguments[1:]
+
+    @staticmethod
+    def __build_repeat(arguments: list) -> list:
+        items = arguments[0]
+        items.append(arguments[1] if len(arguments) == 2 else arguments[1:])
+        return items
+
+    ############################## EXPRESSIONS ##############################
+
+    @staticmethod
+    def __build_literal(arguments: list) -> LiteralExpression:
+        _, token = arguments
+        if constructor := literal_with_value_token_to_constructor[token.type]:
+            return constructor(token.value, token.offset)
+        return literal_without_value_token_to_constructor[token.type](token.offset)
+
+    @staticmethod
+    def __build_argument(arguments: list) -> Argument:
+        offset, reference, expression = arguments
+        return Argument(expression, reference is not None, offset)
+
+    @staticmethod
+    def __build_arguments(arguments: list) -> list[Argument]:
+        _, first, rest = arguments
+        return [first, *(argument for _, argument in rest)]
+
+    @staticmethod
+    def __build_identifier_or_function_call(arguments: list) -> IExpression:
+        _, name, call = arguments
+        if call is None:
+            return IdentifierExpression(name.value, name.offset)
+        return FunctionCallExpression(name.value, call[1] or [], name.offset)
+
+    @staticmethod
+    def __build_property_access_expression(arguments: list) -> IExpression:
+        _, left, accesses = arguments
+        for operator, right in accesses:
+            left = access_token_to_constructor[operator.type](
+                left, right, operator.offset
+            )
+        return left
+
+    @staticmethod
+    def __build_expression_in_brackets(arguments: list) -> IExpression:
+        return arguments[2]
+
+    @staticmethod
+    def __build_type_check_expression(arguments: list) -> IExpression:
+        _, expression, type_check = arguments
+        if type_check is None:
+            return expression
+        operator, type_name = type_check
+        return TypeCheckExpression(expression, type_name.value, operator.offset)
+
+    @staticmethod
+    def __build_negation_expression(arguments: list) -> IExpression:
+        offset, operator, expression = arguments
+        return negation_token_to_constructor[operator.type](expression, offset)
+
+    @staticmethod
+    def __build_infix_expression(arguments: list) -> IExpression:
+        _, left, operations = arguments
+        for operator, right in operations:
+            left = infix_token_to_constructor[operator.type](
+                left, right, operator.offset
+            )
+        return left
+
+    ############################## STATEMENTS ##############################
+
+    @staticmethod
+    def __build_instruction_block(arguments: list) -> BlockStatement:
+        offset, _, statements, _ = arguments
+        return BlockStatement(statements, offset)
+
+    @staticmethod
+    def __build_statement(arguments: list) -> IStatement:
+        offset, keyword, _ = arguments
+        if keyword.type == TokenType.T_BREAK:
+            return BreakStatement(offset)
+        return ContinueStatement(offset)
+
+    @staticmethod
+    def __build_variable_statement(arguments: list) -> IStatement:
+        offset, target, assignment, _ = arguments
+        if assignment is None:
+            return target
+        operator, expression = assignment
+        return assignment_token_to_constructor[operator.type](
+            target, expression, offset
+        )
+
+    @staticmethod
+    def __build_return_statement(arguments: list) -> IStatement:
+        offset, _, expression, _ = arguments
+        return ReturnStatement(expression, offset)
+
+    @staticmethod
+    def __build_if_block(arguments: list) -> tuple[IExpression, BlockStatement]:
+        _, _, _, condition, _, block = arguments
+        return condition, block
+
+    @staticmethod
+    def __build_else_if_block(arguments: list) -> ConditionalStatement:
+        _, _, left_bracket, condition, _, block = arguments
+        return ConditionalStatement(condition, block, left_bracket.offset)
+
+    @staticmethod
+    def __build_else_block(arguments: list) -> BlockStatement:
+        return arguments[2]
+
+    @staticmethod
+    def __build_if_statement(arguments: list) -> IStatement:
+        offset, (condition, block), elif_statements, else_statement = arguments
+        return IfStatement(condition, block, elif_statements, else_statement, offset)
+
+    @staticmethod
+    def __build_while_statement(arguments: list) -> IStatement:
+        offset, _, _, condition, _, block = arguments
+        return WhileStatement(condition, block, offset)
+
+    @staticmethod
+    def __build_for_statement(arguments: list) -> IStatement:
+        offset, _, _, variable, _, iterable, _, block = arguments
+        return ForStatement(
+            IdentifierExpression(variable.value, variable.offset),
+            iterable,
+            block,
+            offset,
+        )
+
+    @staticmethod
+    def __build_throw_statement(arguments: list) -> IStatement:
+        offset, _, expression, _ = arguments
+        return ThrowStatement(expression, offset)
+
+    @staticmethod
+    def __build_try_block(arguments: list) -> BlockStatement:
+        return arguments[2]
+
+    @staticmethod
+    def __build_catch_block(arguments: list) -> CatchStatement:
+        offset, _, declaration, block = arguments
+        if declaration is None:
+            return CatchStatement(block, [], None, offset)
+        _, first, rest, variable, _ = declaration
+        exception_types = [
+            IdentifierExpression(name.value, name.offset)
+            for name in [first, *(name for _, name in rest)]
+        ]
+        return CatchStatement(
+            block,
+            exception_types,
+            IdentifierExpression(variable.value, variable.offset),
+            offset,
+        )
+
+    @staticmethod
+    def __build_try_catch_statement(arguments: list) -> IStatement:
+        offset, try_statement, catch_statement, catch_statements = arguments
+        return TryCatchStatement(
+            try_statement, [catch_statement, *catch_statements], offset
+        )
+
+    ############################## FUNCTION DEF ##############################
+
+    def __build_param(self, arguments: list) -> Parameter:
+        _, name, optional = arguments
+        if name.value in self.parameter_names:
+            self.__add_error(PARSER_ERROR_TYPES.PARAMETER_ALREADY_EXIST)
+        self.parameter_names.add(name.value)
+        if optional is None:
+            return Parameter(name.value)
+        if optional[1] is None:
+            return Parameter(name.value, is_optional=True)
+        return Parameter(name.value, is_optional=True, value=optional[1][1])
+
+    def __build_params(self, arguments: list) -> list[Parameter]:
+        _, first, rest = arguments
+        parameters: dict[str, Parameter] = {}
+        for parameter in [first, *(parameter for _, parameter in rest)]:
+            parameters.setdefault(parameter.name, parameter)
+        self.parameter_names.clear()
+        return list(parameters.values())
+
+    def __build_function_definition(self, arguments: list) -> FunctionDef:
+        offset, name, _, parameters, _, block = arguments
+        if self.functions.get(name.value):
+            self.__add_error(PARSER_ERROR_TYPES.FUNCTION_ALREADY_EXIST)
+        function = FunctionDef(name.value, parameters or [], block, offset)
+        self.functions[name.value] = function
+        return function
+
+    def parse(self) -> Program:
+        self.functions = get_built_in_functions()
+        self.__parse_symbols([nonterminal_to_symbol[START_SYMBOL]])
+        return Program(self.functions, self.lexer.line_index)
@@ -0,0 +1,63 @@
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+from parser.flat_ast_class import FlatAst, ast_node_classes, node_layouts
+from program.program_class import Program
+
+CACHE_DIRECTORY = "__jpcache__"
+CACHE_SUFFIX = ".jpc"
+CACHE_VERSION = 3
+CACHE_MAGIC = b"JPC\0"
+
+cache_tag: bytes = repr(
+    (
+        CACHE_VERSION,
+        sys.byteorder,
+        [
+            (node_class.__name__, node_layout)
+            for node_class, node_layout in zip(ast_node_classes, node_layouts)
+        ],
+    )
+).encode()
+
+
+class ProgramCache:
+    def __init__(self, source_path: str | Path) -> None:
+        self.source_path: Path = Path(source_path)
+        self.cache_path: Path = (
+            self.source_path.parent
+            / CACHE_DIRECTORY
+            / (self.source_path.name + CACHE_SUFFIX)
+        )
+        self.header: bytes = CACHE_MAGIC + self.__compute_key()
+
+    def __compute_key(self) -> bytes:
+        key = hashlib.sha256(cache_tag)
+        key.update(self.source_path.read_bytes())
+        return key.digest()
+
+    def load(self, lazy_bodies: bool = False) -> Program | None:
+        try:
+            with open(self.cache_path, "rb") as file:
+                if file.read(len(self.header)) != self.header:
+                    return None
+                return FlatAst.load(file).to_program(lazy_bodies)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, program: Program) -> None:
+        if program.block_loaders:
+            return
+        temporary_path = self.cache_path.with_name(
+            f"{self.cache_path.name}.{os.getpid()}.tmp"
+        )
+        try:
+            self.cache_path.parent.mkdir(exist_ok=True)
+            with open(temporary_path, "wb") as file:
+                file.write(self.header)
+                FlatAst.from_program(program).dump(file)
+            os.replace(temporary_path, self.cache_path)
+        except (OSError, OverflowError, ValueError):
+            temporary_path.unlink(missing_ok=True)
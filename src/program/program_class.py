@@ -1,12 +1,29 @@
-from parser.statement_classes import FunctionDef
+from collections.abc import Callable
+
+from parser.statement_classes import BlockStatement, FunctionDef
+from utils.line_index_class import LineIndex
 
 
 class Program:
-    def __init__(self, functions: dict[str, FunctionDef]) -> None:
+    def __init__(
+        self,
+        functions: dict[str, FunctionDef],
+        line_index: LineIndex = None,
+        block_loaders: dict[str, Callable[[], BlockStatement]] = None,
+    ) -> None:
         self.functions = functions
+        self.line_index = line_index if line_index is not None else LineIndex()
+        self.block_loaders = block_loaders if block_loaders is not None else {}
 
     def __eq__(self, other):
         return self.functions == other.functions
 
+    def load_function_block(self, name: str) -> None:
+        self.functions[name].block = self.block_loaders.pop(name)()
+
+    def load_function_blocks(self) -> None:
+        for name in list(self.block_loaders):
+            self.load_function_block(name)
+
     def accept(self, visitor):
         return visitor.visit_program(self)
@@ -0,0 +1,15 @@
+from pathlib import Path
+
+from parser.statement_classes import FunctionDef
+
+CODE_EXAMPLES_DIR = Path(__file__).parents[2] / "code_examples"
+code_example_paths = sorted(CODE_EXAMPLES_DIR.glob("*.jp"))
+code_examples = [path.read_text(encoding="utf-8") for path in code_example_paths]
+
+
+def user_functions(program):
+    return {
+        name: function
+        for name, function in program.functions.items()
+        if isinstance(function, FunctionDef)
+    }
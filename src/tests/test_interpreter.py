@@ -1,11 +1,36 @@
+import contextlib
 import io
+import logging
+import re
 import pytest
+from functools import partial
 
+from interpreter.bytecode_interpreter_class import BytecodeInterpreter
+from interpreter.closure_interpreter_class import ClosureInterpreter
+from interpreter.disassembler import disassemble_program
 from interpreter.interpreter_class import Interpreter
+from interpreter.python_interpreter_class import PythonInterpreter
+from interpreter.python_transpiler_class import transpile_program
+from interpreter.runtime import CompiledRuntime
 from lexer.lexer_class import Lexer
+from lexer.token_buffer_class import TokenBufferReader
 from parser.parser_class import Parser
 from utils.error_handler_class import ErrorHandler
 from interpreter.interpreter_error_classes import *
+from parser.parser_error_class import ParserError
+
+
+@pytest.fixture(
+    params=[
+        Interpreter,
+        partial(Interpreter, tier_up_threshold=2),
+        ClosureInterpreter,
+        BytecodeInterpreter,
+        PythonInterpreter,
+    ],
+)
+def interpreter_engine(request):
+    return request.param
 
 
 def functions_template(functions: list[str]):
@@ -33,20 +58,20 @@ def block_template(name, body):
 }}"""
 
 
-def interpreter_init(body: list[str]):
+def interpreter_init(interpreter_engine, body: list[str], hash_consing: bool = False):
     error_handler = ErrorHandler()
     final_input = functions_template(body)
     with io.StringIO(final_input) as stream_provider:
         lexer = Lexer(stream_provider, error_handler)
-        parser = Parser(lexer)
+        parser = Parser(lexer, hash_consing)
         program = parser.parse()
-        interpreter = Interpreter(error_handler)
+        interpreter = interpreter_engine(error_handler)
         interpreter.visit(program)
     return error_handler
 
 
-def test_init():
-    error_handler = interpreter_init([funcion_template("main", [])])
+def test_init(interpreter_engine):
+    error_handler = interpreter_init(interpreter_engine, [funcion_template("main", [])])
     assert len(error_handler.errors) == 0
 
 
@@ -124,8 +149,10 @@ def test_init():
         ("Student() is Student", True),
     ],
 )
-def test_base_expressions(input, expected, capsys):
-    error_handler = interpreter_init([funcion_template("main", [f"print({input});"])])
+def test_base_expressions(interpreter_engine, input, expected, capsys):
+    error_handler = interpreter_init(
+        interpreter_engine, [funcion_template("main", [f"print({input});"])]
+    )
     out = capsys.readouterr()
     assert out.out == f"{expected}"
     assert len(error_handler.errors) == 0
@@ -149,11 +176,11 @@ def test_base_expressions(input, expected, capsys):
         "1.0 != 2.0",
     ],
 )
-def test_if_statement(capsys, condition):
+def test_if_statement(interpreter_engine, capsys, condition):
     template = funcion_template(
         "main", [conditional_template("if", condition, "print(1);")]
     )
-    error_handler = interpreter_init([template])
+    error_handler = interpreter_init(interpreter_engine, [template])
     out = capsys.readouterr()
     assert out.out == "1"
     assert len(error_handler.errors) == 0
@@ -190,7 +217,7 @@ def test_if_statement(capsys, condition):
         ("1.0 != 1.0", "2"),
     ],
 )
-def test_if_else_statement(capsys, condition, expected):
+def test_if_else_statement(interpreter_engine, capsys, condition, expected):
     template = funcion_template(
         "main",
         [
@@ -198,7 +225,7 @@ def test_if_else_statement(capsys, condition, expected):
             block_template("else", "print(2);"),
         ],
     )
-    error_handler = interpreter_init([template])
+    error_handler = interpreter_init(interpreter_engine, [template])
     out = capsys.readouterr()
     assert out.out == f"{expected}"
     assert len(error_handler.errors) == 0
@@ -236,7 +263,9 @@ def test_if_else_statement(capsys, condition, expected):
         ("false", "false", "3"),
     ],
 )
-def test_if_elif_else_statement(capsys, if_condition, elif_condition, expected):
+def test_if_elif_else_statement(
+    interpreter_engine, capsys, if_condition, elif_condition, expected
+):
     template = funcion_template(
         "main",
         [
@@ -245,7 +274,7 @@ def test_if_elif_else_statement(capsys, if_condition, elif_condition, expected):
             block_template("else", "print(3);"),
         ],
     )
-    error_handler = interpreter_init([template])
+    error_handler = interpreter_init(interpreter_engine, [template])
     out = capsys.readouterr()
     assert out.out == f"{expected}"
     assert len(error_handler.errors) == 0
@@ -293,7 +322,9 @@ def test_if_elif_else_statement(capsys, if_condition, elif_condition, expected):
         ("Array(3, 2, 1)", "a = a.indexOf(2)", "1"),
     ],
 )
-def test_variable_change_expressions(capsys, init_value, expression, expected):
+def test_variable_change_expressions(
+    interpreter_engine, capsys, init_value, expression, expected
+):
     template = funcion_template(
         "main",
         [
@@ -302,7 +333,7 @@ def test_variable_change_expressions(capsys, init_value, expression, expected):
             "print(a);",
         ],
     )
-    error_handler = interpreter_init([template])
+    error_handler = interpreter_init(interpreter_engine, [template])
     out = capsys.readouterr()
     assert out.out == f"{expected}"
     assert len(error_handler.errors) == 0
@@ -371,14 +402,97 @@ def test_variable_change_expressions(capsys, init_value, expression, expected):
         ),
     ],
 )
-def test_loops(expressions, expected, capsys):
+def test_loops(interpreter_engine, expressions, expected, capsys):
     template = funcion_template("main", expressions)
-    error_handler = interpreter_init([template])
+    error_handler = interpreter_init(interpreter_engine, [template])
     out = capsys.readouterr()
     assert out.out == f"{expected}"
     assert len(error_handler.errors) == 0
 
 
+def test_loops_with_hash_consing(interpreter_engine, capsys):
+    template = funcion_template(
+        "main",
+        [
+            "x = 0;",
+            "y = 0;",
+            conditional_template("while", "x < 5", "x += 1; print(x % 2);"),
+            conditional_template("while", "y < 5", "y += 1; print(y % 2);"),
+        ],
+    )
+    error_handler = interpreter_init(interpreter_engine, [template], hash_consing=True)
+    out = capsys.readouterr()
+    assert out.out == "1010110101"
+    assert len(error_handler.errors) == 0
+
+
+@pytest.mark.parametrize(
+    "expression, valid, invalid",
+    [
+        ("y + 1", "1", '"s"'),
+        ("-y", "1", '"s"'),
+        ("y > 1", "1", '"s"'),
+        ("y.get(0)", "Array(1)", '"s"'),
+    ],
+)
+def test_hash_consing_error_position(interpreter_engine, expression, valid, invalid):
+    template = funcion_template(
+        "main",
+        [
+            f"y = {valid};",
+            f"z = {expression};",
+            f"y = {invalid};",
+            f"z = {expression};",
+        ],
+    )
+    expected_errors = interpreter_init(interpreter_engine, [template]).errors
+    errors = interpreter_init(interpreter_engine, [template], hash_consing=True).errors
+    assert len(errors) == len(expected_errors) == 1
+    assert errors[0].position.line == expected_errors[0].position.line == 6
+    assert errors[0].position.column == expected_errors[0].position.column
+
+
+def interpreter_init_lazy(interpreter_engine, body: list[str]):
+    error_handler = ErrorHandler()
+    with io.StringIO(functions_template(body)) as stream_provider:
+        token_buffer = Lexer(stream_provider, error_handler).tokenize_all()
+    parser = Parser(TokenBufferReader(token_buffer, error_handler), lazy_bodies=True)
+    program = parser.parse()
+    interpreter = interpreter_engine(error_handler)
+    interpreter.visit(program)
+    return error_handler, program
+
+
+def test_lazy_bodies_load_only_called_functions(interpreter_engine, capsys):
+    error_handler, program = interpreter_init_lazy(
+        interpreter_engine,
+        [
+            funcion_template("unused", ["x = ;"]),
+            funcion_template("double", ["return a * 2;"], "a"),
+            funcion_template("main", ["print(double(21));"]),
+        ],
+    )
+    assert capsys.readouterr().out == "42"
+    assert len(error_handler.errors) == 0
+    assert list(program.block_loaders) == ["unused"]
+    assert program.functions["unused"].block is None
+
+
+def test_lazy_bodies_report_syntax_errors_on_first_call(interpreter_engine):
+    error_handler, program = interpreter_init_lazy(
+        interpreter_engine,
+        [
+            funcion_template("broken", ["x = ;"]),
+            funcion_template("main", ["broken();"]),
+        ],
+    )
+    assert [type(error) for error in error_handler.errors] == [
+        ParserError,
+        RuntimeError,
+    ]
+    assert program.block_loaders == {}
+
+
 @pytest.mark.parametrize(
     "expression",
     [
@@ -390,7 +504,7 @@ def test_loops(expressions, expected, capsys):
         'throw Error("error")',
     ],
 )
-def test_try_catch_without_params(expression, capsys):
+def test_try_catch_without_params(interpreter_engine, expression, capsys):
     print_func = 'print("error");'
     template = funcion_template(
         "main",
@@ -399,7 +513,7 @@ def test_try_catch_without_params(expression, capsys):
             f"{block_template('catch', print_func)}",
         ],
     )
-    error_handler = interpreter_init([template])
+    error_handler = interpreter_init(interpreter_engine, [template])
     out = capsys.readouterr()
     assert out.out == "error"
     assert len(error_handler.errors) == 0
@@ -580,7 +694,12 @@ def test_try_catch_without_params(expression, capsys):
     ],
 )
 def test_function_call(
-    function_names, function_params, function_bodies, expected, capsys
+    interpreter_engine,
+    function_names,
+    function_params,
+    function_bodies,
+    expected,
+    capsys,
 ):
     templates = [
         funcion_template(
@@ -592,7 +711,7 @@ def test_function_call(
             function_names, function_bodies, function_params
         )
     ]
-    error_handler = interpreter_init(templates)
+    error_handler = interpreter_init(interpreter_engine, templates)
     out = capsys.readouterr()
     assert out.out == expected
     assert len(error_handler.errors) == 0
@@ -711,12 +830,12 @@ def test_function_call(
         ("x = 1 % 0", ValueError),
     ],
 )
-def test_oneliner_errors(expression, expected):
+def test_oneliner_errors(interpreter_engine, expression, expected):
     template = funcion_template(
         "main",
         [f"{expression};"],
     )
-    error_handler = interpreter_init([template])
+    error_handler = interpreter_init(interpreter_engine, [template])
     assert len(error_handler.errors) == 1
     assert isinstance(error_handler.errors[0], expected)
 
@@ -795,7 +914,9 @@ def test_oneliner_errors(expression, expected):
         ),
     ],
 )
-def test_function_call_errors(function_names, function_bodies, function_args, expected):
+def test_function_call_errors(
+    interpreter_engine, function_names, function_bodies, function_args, expected
+):
     templates = [
         funcion_template(
             function_name,
@@ -806,6 +927,206 @@ def test_function_call_errors(function_names, function_bodies, function_args, ex
             function_names, function_bodies, function_args
         )
     ]
-    error_handler = interpreter_init(templates)
+    error_handler = interpreter_init(interpreter_engine, templates)
     assert len(error_handler.errors) == 1
     assert isinstance(error_handler.errors[0], expected)
+
+
+def test_nfkc_equivalent_identifiers_stay_distinct(interpreter_engine, capsys):
+    error_handler = interpreter_init(
+        interpreter_engine,
+        [
+            funcion_template("\ufb01", ["return 1;"]),
+            funcion_template("fi", ["return 2;"]),
+            funcion_template(
+                "main",
+                ["\ufb01 = 1;", "fi = 2;", "print(\ufb01, fi, \ufb01(), fi());"],
+            ),
+        ],
+    )
+    assert capsys.readouterr().out == "1212"
+    assert len(error_handler.errors) == 0
+
+
+def test_disassemble_program():
+    error_handler = ErrorHandler()
+    final_input = functions_template(
+        [
+            funcion_template("double", ["return a * 2;"], "a"),
+            funcion_template("main", ["print(double(21));"]),
+        ]
+    )
+    with io.StringIO(final_input) as stream_provider:
+        program = Parser(Lexer(stream_provider, error_handler)).parse()
+    disassembly = disassemble_program(program)
+    assert "Disassembly of double(a):" in disassembly
+    assert "BINARY_OPERATION" in disassembly
+    assert "(*)" in disassembly
+    assert "CALL_FUNCTION" in disassembly
+    assert "(('double', 1))" in disassembly
+    assert len(error_handler.errors) == 0
+
+
+def test_transpile_program():
+    error_handler = ErrorHandler()
+    final_input = functions_template(
+        [
+            funcion_template("double", ["return a * 2;"], "a"),
+            funcion_template("main", ["print(double(21));"]),
+        ]
+    )
+    with io.StringIO(final_input) as stream_provider:
+        program = Parser(Lexer(stream_provider, error_handler)).parse()
+    source = transpile_program(program)
+    assert "def f_double(self, depth, position, v_a=None):" in source
+    assert "def f_main(self, depth, position):" in source
+    assert "f_double(self, depth + 1" in source
+    assert "arithmetic_error" in source
+    compile(source, "<transpiled>", "exec")
+    assert len(error_handler.errors) == 0
+
+
+def test_tier_up(capsys, caplog):
+    error_handler = ErrorHandler()
+    final_input = functions_template(
+        [
+            funcion_template("double", ["return a * 2;"], "a"),
+            funcion_template("square", ["return a * a;"], "a"),
+            funcion_template(
+                "main",
+                [
+                    "i = 0;",
+                    "while (i < 3) { print(double(i)); i += 1; }",
+                    "print(square(3));",
+                ],
+            ),
+        ]
+    )
+    with io.StringIO(final_input) as stream_provider:
+        program = Parser(Lexer(stream_provider, error_handler)).parse()
+    interpreter = Interpreter(error_handler, tier_up_threshold=2)
+    with caplog.at_level(logging.DEBUG, logger="interpreter.interpreter_class"):
+        interpreter.visit(program)
+    assert capsys.readouterr().out == "0249"
+    assert "Function double promoted to compiled tier" in caplog.text
+    assert "square" not in caplog.text
+    assert interpreter.hotness == {"double": 2, "main": 4, "square": 1}
+    assert len(error_handler.errors) == 0
+
+
+def run_program(source: str, interpreter_class) -> tuple[str, list[tuple], Interpreter]:
+    error_handler = ErrorHandler()
+    with io.StringIO(source) as stream_provider:
+        program = Parser(Lexer(stream_provider, error_handler)).parse()
+    output = io.StringIO()
+    interpreter = interpreter_class(error_handler)
+    with contextlib.redirect_stdout(output):
+        interpreter.visit(program)
+    errors = [
+        (type(error), error.position.line, error.position.column)
+        for error in error_handler.errors
+    ]
+    return output.getvalue(), errors, interpreter
+
+
+@pytest.mark.parametrize("tier_up_threshold", [1, 2])
+@pytest.mark.parametrize(
+    "functions",
+    [
+        [
+            funcion_template("get", ["\ufb01 = 1;", "fi = 2;", "return \ufb01;"]),
+            funcion_template(
+                "main", ["i = 0;", "while (i < 5) { print(get()); i += 1; }"]
+            ),
+        ],
+        [
+            funcion_template("down", ["m = n + 1;", "down(m);"], "n"),
+            funcion_template("main", ["print(down(0));"]),
+        ],
+        [
+            funcion_template(
+                "down",
+                [conditional_template("if", "n == 99", "x = n / 0;"), "m = n + 1;"]
+                + ["down(m);"],
+                "n",
+            ),
+            funcion_template("main", ["print(down(0));"]),
+        ],
+        [
+            funcion_template("down", ["m = n + 1;", "down(m);"], "n"),
+            funcion_template("main", ["down(0);"]),
+        ],
+    ],
+)
+def test_tier_up_matches_tree_walker(functions, tier_up_threshold):
+    source = functions_template(functions)
+    output, errors, _ = run_program(source, Interpreter)
+    tier_up_output, tier_up_errors, interpreter = run_program(
+        source, partial(Interpreter, tier_up_threshold=tier_up_threshold)
+    )
+    assert any(interpreter.compiled_functions.values())
+    assert tier_up_output == output
+    assert tier_up_errors == errors
+
+
+def test_tier_up_refuses_functions_with_failing_call_arguments():
+    source = functions_template(
+        [
+            funcion_template("double", ["return a * 2;"], "a"),
+            funcion_template("twice", ["return double(a - 1);"], "a"),
+            funcion_template(
+                "main", ["print(twice(1));", "print(twice(2));", 'twice("a");']
+            ),
+        ]
+    )
+    output, errors, _ = run_program(source, Interpreter)
+    tier_up_output, tier_up_errors, interpreter = run_program(
+        source, partial(Interpreter, tier_up_threshold=1)
+    )
+    assert interpreter.compiled_functions["main"] is None
+    assert interpreter.compiled_functions["twice"] is None
+    assert interpreter.compiled_functions["double"] is not None
+    assert tier_up_output == output
+    assert tier_up_errors == errors == [(ArgumentError, 2, 5)]
+
+
+def test_tier_up_is_off_by_default():
+    error_handler = ErrorHandler()
+    final_input = functions_template(
+        [
+            funcion_template("double", ["return a * 2;"], "a"),
+            funcion_template(
+                "main", ["i = 0;", "while (i < 2000) { double(i); i += 1; }"]
+            ),
+        ]
+    )
+    with io.StringIO(final_input) as stream_provider:
+        program = Parser(Lexer(stream_provider, error_handler)).parse()
+    interpreter = Interpreter(error_handler)
+    interpreter.visit(program)
+    assert interpreter.compiled_tier is None
+    assert interpreter.hotness == {}
+    assert len(error_handler.errors) == 0
+
+
+def test_transpiled_code_uses_compiled_runtime_interface():
+    error_handler = ErrorHandler()
+    final_input = functions_template(
+        [
+            funcion_template("inc", ["x += 1;"], "x"),
+            funcion_template(
+                "main",
+                [
+                    "x = Array(1, 2); y = 0;",
+                    "for (i : x) { if (i == 1) { continue; } break; }",
+                    "while (y < 3) { inc(@y); if (y == 2) { return; } }",
+                    'try { throw ValueError("v"); } catch (ValueError e) { print(e); }',
+                ],
+            ),
+        ]
+    )
+    with io.StringIO(final_input) as stream_provider:
+        program = Parser(Lexer(stream_provider, error_handler)).parse()
+    attributes = set(re.findall(r"\bself\.(\w+)", transpile_program(program)))
+    assert attributes == set(CompiledRuntime.__slots__)
+    assert len(error_handler.errors) == 0
@@ -1,21 +1,78 @@
+import asyncio
+from array import array
 import io
+import pickle
+import random
 import pytest
+from pathlib import Path
 
+from benchmarks.lexer_benchmark import generate_synthetic_source, source_profiles
 from lexer.token_type_enum import TokenType
 from lexer.config import LEXER_CONFIG
+from lexer.async_lexer_class import AsyncLexer
+from lexer.incremental_lexer_class import IncrementalLexer
 from lexer.lexer_class import Lexer
+from lexer.mmap_stream_class import MmapStream
+from lexer.regex_lexer_class import RegexLexer
+from lexer.token_buffer_class import TokenBuffer
 from lexer.lexer_error_class import LEXER_ERROR_TYPES
 from utils.error_handler_class import ErrorHandler
+from utils.line_index_class import LineIndex
 
 
-def test_init():
+@pytest.fixture(params=[Lexer, RegexLexer])
+def lexer_class(request):
+    return request.param
+
+
+def test_init(lexer_class):
     error_handler = ErrorHandler()
     with io.StringIO("") as stream_provider:
-        lexer = Lexer(stream_provider, error_handler)
+        lexer = lexer_class(stream_provider, error_handler)
     assert lexer.current_position.line == 1
     assert lexer.current_position.column == 1
 
 
+@pytest.mark.parametrize(
+    "offset, line, column",
+    [
+        (0, 1, 1),
+        (3, 1, 4),
+        (4, 2, 1),
+        (5, 3, 1),
+        (9, 3, 5),
+        (10, 4, 1),
+        (25, 4, 16),
+    ],
+)
+def test_line_index_get_position(offset, line, column):
+    position = LineIndex(array("I", [0, 4, 5, 10])).get_position(offset)
+    assert (position.line, position.column) == (line, column)
+
+
+def test_line_index_get_position_without_offset():
+    assert LineIndex().get_position(None) is None
+    assert LineIndex().get_position(0).line == 1
+
+
+@pytest.mark.parametrize(
+    "input, line_starts, line",
+    [
+        ("a\nbc\n\nd", [0, 2, 5, 6], 4),
+        ("a\r\nbc\r\n\r\nd", [0, 3, 7, 9], 4),
+        ("\r\nd\r\n", [0, 2, 5], 2),
+    ],
+)
+def test_line_index_built_by_lexer(input, line_starts, line, lexer_class):
+    with io.StringIO(input, newline="") as stream_provider:
+        lexer = lexer_class(stream_provider, ErrorHandler())
+        while (token := lexer.build_next_token()).type != TokenType.T_EOF:
+            if token.value == "d":
+                position = token.position
+    assert list(lexer.line_index.line_starts) == line_starts
+    assert (position.line, position.column) == (line, 1)
+
+
 @pytest.mark.parametrize(
     "expected_token, input, expected_value",
     [
@@ -86,10 +143,10 @@ def test_init():
         (TokenType.T_COMMENT, "# comment", " comment"),
     ],
 )
-def test_if_valid_tokens(input, expected_token, expected_value):
+def test_if_valid_tokens(input, expected_token, expected_value, lexer_class):
     error_handler = ErrorHandler()
     with io.StringIO(input) as stream_provider:
-        lexer = Lexer(stream_provider, error_handler)
+        lexer = lexer_class(stream_provider, error_handler)
         token = lexer.build_next_token()
     assert token.type == expected_token
     assert token.value == expected_value
@@ -119,10 +176,10 @@ def test_if_valid_tokens(input, expected_token, expected_value):
         (r'"a\1\2\3\4b"', "a1234b"),
     ],
 )
-def test_sting_escape(input, expected_value):
+def test_sting_escape(input, expected_value, lexer_class):
     error_handler = ErrorHandler()
     with io.StringIO(input) as stream_provider:
-        lexer = Lexer(stream_provider, error_handler)
+        lexer = lexer_class(stream_provider, error_handler)
         token = lexer.build_next_token()
     assert token.type == TokenType.T_STRING_LITERAL
     assert token.value == expected_value
@@ -192,10 +249,10 @@ def test_sting_escape(input, expected_value):
         ("\n#test\n#test\n", 4, 1),
     ],
 )
-def test_current_position(input, line, column):
+def test_current_position(input, line, column, lexer_class):
     error_handler = ErrorHandler()
     with io.StringIO(input) as stream_provider:
-        lexer = Lexer(stream_provider, error_handler)
+        lexer = lexer_class(stream_provider, error_handler)
         while token := lexer.build_next_token():
             if token.type == TokenType.T_EOF:
                 break
@@ -271,12 +328,337 @@ def test_current_position(input, line, column):
         ("$", "$", LEXER_ERROR_TYPES.UNKNOWN_TOKEN),
     ],
 )
-def test_error_handling(input, error_value, error_type):
+def test_error_handling(input, error_value, error_type, lexer_class):
     error_handler = ErrorHandler()
     with io.StringIO(input) as stream_provider:
-        lexer = Lexer(stream_provider, error_handler)
+        lexer = lexer_class(stream_provider, error_handler)
         lexer.build_next_token()
     assert error_handler.has_errors()
     for error in error_handler.errors:
         assert error.type.name == error_type.name
         assert error.invalid_value == error_value
+
+
+def lex_stream(
+    stream_provider, lexer_class=Lexer, without_comments=False, **lexer_kwargs
+):
+    error_handler = ErrorHandler()
+    tokens = []
+    lexer = lexer_class(stream_provider, error_handler, **lexer_kwargs)
+    build_next_token = (
+        lexer.build_next_token_without_comments
+        if without_comments
+        else lexer.build_next_token
+    )
+    while (token := build_next_token()).type != TokenType.T_EOF:
+        tokens.append(
+            (token.type, token.value, token.position.line, token.position.column)
+        )
+    return tokens, [str(error) for error in error_handler.errors]
+
+
+def lex_all(input, lexer_class=Lexer, without_comments=False, **lexer_kwargs):
+    with io.StringIO(input) as stream_provider:
+        return lex_stream(
+            stream_provider, lexer_class, without_comments, **lexer_kwargs
+        )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+@pytest.mark.parametrize(
+    "input",
+    [
+        'main() {\n    x = 12.5;\n    print("a\\tb", x);\n}\n',
+        "foo_bar_baz   \t quux # comment\r\nnext_line >= 10",
+        "a" * (LEXER_CONFIG.MAX_IDENTIFIER_LENGTH.value + 5) + " b",
+        "fun(x) {\n  return x * 2;\n}\n\n# trailing comment\nmain() { fun(@y); }",
+    ],
+)
+def test_chunked_reading_matches_default(input, chunk_size, lexer_class):
+    assert lex_all(input, lexer_class, chunk_size=chunk_size) == lex_all(input)
+
+
+@pytest.mark.parametrize("without_comments", [False, True])
+@pytest.mark.parametrize(
+    "input",
+    [
+        'main() {\n    x = 12.5 + 0.25 * 3;\n    print("a\\tb\\"c", x);\n}\n',
+        "# comment\r\nfoo?.bar != 10 # trailing\r\n# last",
+        "x = 0123 + 1.5.2;\n y=10.0;",
+        "1" * 20 + " " + "9" * 10 + "." + "9" * 10,
+        "a" * 120 + "\n" + "żółw_1 = 2;",
+        '"multi\nline" "\\\n" "unterminated',
+        "a\n b\r c\r\n d # x\n\r e",
+        "\t\f\v x \x0b\x1c y\u00a0z $ [ ] ^",
+    ],
+)
+def test_regex_lexer_matches_stream_lexer(input, without_comments):
+    assert lex_all(input, RegexLexer, without_comments) == lex_all(
+        input, Lexer, without_comments
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+@pytest.mark.parametrize(
+    "input",
+    [
+        "",
+        'main() {\r\n    x = 12.5;\r\n    print("zażółć\\tgęślą", x);\r\n}\r\n',
+        "a\n\rb\r\rc\r\n# komentarz ąę\r",
+        "żółw = 1; # ü\n" * 20,
+    ],
+)
+def test_mmap_stream_matches_text_file(input, chunk_size, lexer_class, tmp_path):
+    path = tmp_path / "source.jp"
+    path.write_bytes(input.encode("utf-8"))
+    with open(path, "r", encoding="utf-8") as stream_provider:
+        expected = lex_stream(stream_provider, lexer_class, chunk_size=chunk_size)
+    with MmapStream(path) as stream_provider:
+        assert lex_stream(stream_provider, lexer_class, chunk_size=chunk_size) == (
+            expected
+        )
+
+
+def buffered_tokens(token_buffer):
+    tokens = []
+    for index in range(len(token_buffer) - 1):
+        token = token_buffer.get_token(index)
+        tokens.append(
+            (token.type, token.value, token.position.line, token.position.column)
+        )
+    return tokens
+
+
+@pytest.mark.parametrize(
+    "input",
+    [
+        "",
+        'main() {\n    x = 12.5;\n    print("a\\tb", x);\n}\n',
+        "# comment\r\nfoo?.bar != 10 # trailing\r\n\r\n  # last",
+        "a\n b\r c\r\n d # x\n\r e",
+        "x = 1.;\n$ " + "a" * 60,
+    ],
+)
+def test_tokenize_all_matches_token_stream(input, lexer_class, tmp_path):
+    error_handler = ErrorHandler()
+    with io.StringIO(input) as stream_provider:
+        token_buffer = lexer_class(stream_provider, error_handler).tokenize_all()
+    expected_tokens, expected_errors = lex_all(input, lexer_class, chunk_size=4)
+    assert buffered_tokens(token_buffer) == expected_tokens
+    assert [str(error) for error in error_handler.errors] == expected_errors
+    assert token_buffer.get_token(len(token_buffer) - 1).type == TokenType.T_EOF
+
+    token_buffer.save(tmp_path / "tokens.bin")
+    assert buffered_tokens(TokenBuffer.load(tmp_path / "tokens.bin")) == (
+        expected_tokens
+    )
+
+
+def tokenize_to_file(input: str, path) -> TokenBuffer:
+    with io.StringIO(input) as stream_provider:
+        token_buffer = Lexer(stream_provider, ErrorHandler()).tokenize_all()
+    token_buffer.save(path)
+    return token_buffer
+
+
+def test_token_buffer_load_rejects_every_single_byte_corruption(tmp_path):
+    path = tmp_path / "tokens.bin"
+    token_buffer = tokenize_to_file('main() {\n    x = 1.5; print("a");\n}\n', path)
+    data = path.read_bytes()
+    for index in range(len(data)):
+        path.write_bytes(data[:index] + bytes([data[index] ^ 0xFF]) + data[index + 1 :])
+        try:
+            loaded = TokenBuffer.load(path)
+        except ValueError:
+            continue
+        assert len(loaded) == len(token_buffer)
+
+
+class ExecutedOnUnpickle:
+    def __init__(self, path):
+        self.path = path
+
+    def __reduce__(self):
+        return (Path.touch, (self.path,))
+
+
+def test_token_buffer_load_does_not_unpickle(tmp_path):
+    path = tmp_path / "tokens.bin"
+    marker_path = tmp_path / "executed"
+    path.write_bytes(pickle.dumps(ExecutedOnUnpickle(marker_path)))
+    with pytest.raises(ValueError):
+        TokenBuffer.load(path)
+    assert not marker_path.exists()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 64])
+def test_repeated_names_and_short_strings_are_interned(chunk_size, lexer_class):
+    long_string = "s" * (LEXER_CONFIG.MAX_INTERNED_STRING_LENGTH.value + 1)
+    input = f'x = "ab"; x = "a" + "b"; "{long_string}" "{long_string}"'
+    with io.StringIO(input) as stream_provider:
+        lexer = lexer_class(stream_provider, ErrorHandler(), chunk_size=chunk_size)
+        tokens = lexer.tokenize_all()
+    values = [tokens.get_token(index).value for index in range(len(tokens))]
+    assert values[0] is values[4]
+    assert values[2] is lexer.intern_table.intern("ab")
+    assert values[6] is lexer.intern_table.intern("a")
+    assert values[10] == values[11]
+    assert values[10] is not values[11]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64])
+@pytest.mark.parametrize(
+    "input, expected_value",
+    [
+        ('"' + "abc " * 30 + '"', "abc " * 30),
+        ('"' + 'x\\ty\\\\z\\"' * 10 + '"', 'x\ty\\z"' * 10),
+        ("#" + "comment " * 30 + "\r\nx", "comment " * 30 + "\r"),
+        ('"multi\nline"', "multi\nline"),
+    ],
+)
+def test_long_string_and_comment_bodies(input, expected_value, chunk_size):
+    tokens, errors = lex_all(input, chunk_size=chunk_size)
+    assert tokens[0][1] == expected_value
+    assert errors == []
+
+
+def token_list_view(tokens):
+    return [
+        (token.type, token.value, token.position.line, token.position.column)
+        for token in tokens
+    ]
+
+
+def full_relex(input, lexer_class):
+    error_handler = ErrorHandler()
+    with io.StringIO(input) as stream_provider:
+        lexer = lexer_class(stream_provider, error_handler)
+        token_buffer = lexer.tokenize_all()
+    return token_list_view(
+        token_buffer.get_token(index) for index in range(len(token_buffer))
+    ), [str(error) for error in error_handler.errors]
+
+
+def assert_incremental_relex(incremental_lexer, error_handler, edit, lexer_class):
+    previous_tokens = incremental_lexer.tokens
+    previous_view = token_list_view(previous_tokens)
+    tokens = incremental_lexer.apply_edit(*edit)
+    assert token_list_view(previous_tokens) == previous_view
+    assert (
+        token_list_view(tokens),
+        [str(error) for error in error_handler.errors],
+    ) == full_relex(incremental_lexer.source, lexer_class)
+
+
+@pytest.mark.parametrize(
+    "input, edits",
+    [
+        ("main() {\n    x = 1;\n}\n", [(13, 1, "12"), (9, 1, "yy"), (0, 4, "")]),
+        ("a = 1; b = 2;", [(6, 0, " # note"), (4, 0, '"'), (0, 0, "\r\n")]),
+        ('x = "abc";\ny = 2;', [(6, 0, '"'), (6, 1, ""), (10, 1, "")]),
+        ("a\r\nb\r\nc", [(1, 2, "\n"), (2, 0, "\r"), (0, 0, "z\n")]),
+        ("x = 12.5 >= 3", [(6, 1, ""), (9, 1, "!"), (8, 0, ".")]),
+        ("", [(0, 0, "abc"), (3, 0, " # c\n"), (0, 3, "")]),
+    ],
+)
+def test_incremental_relex_matches_full_relex(input, edits, lexer_class):
+    error_handler = ErrorHandler()
+    incremental_lexer = IncrementalLexer(input, error_handler, lexer_class)
+    for edit in edits:
+        assert_incremental_relex(incremental_lexer, error_handler, edit, lexer_class)
+
+
+def test_incremental_relex_matches_full_relex_on_random_edits(lexer_class):
+    generator = random.Random(2024)
+    fragments = ["x", "1", ".", '"', "\\", "#", " ", "\n", "\r\n", "=", "ż"]
+    source = 'main() {\n    x = 12.5; # c\n    print("a\\tb", x);\n}\n' * 3
+    error_handler = ErrorHandler()
+    incremental_lexer = IncrementalLexer(source, error_handler, lexer_class)
+    for _ in range(200):
+        offset = generator.randint(0, len(incremental_lexer.source))
+        removed_length = generator.randint(
+            0, min(4, len(incremental_lexer.source) - offset)
+        )
+        inserted_text = "".join(
+            generator.choice(fragments) for _ in range(generator.randint(0, 3))
+        )
+        assert_incremental_relex(
+            incremental_lexer,
+            error_handler,
+            (offset, removed_length, inserted_text),
+            lexer_class,
+        )
+
+
+async def feed_reader(reader, data, chunk_size):
+    for start in range(0, len(data), chunk_size):
+        reader.feed_data(data[start : start + chunk_size])
+        await asyncio.sleep(0)
+    reader.feed_eof()
+
+
+async def lex_async(data, lexer_class, chunk_size):
+    reader = asyncio.StreamReader()
+    feeder = asyncio.create_task(feed_reader(reader, data, chunk_size))
+    error_handler = ErrorHandler()
+    tokens = [
+        (token.type, token.value, token.position.line, token.position.column)
+        async for token in AsyncLexer(reader, error_handler, lexer_class)
+    ]
+    await feeder
+    assert tokens.pop()[0] == TokenType.T_EOF
+    return tokens, [str(error) for error in error_handler.errors]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+@pytest.mark.parametrize(
+    "input",
+    [
+        "",
+        'main() {\n    x = 12.5;\n    print("zażółć\\tgęślą", x);\n}\n',
+        "a\r\nb\r\nc # komentarz ąę\r\n" * 50,
+        '"unterminated ż',
+    ],
+)
+def test_async_lexer_matches_text_stream(input, chunk_size, lexer_class):
+    data = input.encode("utf-8")
+    with io.TextIOWrapper(io.BytesIO(data), encoding="utf-8") as stream_provider:
+        expected = lex_stream(stream_provider, lexer_class)
+    assert asyncio.run(lex_async(data, lexer_class, chunk_size)) == expected
+
+
+async def lex_first_async_token(data, lexer_class, built_tokens):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    tokens = AsyncLexer(reader, ErrorHandler(), lexer_class).__aiter__()
+    first_token = await anext(tokens)
+    await asyncio.wait_for(tokens.aclose(), 5)
+    built_after_close = len(built_tokens)
+    await asyncio.sleep(0.01)
+    return first_token.value, built_after_close
+
+
+def test_async_lexer_stops_worker_on_early_exit(lexer_class):
+    built_tokens = []
+
+    class CountingLexer(lexer_class):
+        def build_next_token(self):
+            token = super().build_next_token()
+            built_tokens.append(token)
+            return token
+
+    data = b"x " * 100_000
+    first_token, built_after_close = asyncio.run(
+        lex_first_async_token(data, CountingLexer, built_tokens)
+    )
+    assert first_token == "x"
+    assert built_after_close == len(built_tokens)
+    assert len(built_tokens) < 100_000
+
+
+@pytest.mark.parametrize("profile", source_profiles)
+def test_synthetic_benchmark_sources_lex_without_errors(profile):
+    source = generate_synthetic_source(2000, **source_profiles[profile])
+    tokens, errors = lex_all(source, RegexLexer)
+    assert errors == []
+    assert (tokens, errors) == lex_all(source, Lexer)
@@ -1,11 +1,26 @@
+import asyncio
 import io
+import re
 import pytest
 
+from lexer.async_lexer_class import AsyncLexer
 from lexer.lexer_class import Lexer
+from lexer.token_buffer_class import TokenBufferReader
+from parser import statement_classes
+from parser.flat_ast_class import LIST_KIND, NONE_KIND, FlatAst
+from parser.grammar_compiler_class import (
+    GRAMMAR_PATH,
+    TABLES_PATH,
+    GrammarCompiler,
+    GrammarError,
+)
 from parser.parser_class import Parser
+from parser.rule_profiler_class import RuleProfiler
+from parser.table_parser_class import TableParser
 from parser.statement_classes import *
 from lexer.token_type_enum import TokenType
 from utils.error_handler_class import ErrorHandler
+from tests.helpers import code_examples, user_functions
 from parser.parser_error_class import PARSER_ERROR_TYPES
 
 
@@ -61,6 +76,18 @@ def test_init():
             [Parameter("param", is_optional=True, value=FalseLiteral())],
         ),
         (r"param? = true", [Parameter("param", is_optional=True, value=TrueLiteral())]),
+        (
+            r"param? = other.field",
+            [
+                Parameter(
+                    "param",
+                    is_optional=True,
+                    value=PropertyAccessExpression(
+                        IdentifierExpression("other"), IdentifierExpression("field")
+                    ),
+                )
+            ],
+        ),
         # multiple parameters
         (r"param1, param2", [Parameter("param1"), Parameter("param2")]),
         (
@@ -977,3 +1004,333 @@ def test_access_operator(input, expected_result):
     assert not error_handler.has_errors()
     statement_class = program.functions["main"].block.statements[0]
     assert statement_class == expected_result
+
+
+def parse_source(input, parser_class=Parser, token_buffer=False, **parser_options):
+    error_handler = ErrorHandler()
+    with io.StringIO(input) as stream_provider:
+        lexer = Lexer(stream_provider, error_handler)
+        if token_buffer:
+            lexer = TokenBufferReader(lexer.tokenize_all(), error_handler)
+        program = parser_class(lexer, **parser_options).parse()
+    return program, error_handler.errors
+
+
+def error_messages(errors):
+    return [str(error) for error in errors]
+
+
+@pytest.mark.parametrize(
+    "input",
+    code_examples
+    + [
+        "main() { x = ; }",
+        "f(a, b? = 1) { return a + b; } # comment\nmain() { f(@x, 2) }",
+    ],
+)
+def test_parse_from_token_buffer(input):
+    expected_program, expected_errors = parse_source(input)
+    program, errors = parse_source(input, token_buffer=True)
+    assert user_functions(program) == user_functions(expected_program)
+    assert error_messages(errors) == error_messages(expected_errors)
+
+
+async def parse_async(input):
+    reader = asyncio.StreamReader()
+    reader.feed_data(input.encode("utf-8"))
+    reader.feed_eof()
+    error_handler = ErrorHandler()
+    program = await Parser.parse_async(AsyncLexer(reader, error_handler))
+    return program, error_handler.errors
+
+
+@pytest.mark.parametrize(
+    "input",
+    code_examples + ["main() { x = ; }"],
+)
+def test_parse_async_matches_parse(input):
+    expected_program, expected_errors = parse_source(input)
+    program, errors = asyncio.run(parse_async(input))
+    assert user_functions(program) == user_functions(expected_program)
+    assert error_messages(errors) == error_messages(expected_errors)
+
+
+@pytest.mark.parametrize(
+    "node_class",
+    [
+        value
+        for value in vars(statement_classes).values()
+        if isinstance(value, type) and value.__module__ == statement_classes.__name__
+    ],
+)
+def test_ast_node_classes_have_no_instance_dict(node_class):
+    assert node_class.__dictoffset__ == 0
+
+
+def dump_node(value):
+    if isinstance(value, list):
+        return [dump_node(item) for item in value]
+    if type(value).__module__ != statement_classes.__name__:
+        return value
+    return (
+        type(value).__name__,
+        {
+            field: dump_node(getattr(value, field))
+            for cls in type(value).__mro__
+            for field in getattr(cls, "__slots__", ())
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "input",
+    code_examples
+    + ["main() { x = ; }", "f(a, b? = 1, c? = null) { return -a * (b + 1.5); }"],
+)
+def test_flat_ast_round_trip(input):
+    program, _ = parse_source(input)
+    flat_ast = FlatAst.from_program(program)
+    rebuilt_program = flat_ast.to_program()
+    assert rebuilt_program.line_index is program.line_index
+    assert dump_node(list(user_functions(rebuilt_program).values())) == dump_node(
+        list(user_functions(program).values())
+    )
+
+
+def test_flat_ast_walk_without_building_nodes():
+    program, _ = parse_source("main() { x = a + 2; print(x, @y); }")
+    flat_ast = FlatAst.from_program(program)
+    kinds = []
+    stack = [0]
+    while stack:
+        index = stack.pop()
+        kinds.append(flat_ast.get_node_class(index) or flat_ast.get_kind(index))
+        stack.extend(reversed(list(flat_ast.get_children(index))))
+    assert len(kinds) == len(flat_ast)
+    assert kinds[:6] == [
+        LIST_KIND,
+        FunctionDef,
+        LIST_KIND,
+        BlockStatement,
+        LIST_KIND,
+        AssignmentStatement,
+    ]
+    assert kinds.count(IdentifierExpression) == 4
+    assert NONE_KIND not in kinds
+    assert flat_ast.get_constants(1) == ("main",)
+
+
+@pytest.mark.parametrize(
+    "input",
+    code_examples
+    + ["main() { x = ; }", "f(a, b? = 1, c? = 1) { return -a * (b + 1.5); }"],
+)
+def test_hash_consing_matches_parse(input):
+    expected_program, expected_errors = parse_source(input)
+    program, errors = parse_source(input, hash_consing=True)
+    assert user_functions(program) == user_functions(expected_program)
+    assert error_messages(errors) == error_messages(expected_errors)
+
+
+def test_hash_consing_shares_identical_subtrees():
+    input = (
+        "main() { x = a == 1; y = a == 1; z = -(a + 1); w = -(a + 1); "
+        "f(1).a = f(1).a; }"
+    )
+    program, _ = parse_source(input, hash_consing=True)
+    statements = program.functions["main"].block.statements
+    first, second, third, fourth, fifth = statements
+    assert first.expression is second.expression
+    assert first.expression.left is third.expression.expression.left
+    assert first.expression.right is third.expression.expression.right
+    assert third.expression is not fourth.expression
+    assert third.expression.expression is not fourth.expression.expression
+    assert fifth.variable is not fifth.expression
+    assert fifth.variable.right is not fifth.expression.right
+    assert fifth.variable.right is not first.expression.left
+
+
+def test_hash_consing_disabled_keeps_nodes_distinct():
+    program, _ = parse_source("main() { x = a + 1; y = a + 1; }")
+    first, second = program.functions["main"].block.statements
+    assert first.expression == second.expression
+    assert first.expression is not second.expression
+
+
+def test_rule_profiler_counts_rules_without_changing_parse():
+    input = "main() { x = a + f(1, @b).c; if (x) { y = -1; } else { return; } }"
+    expected_program, expected_errors = parse_source(input)
+    rule_profiler = RuleProfiler()
+    program, errors = parse_source(input, rule_profiler=rule_profiler)
+    assert user_functions(program) == user_functions(expected_program)
+    assert error_messages(errors) == error_messages(expected_errors)
+    stats = {rule: calls for rule, calls, _ in rule_profiler.get_rule_stats()}
+    assert stats["parse_func_def"] == 2
+    assert stats["parse_if_statement"] == 1
+    assert stats["parse_block_statement"] == 1
+    assert stats["start_function_call"] == 1
+    assert stats["parse_return_statement"] == 1
+    assert all(elapsed >= 0 for _, _, elapsed in rule_profiler.get_rule_stats())
+
+
+def test_grammar_tables_are_up_to_date():
+    grammar_compiler = GrammarCompiler(GRAMMAR_PATH.read_text(encoding="utf-8"))
+    grammar_compiler.compile()
+    assert grammar_compiler.generate_tables_source() == TABLES_PATH.read_text(
+        encoding="utf-8"
+    )
+
+
+@pytest.mark.parametrize(
+    "grammar, message",
+    [
+        (
+            "program = {statement}; statement = 'return', ';' | 'return', '=';",
+            "LL(1) conflict in statement on T_RETURN",
+        ),
+        ("program = {statement};", "Undefined rule statement in program"),
+        ("program = '$';", "Unknown terminal '$' in program"),
+        ("main = identifier;", "Missing start rule program"),
+    ],
+)
+def test_grammar_compiler_errors(grammar, message):
+    with pytest.raises(GrammarError, match=re.escape(message)):
+        GrammarCompiler(grammar).compile()
+
+
+def get_function_layout(program):
+    flat_ast = FlatAst()
+    flat_ast.add_tree(list(user_functions(program).values()))
+    return list(flat_ast.kinds), list(flat_ast.offsets)
+
+
+@pytest.mark.parametrize(
+    "input",
+    code_examples
+    + [
+        "f(a, b? = 1, c? = x.y) { return -a * (b + 1.5) is int; }",
+        "main() { for (item : x.items) { if (!item) { break; } elif (1) {} } }",
+        "main() { try { throw f(@a, 2); } catch (Error e) { x += e?.message; } }",
+        "main() { while (a | b & c != 2) { return; } }",
+    ],
+)
+def test_table_parser_matches_parse(input):
+    expected_program, expected_errors = parse_source(input)
+    program, errors = parse_source(input, TableParser)
+    assert expected_errors == errors == []
+    assert user_functions(program) == user_functions(expected_program)
+    assert get_function_layout(program) == get_function_layout(expected_program)
+
+
+@pytest.mark.parametrize(
+    "input",
+    [
+        "main() { x = 1 }",
+        "main() { try {} }",
+        "main() {",
+        "main() { f(1, ); }",
+        "main() { if x) {} }",
+        "main(a, a) {} main() {}",
+    ],
+)
+def test_table_parser_reports_first_syntax_error(input):
+    _, expected_errors = parse_source(input)
+    _, errors = parse_source(input, TableParser)
+    assert errors
+    assert error_messages(errors) == error_messages(expected_errors)[: len(errors)]
+
+
+@pytest.mark.parametrize(
+    "input",
+    code_examples
+    + [
+        "f(a, b? = 1) { if (a) { return; } } # comment\nmain() { f(@x, 2); }",
+        "main() { x = ; } f() { { } }",
+        "f() {} f() { x = 1; }",
+    ],
+)
+def test_lazy_bodies_match_parse(input):
+    expected_program, expected_errors = parse_source(input)
+    program, errors = parse_source(input, token_buffer=True, lazy_bodies=True)
+    assert all(function.block is None for function in user_functions(program).values())
+    program.load_function_blocks()
+    assert program.block_loaders == {}
+    assert user_functions(program) == user_functions(expected_program)
+    assert error_messages(errors) == error_messages(expected_errors)
+
+
+@pytest.mark.parametrize(
+    "input",
+    ["main() { x = 1; ", "main(a, a) { x = 1; }", "main() x = 1; }"],
+)
+def test_lazy_bodies_report_errors_outside_bodies_during_parse(input):
+    expected_program, expected_errors = parse_source(input)
+    program, errors = parse_source(input, token_buffer=True, lazy_bodies=True)
+    program.load_function_blocks()
+    assert user_functions(program) == user_functions(expected_program)
+    assert error_messages(errors) == error_messages(expected_errors)
+
+
+NESTING_DEPTH = 5000
+
+
+def test_deeply_nested_brackets():
+    input = "main() { x = " + "(" * NESTING_DEPTH + "1" + ")" * NESTING_DEPTH + "; }"
+    program, errors = parse_source(input)
+    assert errors == []
+    assert program.functions["main"].block.statements == [
+        AssignmentStatement(IdentifierExpression("x"), IntegerLiteral(1))
+    ]
+
+
+def test_deeply_nested_negations_and_calls():
+    input = "main() { x = " + "-f(" * NESTING_DEPTH + "1" + ")" * NESTING_DEPTH + "; }"
+    program, errors = parse_source(input)
+    assert errors == []
+    expression = program.functions["main"].block.statements[0].expression
+    for _ in range(NESTING_DEPTH):
+        assert isinstance(expression, NumericNegationExpression)
+        assert isinstance(expression.expression, FunctionCallExpression)
+        (argument,) = expression.expression.arguments
+        expression = argument.value
+    assert expression == IntegerLiteral(1)
+
+
+def test_long_binary_chain_with_negations():
+    input = "main() { x = 1" + " - -1" * NESTING_DEPTH + "; }"
+    program, errors = parse_source(input)
+    assert errors == []
+    expression = program.functions["main"].block.statements[0].expression
+    for _ in range(NESTING_DEPTH):
+        assert isinstance(expression, SubtractExpression)
+        assert expression.left == IntegerLiteral(1)
+        assert isinstance(expression.right, NumericNegationExpression)
+        expression = expression.right.expression
+    assert expression == IntegerLiteral(1)
+
+
+def test_long_else_if_chain():
+    input = (
+        "main() { "
+        + "if (x) { y = 1; } else { " * NESTING_DEPTH
+        + "y = 2;"
+        + " }" * NESTING_DEPTH
+        + " }"
+    )
+    program, errors = parse_source(input)
+    assert errors == []
+    block = program.functions["main"].block
+    for _ in range(NESTING_DEPTH):
+        (statement,) = block.statements
+        assert isinstance(statement, IfStatement)
+        assert statement.condition == IdentifierExpression("x")
+        block = statement.else_statement
+    assert block.statements == [
+        AssignmentStatement(IdentifierExpression("y"), IntegerLiteral(2))
+    ]
+
+
+def test_deeply_nested_loops_with_missing_blocks():
+    input = "main() { " + "while (x) { try " * NESTING_DEPTH + " }" * NESTING_DEPTH
+    _, errors = parse_source(input)
+    assert len(errors) == 2 * NESTING_DEPTH + 1
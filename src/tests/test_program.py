@@ -0,0 +1,132 @@
+import pickle
+import pytest
+from pathlib import Path
+
+from lexer.lexer_class import Lexer
+from parser.parser_class import Parser
+from program.program_cache_class import CACHE_DIRECTORY, ProgramCache
+from utils.error_handler_class import ErrorHandler
+from tests.helpers import code_example_paths, user_functions
+
+SOURCE = "f(a, b? = x.y) { return a + b; } # comment\nmain() { print(f(1, 2)); }"
+
+
+def parse_file(path):
+    with open(path, "r", encoding="utf-8") as stream_provider:
+        return Parser(Lexer(stream_provider, ErrorHandler())).parse()
+
+
+@pytest.fixture
+def source_path(tmp_path):
+    path = tmp_path / "program.jp"
+    path.write_text(SOURCE)
+    return path
+
+
+def test_cache_miss_returns_none(source_path):
+    assert ProgramCache(source_path).load() is None
+
+
+@pytest.mark.parametrize(
+    "path",
+    code_example_paths,
+)
+def test_cache_round_trip(path, tmp_path):
+    source_path = tmp_path / path.name
+    source_path.write_bytes(path.read_bytes())
+    program = parse_file(source_path)
+    ProgramCache(source_path).save(program)
+    assert (tmp_path / CACHE_DIRECTORY / f"{path.name}.jpc").exists()
+    cached_program = ProgramCache(source_path).load()
+    assert user_functions(cached_program) == user_functions(program)
+    assert cached_program.line_index.line_starts == program.line_index.line_starts
+    assert cached_program.functions.keys() == program.functions.keys()
+
+
+def test_cache_lazy_bodies_build_blocks_on_demand(source_path):
+    program = parse_file(source_path)
+    ProgramCache(source_path).save(program)
+    cached_program = ProgramCache(source_path).load(lazy_bodies=True)
+    assert list(cached_program.block_loaders) == ["f", "main"]
+    assert cached_program.functions["f"].block is None
+    assert cached_program.functions["f"].parameters == program.functions["f"].parameters
+    cached_program.load_function_blocks()
+    assert user_functions(cached_program) == user_functions(program)
+
+
+def test_cache_entry_is_stale_after_source_change(source_path):
+    ProgramCache(source_path).save(parse_file(source_path))
+    source_path.write_text(SOURCE.replace("a + b", "a - b"))
+    assert ProgramCache(source_path).load() is None
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: b"",
+        lambda data: data[:-10],
+        lambda data: data[: len(data) // 2] + b"\xff" * 16,
+        lambda data: b"garbage",
+    ],
+)
+def test_cache_corrupted_entry_falls_back(source_path, corrupt):
+    program_cache = ProgramCache(source_path)
+    program_cache.save(parse_file(source_path))
+    program_cache.cache_path.write_bytes(corrupt(program_cache.cache_path.read_bytes()))
+    assert ProgramCache(source_path).load() is None
+
+
+def test_cache_survives_every_single_byte_corruption(source_path):
+    program_cache = ProgramCache(source_path)
+    program_cache.save(parse_file(source_path))
+    data = program_cache.cache_path.read_bytes()
+    for index in range(len(program_cache.header), len(data)):
+        program_cache.cache_path.write_bytes(
+            data[:index] + bytes([data[index] ^ 0xFF]) + data[index + 1 :]
+        )
+        program = program_cache.load()
+        assert program is None or "main" in program.functions
+
+
+class ExecutedOnUnpickle:
+    def __init__(self, path):
+        self.path = path
+
+    def __reduce__(self):
+        return (Path.touch, (self.path,))
+
+
+def test_cache_does_not_unpickle_entries(source_path, tmp_path):
+    program_cache = ProgramCache(source_path)
+    marker_path = tmp_path / "executed"
+    program_cache.cache_path.parent.mkdir()
+    program_cache.cache_path.write_bytes(
+        program_cache.header + pickle.dumps(ExecutedOnUnpickle(marker_path))
+    )
+    assert program_cache.load() is None
+    assert not marker_path.exists()
+
+
+def test_cache_skips_lazily_parsed_program(source_path):
+    program = parse_file(source_path)
+    program.block_loaders["f"] = lambda: program.functions["f"].block
+    program_cache = ProgramCache(source_path)
+    program_cache.save(program)
+    assert not program_cache.cache_path.exists()
+
+
+def test_cache_keeps_offsets_beyond_32_bits(source_path):
+    program = parse_file(source_path)
+    program.functions["main"].block.offset = 2**40
+    ProgramCache(source_path).save(program)
+    cached_program = ProgramCache(source_path).load()
+    assert cached_program.functions["main"].block.offset == 2**40
+
+
+def test_cache_skips_program_with_unrepresentable_offset(source_path):
+    program = parse_file(source_path)
+    program.functions["main"].block.offset = 2**64
+    program_cache = ProgramCache(source_path)
+    program_cache.save(program)
+    assert not program_cache.cache_path.exists()
+    assert not list(program_cache.cache_path.parent.iterdir())
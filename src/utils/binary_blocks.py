@@ -0,0 +1,19 @@
+from io import SEEK_END
+from typing import BinaryIO
+
+
+def write_block(file: BinaryIO, data: bytes) -> None:
+    file.write(len(data).to_bytes(8, "little"))
+    file.write(data)
+
+
+def read_exactly(file: BinaryIO, size: int) -> bytes:
+    position = file.tell()
+    if size > file.seek(0, SEEK_END) - position:
+        raise ValueError("Binary data is truncated")
+    file.seek(position)
+    return file.read(size)
+
+
+def read_block(file: BinaryIO) -> bytes:
+    return read_exactly(file, int.from_bytes(read_exactly(file, 8), "little"))
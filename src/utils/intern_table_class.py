@@ -0,0 +1,14 @@
+import sys
+
+
+class InternTable:
+    def __init__(self) -> None:
+        self.strings: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def intern(self, value: str) -> str:
+        if (interned := self.strings.get(value)) is None:
+            interned = self.strings[value] = sys.intern(value)
+        return interned
@@ -0,0 +1,23 @@
+from array import array
+from bisect import bisect_right
+
+from utils.position_class import Position
+
+
+class LineIndex:
+    def __init__(self, line_starts: array | None = None):
+        self.line_starts: array = (
+            line_starts if line_starts is not None else array("I", [0])
+        )
+
+    def __len__(self) -> int:
+        return len(self.line_starts)
+
+    def add_line_start(self, offset: int) -> None:
+        self.line_starts.append(offset)
+
+    def get_position(self, offset: int | None) -> Position | None:
+        if offset is None:
+            return None
+        line = bisect_right(self.line_starts, offset)
+        return Position(line, offset - self.line_starts[line - 1] + 1)